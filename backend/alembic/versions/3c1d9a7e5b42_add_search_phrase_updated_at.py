@@ -0,0 +1,27 @@
+"""Add search_phrase_updated_at to Employee
+
+Revision ID: 3c1d9a7e5b42
+Revises: f6ea82b92e07
+Create Date: 2026-10-19 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d9a7e5b42'
+down_revision: Union[str, None] = 'f6ea82b92e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL marks every existing phrase as stale so the worker regenerates it once
+    op.add_column('employees', sa.Column('search_phrase_updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('employees', 'search_phrase_updated_at')
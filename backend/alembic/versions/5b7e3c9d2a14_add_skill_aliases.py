@@ -0,0 +1,84 @@
+"""Add skill_aliases table
+
+Revision ID: 5b7e3c9d2a14
+Revises: 8e4b2f6a1d90
+Create Date: 2026-10-19 16:05:12.518203
+
+"""
+from typing import Sequence, Union
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e3c9d2a14'
+down_revision: Union[str, None] = '8e4b2f6a1d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of app.services.skill_aliases.DEFAULT_ALIASES at the time of this revision
+DEFAULT_ALIASES = [
+    ('postgres', 'PostgreSQL'),
+    ('postgre', 'PostgreSQL'),
+    ('psql', 'PostgreSQL'),
+    ('k8s', 'Kubernetes'),
+    ('kube', 'Kubernetes'),
+    ('reactjs', 'React'),
+    ('react.js', 'React'),
+    ('react js', 'React'),
+    ('nodejs', 'Node.js'),
+    ('node js', 'Node.js'),
+    ('vuejs', 'Vue.js'),
+    ('vue', 'Vue.js'),
+    ('angularjs', 'Angular'),
+    ('angular.js', 'Angular'),
+    ('js', 'JavaScript'),
+    ('ecmascript', 'JavaScript'),
+    ('ts', 'TypeScript'),
+    ('golang', 'Go'),
+    ('springboot', 'Spring Boot'),
+    ('spring-boot', 'Spring Boot'),
+    ('dotnet', '.NET'),
+    ('.net core', '.NET'),
+    ('asp.net', '.NET'),
+    ('c sharp', 'C#'),
+    ('csharp', 'C#'),
+    ('cpp', 'C++'),
+    ('amazon web services', 'AWS'),
+    ('google cloud', 'GCP'),
+    ('google cloud platform', 'GCP'),
+    ('microsoft azure', 'Azure'),
+    ('mongo', 'MongoDB'),
+    ('ml', 'Machine Learning'),
+    ('powerbi', 'Power BI'),
+    ('rails', 'Ruby on Rails'),
+    ('ror', 'Ruby on Rails'),
+    ('pyspark', 'Spark'),
+    ('apache spark', 'Spark'),
+    ('apache kafka', 'Kafka'),
+    ('apache airflow', 'Airflow'),
+]
+
+
+def upgrade() -> None:
+    skill_aliases = op.create_table(
+        'skill_aliases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('alias', sa.String(length=100), nullable=False),
+        sa.Column('canonical', sa.String(length=100), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias'),
+    )
+    op.create_index(op.f('ix_skill_aliases_id'), 'skill_aliases', ['id'], unique=False)
+    now = datetime.utcnow()
+    op.bulk_insert(skill_aliases, [
+        {'alias': alias, 'canonical': canonical, 'updated_at': now} for alias, canonical in DEFAULT_ALIASES
+    ])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_skill_aliases_id'), table_name='skill_aliases')
+    op.drop_table('skill_aliases')
@@ -0,0 +1,37 @@
+"""Add indexes for search filters, recent list and worker scan
+
+Revision ID: 8e4b2f6a1d90
+Revises: 3c1d9a7e5b42
+Create Date: 2026-10-19 14:05:12.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2f6a1d90'
+down_revision: Union[str, None] = '3c1d9a7e5b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Equality column first, then the two range filters of /employees/search
+    op.create_index('ix_employees_status_bandwidth_experience', 'employees',
+                    ['status', 'bandwidth', 'experience_years'], unique=False)
+    op.create_index('ix_employees_created_at', 'employees', ['created_at'], unique=False)
+    op.create_index('ix_employees_last_updated_id', 'employees', ['last_updated', 'id'], unique=False)
+    # Relationship loads (selectinload) and the replace-on-update deletes filter on employee_id
+    op.create_index(op.f('ix_work_history_employee_id'), 'work_history', ['employee_id'], unique=False)
+    op.create_index(op.f('ix_education_employee_id'), 'education', ['employee_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_education_employee_id'), table_name='education')
+    op.drop_index(op.f('ix_work_history_employee_id'), table_name='work_history')
+    op.drop_index('ix_employees_last_updated_id', table_name='employees')
+    op.drop_index('ix_employees_created_at', table_name='employees')
+    op.drop_index('ix_employees_status_bandwidth_experience', table_name='employees')
@@ -0,0 +1,45 @@
+"""Add employee_changes outbox and change_consumer_offsets
+
+Revision ID: 9a41c7d3e8f2
+Revises: 5b7e3c9d2a14
+Create Date: 2026-10-19 18:20:41.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a41c7d3e8f2'
+down_revision: Union[str, None] = '5b7e3c9d2a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'employee_changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('op', sa.String(length=10), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        # Offsets must never be reused once old rows are pruned
+        sqlite_autoincrement=True,
+    )
+    op.create_index('ix_employee_changes_created_at', 'employee_changes', ['created_at'], unique=False)
+    op.create_table(
+        'change_consumer_offsets',
+        sa.Column('consumer', sa.String(length=100), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('consumer'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('change_consumer_offsets')
+    op.drop_index('ix_employee_changes_created_at', table_name='employee_changes')
+    op.drop_table('employee_changes')
@@ -0,0 +1,33 @@
+"""Add search_phrase_generated to Employee
+
+Revision ID: c7e2a5f1b3d8
+Revises: 9a41c7d3e8f2
+Create Date: 2026-10-19 21:04:12.518336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a5f1b3d8'
+down_revision: Union[str, None] = '9a41c7d3e8f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('employees', sa.Column('search_phrase_generated', sa.Boolean(), nullable=True,
+                                         server_default=sa.false()))
+    # Only the search phrase worker ever set search_phrase_updated_at; every other phrase was
+    # typed or LLM-generated on save and is kept as is
+    employees = sa.table('employees', sa.column('search_phrase_generated', sa.Boolean()),
+                         sa.column('search_phrase_updated_at', sa.DateTime()))
+    op.execute(employees.update().where(employees.c.search_phrase_updated_at.isnot(None))
+               .values(search_phrase_generated=True))
+
+
+def downgrade() -> None:
+    op.drop_column('employees', 'search_phrase_generated')
@@ -1,15 +1,20 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..database import get_db
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
 from ..models.employee import Employee, EmployeeStatus
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 @router.get("/metrics")
-def get_metrics(db: Session = Depends(get_db)):
-    total_employees = db.query(Employee).count()
-    on_bench = db.query(Employee).filter(Employee.status == EmployeeStatus.ON_BENCH).count()
-    on_client = db.query(Employee).filter(Employee.status == EmployeeStatus.ON_CLIENT).count()
+async def get_metrics(db: AsyncSession = Depends(get_async_db)):
+    # One aggregate query instead of three COUNTs
+    result = await db.execute(select(
+        func.count(Employee.id),
+        func.coalesce(func.sum(case((Employee.status == EmployeeStatus.ON_BENCH, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Employee.status == EmployeeStatus.ON_CLIENT, 1), else_=0)), 0),
+    ))
+    total_employees, on_bench, on_client = result.one()
     
     return {
         "total_employees": total_employees,
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile
 import json
 import io
+import logging
 import pypdf
 import docx
 from datetime import datetime
-from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Union
+from ..database import get_db, get_read_db, get_async_db, ReadSessionLocal, stick_to_primary
 from ..models import employee as models
 from ..models import work_history as history_models
 from ..models import education as edu_models
@@ -14,11 +18,20 @@ from ..schemas import employee as schemas
 from .auth_utils import get_current_user
 from ..models.user import User, UserRole
 from ..services.llm_service import LLMService
+from ..services import jd_parser, embedding_index, ranking, timing, skill_aliases, filter_index, suggest_index
+from ..services import trigram_index, employee_indexes, outbox, search_cache, candidates, parallel_scoring
+from ..services.search_phrase_worker import worker as search_phrase_worker
 
 router = APIRouter(prefix="/employees", tags=["employees"])
+logger = logging.getLogger(__name__)
+
+# Relationships EmployeeResponse serializes; async sessions cannot lazy-load them
+_RESPONSE_LOADS = (selectinload(models.Employee.work_history), selectinload(models.Employee.education))
+# Above this many ranked ids, _materialize reloads the whole filtered set instead of an IN (...) list
+_MATERIALIZE_ID_LIMIT = 1000
 
 @router.get("/me", response_model=schemas.EmployeeResponse)
-def get_my_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_my_profile(current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)):
     db_employee = db.query(models.Employee).filter(models.Employee.email == current_user.email).first()
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee profile not found")
@@ -64,8 +77,15 @@ def update_employee_record(db_employee, employee_update, db):
     print(f"DEBUG: Updating employee record for ID: {db_employee.emp_id}")
     # Update flat fields (exclude relational and JSON-array fields)
     update_data = employee_update.model_dump(exclude={"work_history", "education", "clients"})
+    old_tech = {t.get("tech", "").lower() for t in db_employee.tech or []}
+    old_phrase = db_employee.search_phrase
+    # Store skills under their canonical names ("k8s" -> "Kubernetes")
+    update_data["tech"] = skill_aliases.refresh(db).canonicalize_tech(update_data.get("tech"))
     for key, value in update_data.items():
         setattr(db_employee, key, value)
+    # A phrase changed by the client is theirs; the worker only rewrites phrases it generated
+    if db_employee.search_phrase != old_phrase:
+        db_employee.search_phrase_generated = False
     
     # Update clients (JSON column)
     db_employee.clients = [c.model_dump() for c in employee_update.clients]
@@ -81,12 +101,23 @@ def update_employee_record(db_employee, employee_update, db):
         db_employee.education.append(edu_models.Education(**edu.model_dump()))
         
     db_employee.last_updated = datetime.now()
+    outbox.record(db, db_employee.id, outbox.UPDATE)
     db.commit()
     db.refresh(db_employee)
+    # Replicas may lag; this client's next reads must see the update
+    stick_to_primary(db)
+    employee_indexes.upsert(db_employee)
+
+    # New skill names must become visible to the local JD parser
+    if {t.get("tech", "").lower() for t in db_employee.tech or []} - old_tech:
+        jd_parser.invalidate_skill_dictionary()
+    if embedding_index.SEMANTIC_SEARCH_ENABLED:
+        embedding_index.update_employee_embedding(db, db_employee)
+    search_phrase_worker.notify()
     return db_employee
 
 @router.post("/generate-summary")
-def generate_summary(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def generate_summary(current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)):
     db_employee = db.query(models.Employee).filter(models.Employee.email == current_user.email).first()
     if not db_employee:
         raise HTTPException(status_code=404, detail="Employee profile not found")
@@ -102,7 +133,7 @@ def generate_summary(current_user: User = Depends(get_current_user), db: Session
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/generate-search-phrase")
-def generate_search_phrase(profile_data: dict, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def generate_search_phrase(profile_data: dict, current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)):
     llm_service = LLMService(db)
     try:
         phrase = llm_service.generate_search_phrase(profile_data)
@@ -113,6 +144,7 @@ def generate_search_phrase(profile_data: dict, current_user: User = Depends(get_
 @router.post("/", response_model=schemas.EmployeeResponse)
 def create_employee(employee: schemas.EmployeeCreate, db: Session = Depends(get_db)):
     db_employee = models.Employee(**employee.dict(exclude={"work_history", "education", "clients"}))
+    db_employee.tech = skill_aliases.refresh(db).canonicalize_tech(db_employee.tech)
     
     for hist in employee.work_history:
         db_employee.work_history.append(models.WorkHistory(**hist.dict()))
@@ -125,16 +157,25 @@ def create_employee(employee: schemas.EmployeeCreate, db: Session = Depends(get_
         db_employee.clients = [c.dict() for c in employee.clients]
 
     db.add(db_employee)
+    db.flush()
+    outbox.record(db, db_employee.id, outbox.INSERT)
     db.commit()
     db.refresh(db_employee)
+    stick_to_primary(db)
+    employee_indexes.upsert(db_employee)
+    if db_employee.tech:
+        jd_parser.invalidate_skill_dictionary()
+    if embedding_index.SEMANTIC_SEARCH_ENABLED:
+        embedding_index.update_employee_embedding(db, db_employee)
+    search_phrase_worker.notify()
     return db_employee
 
 @router.get("/", response_model=List[schemas.EmployeeResponse])
-def read_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def read_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     return db.query(models.Employee).offset(skip).limit(limit).all()
 
-@router.get("/search", response_model=List[schemas.EmployeeResponse])
-def search_employees(
+@router.get("/search", response_model=Union[List[schemas.EmployeeResponse], schemas.EmployeeSearchResponse])
+async def search_employees(
     query: str = Query(None), 
     name: str = Query(None),
     tech: str = Query(None),
@@ -142,27 +183,181 @@ def search_employees(
     bandwidth: str = Query(None),
     experience: str = Query(None),
     jd: str = Query(None),  # Job Description for matching
-    db: Session = Depends(get_db),
+    mode: str = Query(None),  # "semantic": embedding similarity only; "hybrid": fused ranking
+    fusion: str = Query("rrf"),  # hybrid: "rrf" or "weighted"
+    w_keyword: float = Query(None),  # hybrid: per-request weight overrides
+    w_skill: float = Query(None),
+    w_semantic: float = Query(None),
+    # Hybrid: one page of the fused ranking (HYBRID_PAGE_SIZE rows unless limit is given). Filter-only:
+    # paged by id only when skip/limit are passed; other searches return every match
+    skip: int = Query(0),
+    limit: int = Query(None),
+    facets: bool = Query(False),  # wrap the results with the total and facet counts of the whole result set
+    fuzzy: bool = Query(False),  # typo-tolerant query matching (trigram similarity) instead of ilike
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
+    filters = {"name": name, "tech": tech, "status": status, "bandwidth": bandwidth, "experience": experience}
+    weights = {"keyword": w_keyword, "skill": w_skill, "semantic": w_semantic}
+    if not search_cache.SEARCH_CACHE_ENABLED:
+        return await _search(db, current_user, query, jd, mode, fusion, weights, skip, limit, filters, facets, fuzzy)
+
+    # Repeated searches reuse the ranked ids; only the rows are loaded again
+    cache = search_cache.cache
+    await cache.sync_version(db)
+    version = cache.version
+    key = search_cache.cache_key(current_user, query=query, jd=jd, mode=mode, fusion=fusion, weights=weights,
+                                 skip=skip, limit=limit, facets=facets, fuzzy=fuzzy, **filters)
+    cached = cache.get(key)
+    if cached is not None:
+        with timing.span("search.cache_hit"):
+            return await _cached_response(db, cached, facets)
+    response = await _search(db, current_user, query, jd, mode, fusion, weights, skip, limit, filters, facets, fuzzy)
+    cache.put(key, _cache_entry(response), version)
+    return response
+
+async def _search(db, current_user, query, jd, mode, fusion, weights, skip, limit, filters, facets, fuzzy):
+    status, bandwidth, experience = filters["status"], filters["bandwidth"], filters["experience"]
+    semantic = query and mode == "semantic" and embedding_index.SEMANTIC_SEARCH_ENABLED
+    if jd or semantic or mode == "hybrid":
+        # JD parsing (LLM), embeddings and scoring are blocking; run them on a worker thread
+        return await run_in_threadpool(
+            _search_in_worker, db.info.get("use_primary", False),
+            current_user, query, jd, mode, fusion, weights, skip, limit, filters, facets
+        )
+
+    if query and fuzzy:
+        return await _fuzzy_search(db, current_user, query, filters, facets)
+
+    # Filter-only search: ids come from the in-memory bitmap index, the DB only loads the page
+    if (filter_index.FILTER_INDEX_ENABLED and not query and not filters["name"] and not filters["tech"]
+            and current_user.role == UserRole.ADMIN):
+        with timing.span("search.filter_index"):
+            # Building/catching up is CPU and sync DB work; keep it off the event loop
+            await run_in_threadpool(_sync_index, filter_index.index, db.info.get("use_primary", False))
+            matches = filter_index.index.match(**_index_filters(status, bandwidth, experience))
+            page_ids = filter_index.bitmap_ids(matches, skip, limit)
+        stmt = select(models.Employee).options(*_RESPONSE_LOADS) \
+            .filter(models.Employee.id.in_(page_ids)).order_by(models.Employee.id)
+        with timing.span("search.sql_fetch"):
+            results = (await db.execute(stmt)).scalars().all()
+        if facets:
+            with timing.span("search.facets"):
+                return _respond(results, True, filter_index.index.facets(matches), matches.bit_count())
+        return _serialize(results)
+
+    # Plain keyword/filter search: async query, the event loop is free while the DB works
+    stmt = _apply_search_filters(select(models.Employee).options(*_RESPONSE_LOADS), current_user, **filters)
+    facet_counts = total = None
+    if query:
+        stmt = stmt.filter(ranking.keyword_filter(query))
+    elif skip or limit is not None:
+        stmt = stmt.order_by(models.Employee.id).offset(skip).limit(limit)
+        if facets:
+            # Paged: count over the filter columns of the whole result set in one query
+            with timing.span("search.facets"):
+                rows = (await db.execute(_apply_search_filters(
+                    select(*filter_index.COLUMNS), current_user, **filters))).all()
+                facet_counts, total = filter_index.count_facets(rows), len(rows)
+
+    with timing.span("search.sql_filter"):
+        results = (await db.execute(stmt)).scalars().all()
+
+    for emp in results:
+        emp.match_score = None
+
+    if query and results:
+        q_lower = query.lower()
+        with timing.span("search.basic_rank"):
+            results.sort(key=lambda emp: ranking.basic_rank(emp, q_lower), reverse=True)
+
+    return _respond(results, facets, facet_counts, total)
+
+async def _fuzzy_search(db, current_user, query, filters, facets):
+    """
+    Query words matched against profile words by trigram similarity (with an
+    edit-distance check) instead of the ilike chain; best match first.
+    """
+    use_primary = db.info.get("use_primary", False)
+    with timing.span("search.fuzzy"):
+        await run_in_threadpool(_sync_index, trigram_index.index, use_primary)
+        # Filter before ranking so the FUZZY_MAX_RESULTS cut, total and facets only see eligible profiles
+        allowed = await _eligible(db, current_user, filters, use_primary)
+        ranked, matched = trigram_index.index.search_matches(query, allowed)
+    if not ranked:
+        return _respond([], facets)
+
+    order = {emp_id: n for n, (emp_id, _) in enumerate(ranked)}
+    stmt = _apply_search_filters(select(models.Employee).options(*_RESPONSE_LOADS), current_user, **filters) \
+        .filter(models.Employee.id.in_(list(order)))
+    with timing.span("search.sql_fetch"):
+        results = (await db.execute(stmt)).scalars().all()
+    for emp in results:
+        emp.match_score = round(ranked[order[emp.id]][1] * 100, 1)
+    results.sort(key=lambda emp: order[emp.id])
+    if not facets:
+        return _serialize(results)
+    with timing.span("search.facets"):
+        if filter_index.FILTER_INDEX_ENABLED:
+            await run_in_threadpool(_sync_index, filter_index.index, use_primary)
+            facet_counts = filter_index.index.facets(matched)
+        else:
+            stmt = select(*filter_index.COLUMNS).filter(models.Employee.id.in_(filter_index.bitmap_ids(matched)))
+            facet_counts = filter_index.count_facets((await db.execute(stmt)).all())
+    return _respond(results, True, facet_counts, matched.bit_count())
+
+async def _eligible(db, current_user, filters, use_primary):
+    """
+    Bitset of the profiles the search filters and a non-admin's own-profile
+    scope allow (None = every profile), from filter_index when it is enabled.
+    """
+    if current_user.role == UserRole.ADMIN and not any(filters.values()):
+        return None
+    if not filter_index.FILTER_INDEX_ENABLED:
+        stmt = _apply_search_filters(select(models.Employee.id), current_user, **filters)
+        return filter_index.bitmap_from_ids((await db.execute(stmt)).scalars().all())
+    await run_in_threadpool(_sync_index, filter_index.index, use_primary)
+    allowed = filter_index.index.match(
+        name=filters["name"], tech=filters["tech"],
+        **_index_filters(filters["status"], filters["bandwidth"], filters["experience"]))
+    if current_user.role != UserRole.ADMIN:
+        own = (await db.execute(
+            select(models.Employee.id).filter(models.Employee.email == current_user.email))).scalar()
+        allowed &= 1 << own if own is not None else 0
+    return allowed
+
+def _cache_entry(response):
+    """The ids and scores (plus total and facets) of a search response."""
+    if isinstance(response, schemas.EmployeeSearchResponse):
+        return search_cache.CachedSearch(None, [r.id for r in response.results],
+                                         [r.match_score for r in response.results], response.total, response.facets)
+    return search_cache.CachedSearch(None, [r.id for r in response], [r.match_score for r in response])
+
+async def _cached_response(db, cached, facets):
+    results = cached.results()
+    rows = {}
+    if results:
+        stmt = select(models.Employee).options(*_RESPONSE_LOADS) \
+            .filter(models.Employee.id.in_([emp_id for emp_id, _ in results]))
+        with timing.span("search.sql_fetch"):
+            rows = {emp.id: emp for emp in (await db.execute(stmt)).scalars().all()}
+    ordered = []
+    for emp_id, score in results:
+        emp = rows.get(emp_id)
+        if emp is not None:
+            emp.match_score = score
+            ordered.append(emp)
+    if not facets:
+        return _serialize(ordered)
+    return schemas.EmployeeSearchResponse(results=_serialize(ordered), total=cached.total, facets=cached.facets)
+
+def _apply_search_filters(base_query, current_user, name=None, tech=None, status=None,
+                          bandwidth=None, experience=None):
+    """Access control and field filters; works on both Query and select()."""
     # Access Control: If not Admin, return ONLY own profile (if matches)
     if current_user.role != UserRole.ADMIN:
-        base_query = db.query(models.Employee).filter(models.Employee.email == current_user.email)
-    else:
-        base_query = db.query(models.Employee)
+        base_query = base_query.filter(models.Employee.email == current_user.email)
 
-    # Apply Filters
-    if query:
-        search_filter = f"%{query}%"
-        base_query = base_query.filter(
-            (models.Employee.name.ilike(search_filter)) |
-            (models.Employee.emp_id.ilike(search_filter)) |
-            (models.Employee.location.ilike(search_filter)) |
-            (models.Employee.career_summary.ilike(search_filter)) |
-            (models.Employee.search_phrase.ilike(search_filter)) |
-            (models.Employee.tech.cast(models.Text).ilike(search_filter))
-        )
-    
     if name:
         base_query = base_query.filter(models.Employee.name.ilike(f"%{name}%"))
     
@@ -185,109 +380,205 @@ def search_employees(
             base_query = base_query.filter(models.Employee.experience_years >= exp_val)
         except ValueError:
             pass
+    return base_query
+
+def _index_filters(status=None, bandwidth=None, experience=None):
+    """The search filters in filter_index.match form; unparsable numbers are ignored like in SQL."""
+    filters = {"status": status or None}
+    try:
+        filters["bandwidth"] = int(bandwidth) if bandwidth else None
+    except ValueError:
+        pass
+    try:
+        filters["experience"] = float(experience) if experience else None
+    except ValueError:
+        pass
+    return filters
 
-    results = base_query.all()
+def _sync_index(index, use_primary):
+    db = ReadSessionLocal()
+    db.info["use_primary"] = use_primary
+    try:
+        index.ensure_fresh(db)
+    finally:
+        db.close()
+
+def _search_in_worker(use_primary, *args):
+    # Threadpool side of search_employees, with its own read-only session
+    db = ReadSessionLocal()
+    db.info["use_primary"] = use_primary
+    try:
+        return _search_sync(db, *args)
+    finally:
+        db.close()
+
+def _search_sync(db, current_user, query, jd, mode, fusion, weights, skip, limit, filters, facets=False):
+    base_query = _apply_search_filters(db.query(models.Employee), current_user, **filters)
+
+    # Query filter: semantic candidates or keyword match
+    semantic_scores = None
+    if query and mode == "semantic" and embedding_index.SEMANTIC_SEARCH_ENABLED:
+        with timing.span("search.semantic"):
+            index, query_vec = embedding_index.embed_query(db, query)
+            semantic_scores = dict(index.search(
+                query_vec, k=embedding_index.SEMANTIC_TOP_K, min_score=embedding_index.SEMANTIC_MIN_SCORE
+            ))
+        base_query = base_query.filter(models.Employee.id.in_(list(semantic_scores)))
+    elif query and mode != "hybrid":
+        base_query = base_query.filter(ranking.keyword_filter(query))
     
-    # Reset match scores
-    for emp in results:
-        emp.match_score = None
+    if mode == "hybrid":
+        ranked_ids = [] if facets else None
+        results, _ = ranking.hybrid_search(
+            db, base_query, query=query, jd=jd, weights=weights, method=fusion, skip=skip,
+            limit=ranking.HYBRID_PAGE_SIZE if limit is None else limit,
+            ranked_ids=ranked_ids,
+        )
+        if facets:
+            with timing.span("search.facets"):
+                return _respond(results, True, _facets_for_ids(db, base_query, ranked_ids), len(ranked_ids))
+        return _serialize(results)
 
     # ---------------------------------------------------------
     # JD Scoring & Sorting Logic
     # ---------------------------------------------------------
-    if jd and results:
+    if jd:
+        # Scored on column-projected candidates; full rows are loaded for the results only
+        with timing.span("search.sql_filter"):
+            pool = candidates.load(db, base_query)
+        if not pool:
+            return _respond([], facets)
         llm_service = LLMService(db)
         try:
-            # 1. Parse JD using LLM
-            parsed_jd = llm_service.parse_jd_with_llm(jd)
-            
-            # 2. Compute scores for each profile
-            scored_results = []
-            for emp in results:
-                match_data = llm_service.compute_match_score(emp, parsed_jd)
-                emp.match_score = match_data["match_score"]
-                # Optionally keep track of matched skills if needed, but match_score is the priority
-                scored_results.append(emp)
+            # 1. Parse JD (local dictionary first, LLM per JD_PARSER_MODE)
+            with timing.span("search.parse_jd"):
+                parsed_jd = llm_service.parse_jd(jd)
             
-            # 3. Sort by match score desc
-            scored_results.sort(key=lambda x: x.match_score if x.match_score is not None else 0, reverse=True)
-            return scored_results
+            # 2. Embedding similarity of the JD to each profile (optional component)
+            jd_similarities = {}
+            if embedding_index.SEMANTIC_SEARCH_ENABLED:
+                try:
+                    with timing.span("search.jd_similarity"):
+                        index, jd_vec = embedding_index.embed_query(db, jd)
+                        jd_similarities = index.similarities(jd_vec, [c.id for c in pool])
+                except Exception as e:
+                    logger.warning(f"JD similarity unavailable, scoring without it: {e}")
+
+            # 3. Compute scores for each profile
+            # 4. Sort by match score desc (large unfiltered pools are scored across processes)
+            with timing.span("search.scoring"):
+                scored_results = parallel_scoring.rank(pool, parsed_jd, jd_similarities)
         except Exception as e:
             print(f"JD Scoring failed, falling back to basic matching: {e}")
             # Fallback to existing regex logic if LLM fails (optional, but requested non-breaking)
-            import re
-            jd_text = jd.lower()
-            jd_keywords = set(re.findall(r'\b[a-z]{3,}\b', jd_text))
-            
-            if not jd_keywords:
-                return []
-
-            scored_results = []
-            for emp in results:
-                def get_matches(source_text, keywords):
-                    if not source_text: return set()
-                    tokens = set(re.findall(r'\b[a-z]{3,}\b', source_text.lower()))
-                    return keywords.intersection(tokens)
-
-                tech_str = " ".join([t.get("tech", "") for t in emp.tech]) if emp.tech else ""
-                tech_matches = get_matches(tech_str, jd_keywords)
-                phrase_matches = get_matches(emp.search_phrase, jd_keywords)
-                summary_matches = get_matches(emp.career_summary, jd_keywords)
-                
-                work_str = ""
-                if emp.work_history:
-                    work_str += " ".join([f"{h.description} {h.role} {h.project}" for h in emp.work_history])
-                if emp.clients:
-                    client_str = " ".join([c.get("description", "") for c in emp.clients])
-                    work_str += " " + client_str
-                work_matches = get_matches(work_str, jd_keywords)
-
-                all_matched_keywords = tech_matches | phrase_matches | summary_matches | work_matches
-                percentage = (len(all_matched_keywords) / len(jd_keywords)) * 100 if jd_keywords else 0
-                
-                if percentage >= 50:
-                    emp.match_score = round(percentage, 1)
-                    scored_results.append(emp)
-            
-            scored_results.sort(key=lambda x: x.match_score, reverse=True)
-            return scored_results
+            with timing.span("search.regex_fallback"):
+                # The fallback also matches work history texts
+                candidates.attach_history(db, pool)
+                scored_results = ranking.regex_fallback_rank(pool, jd)
+        with timing.span("search.sql_fetch"):
+            results = _materialize(base_query, scored_results)
+        return _respond(results, facets)
+
+    with timing.span("search.sql_filter"):
+        results = base_query.all()
+    
+    # Reset match scores
+    for emp in results:
+        emp.match_score = None
+
+    # ---------------------------------------------------------
+    # Semantic Search Sorting
+    # ---------------------------------------------------------
+    if semantic_scores is not None:
+        for emp in results:
+            emp.match_score = round(semantic_scores.get(emp.id, 0.0) * 100, 1)
+        results.sort(key=lambda x: x.match_score, reverse=True)
+        return _respond(results, facets)
 
     # ---------------------------------------------------------
     # Basic Search Sorting
     # ---------------------------------------------------------
     if query and results:
         q_lower = query.lower()
-        def basic_rank(emp):
-            # Rank 1 (Top): Exact Name or Emp ID match
-            if emp.name.lower() == q_lower or emp.emp_id.lower() == q_lower:
-                return 100
-            # Rank 2: Exact Search Phrase match
-            if emp.search_phrase and emp.search_phrase.lower() == q_lower:
-                return 90
-            # Rank 3: Query in Name
-            if q_lower in emp.name.lower():
-                return 80
-            # Rank 4: Query in Search Phrase
-            if emp.search_phrase and q_lower in emp.search_phrase.lower():
-                return 60
-            # Rank 5: Query in Tech
-            tech_str = " ".join([t.get("tech", "") for t in emp.tech]) if emp.tech else ""
-            if q_lower in tech_str.lower():
-                return 40
-            return 0
-            
-        results.sort(key=basic_rank, reverse=True)
+        with timing.span("search.basic_rank"):
+            results.sort(key=lambda emp: ranking.basic_rank(emp, q_lower), reverse=True)
 
+    return _respond(results, facets)
+
+def _materialize(base_query, ranked):
+    """Full rows for ranked candidates, in rank order, carrying the candidates' match_score."""
+    if not ranked:
+        return []
+    query = base_query.options(*_RESPONSE_LOADS)
+    if len(ranked) <= _MATERIALIZE_ID_LIMIT:
+        query = query.filter(models.Employee.id.in_([c.id for c in ranked]))
+    rows = {emp.id: emp for emp in query}
+    results = []
+    for candidate in ranked:
+        emp = rows.get(candidate.id)
+        if emp is not None:
+            emp.match_score = candidate.match_score
+            results.append(emp)
     return results
 
+def _facets_for_ids(db, base_query, ids):
+    """Facet counts for a result set known only by id (hybrid ranks ids, then loads one page)."""
+    if filter_index.FILTER_INDEX_ENABLED:
+        filter_index.index.ensure_fresh(db)
+        return filter_index.index.facets(filter_index.bitmap_from_ids(ids))
+    ids = set(ids)
+    return filter_index.count_facets(
+        row for row in base_query.with_entities(*filter_index.COLUMNS).all() if row.id in ids
+    )
+
+def _serialize(results):
+    """Converts to response models here so Pydantic time shows up as its own span."""
+    with timing.span("search.serialize"):
+        return [schemas.EmployeeResponse.model_validate(emp) for emp in results]
+
+def _respond(results, facets=False, facet_counts=None, total=None):
+    """
+    The serialized results; with facets, wrapped with the result-set total and
+    facet counts. Without precomputed counts the results are the whole result
+    set and are counted here.
+    """
+    serialized = _serialize(results)
+    if not facets:
+        return serialized
+    if facet_counts is None:
+        with timing.span("search.facets"):
+            facet_counts = filter_index.count_facets(results)
+    return schemas.EmployeeSearchResponse(
+        results=serialized, total=len(results) if total is None else total, facets=facet_counts
+    )
+
+@router.get("/suggest", response_model=List[schemas.Suggestion])
+async def suggest(
+    prefix: str = Query(""),
+    limit: int = Query(10, ge=1, le=suggest_index.SUGGEST_TOP_N),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Typeahead completions from the in-memory trie; no row is read per keystroke."""
+    kinds = suggest_index.KINDS
+    if current_user.role != UserRole.ADMIN:
+        # Non-admins can only search their own profile; suggest skills and locations only
+        kinds = tuple(k for k in kinds if k not in suggest_index.PRIVATE_KINDS)
+    with timing.span("search.suggest"):
+        await run_in_threadpool(_sync_index, suggest_index.index, db.info.get("use_primary", False))
+        return suggest_index.index.suggest(prefix, limit, kinds)
+
 @router.get("/recent", response_model=List[schemas.EmployeeResponse])
-def get_recent_updates(limit: int = 5, db: Session = Depends(get_db)):
+def get_recent_updates(limit: int = 5, db: Session = Depends(get_read_db)):
     # Sort by created_at to show recently ADDED profiles
     return db.query(models.Employee).order_by(models.Employee.created_at.desc()).limit(limit).all()
 
 @router.get("/{emp_id}", response_model=schemas.EmployeeResponse)
-def read_employee(emp_id: str, db: Session = Depends(get_db)):
-    db_employee = db.query(models.Employee).filter(models.Employee.emp_id == emp_id).first()
+async def read_employee(emp_id: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(models.Employee).options(*_RESPONSE_LOADS).filter(models.Employee.emp_id == emp_id)
+    )
+    db_employee = result.scalars().first()
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
     return db_employee
@@ -298,5 +589,9 @@ def delete_employee(emp_id: str, db: Session = Depends(get_db)):
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
     db.delete(db_employee)
+    outbox.record(db, db_employee.id, outbox.DELETE)
     db.commit()
+    stick_to_primary(db)
+    employee_indexes.remove(db_employee.id)
+    embedding_index.remove_employee_embedding(db_employee.id)
     return {"message": "Employee deleted successfully"}
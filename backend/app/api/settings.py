@@ -2,14 +2,16 @@ import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models import llm_settings as models
 from ..schemas import llm_settings as schemas
+from ..services import timing
+from .auth_utils import get_admin_user
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
 @router.get("/llm", response_model=schemas.LLMSettingsResponse)
-def get_llm_settings(db: Session = Depends(get_db)):
+def get_llm_settings(db: Session = Depends(get_read_db)):
     settings = db.query(models.LLMSettings).first()
     if not settings:
         # Return default values if no record exists
@@ -63,7 +65,7 @@ def save_llm_settings(settings: schemas.LLMSettingsCreate, db: Session = Depends
     }
 
 @router.get("/llm/models")
-def get_llm_models(provider: str, db: Session = Depends(get_db)):
+def get_llm_models(provider: str, db: Session = Depends(get_read_db)):
     from ..services.llm_service import LLMService
     try:
         llm_service = LLMService(db)
@@ -76,3 +78,14 @@ def get_llm_models(provider: str, db: Session = Depends(get_db)):
         if provider.lower() == "openai":
             return ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"]
         return ["llama3", "mistral", "phi3", "gemma"]
+
+@router.get("/timing")
+def get_timing(admin=Depends(get_admin_user)):
+    return {"enabled": timing.is_enabled(), "histograms": timing.histograms()}
+
+@router.post("/timing")
+def set_timing(enabled: bool, reset: bool = False, admin=Depends(get_admin_user)):
+    timing.set_enabled(enabled)
+    if reset:
+        timing.reset_histograms()
+    return {"enabled": timing.is_enabled()}
@@ -0,0 +1,87 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import List
+from ..database import get_db, get_read_db, stick_to_primary
+from ..models.employee import Employee
+from ..models.skill_alias import SkillAlias
+from ..models.user import User
+from ..schemas import skill_alias as schemas
+from ..services import employee_indexes, jd_parser, outbox, skill_aliases
+from ..services.search_phrase_worker import worker as search_phrase_worker
+from .auth_utils import get_current_user, get_admin_user
+
+router = APIRouter(prefix="/skills", tags=["skills"])
+
+@router.get("/aliases", response_model=List[schemas.SkillAliasResponse])
+def read_aliases(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    return db.query(SkillAlias).order_by(SkillAlias.canonical, SkillAlias.alias).all()
+
+@router.post("/aliases", response_model=schemas.SkillAliasResponse)
+def save_alias(
+    alias_in: schemas.SkillAliasCreate,
+    db: Session = Depends(get_db),
+    admin: User = Depends(get_admin_user)
+):
+    alias = skill_aliases.normalize(alias_in.alias)
+    if alias == skill_aliases.normalize(alias_in.canonical):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Alias and canonical name are the same.")
+    # Aliases point straight at a canonical name; chains would make lookups order-dependent
+    target = db.query(SkillAlias).filter(SkillAlias.alias == skill_aliases.normalize(alias_in.canonical)).first()
+    if target:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'{alias_in.canonical}' is itself an alias of '{target.canonical}'."
+        )
+    if db.query(SkillAlias).filter(func.lower(SkillAlias.canonical) == alias).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'{alias_in.alias}' is a canonical name used by other aliases."
+        )
+
+    # The first saved alias must not replace the built-in defaults an empty table stands for
+    skill_aliases.seed_defaults(db)
+    db_alias = db.query(SkillAlias).filter(SkillAlias.alias == alias).first()
+    if db_alias:
+        db_alias.canonical = alias_in.canonical
+    else:
+        db_alias = SkillAlias(alias=alias, canonical=alias_in.canonical)
+        db.add(db_alias)
+    db.commit()
+    db.refresh(db_alias)
+    # Recompile now; other workers pick the change up within SKILL_ALIAS_TTL
+    skill_aliases.refresh(db, force=True)
+    return db_alias
+
+@router.delete("/aliases/{alias_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_alias(alias_id: int, db: Session = Depends(get_db), admin: User = Depends(get_admin_user)):
+    db_alias = db.query(SkillAlias).filter(SkillAlias.id == alias_id).first()
+    if not db_alias:
+        raise HTTPException(status_code=404, detail="Alias not found")
+    db.delete(db_alias)
+    db.commit()
+    skill_aliases.refresh(db, force=True)
+    return None
+
+@router.post("/aliases/apply")
+def apply_aliases(db: Session = Depends(get_db), admin: User = Depends(get_admin_user)):
+    """Rewrites stored tech to canonical names (for profiles saved before an alias existed)."""
+    table = skill_aliases.refresh(db, force=True)
+    updated = []
+    for emp in db.query(Employee).filter(Employee.tech.isnot(None)).all():
+        tech = table.canonicalize_tech(emp.tech)
+        if tech != emp.tech:
+            emp.tech = tech
+            emp.last_updated = datetime.now()
+            updated.append(emp.id)
+    outbox.record_many(db, updated, outbox.UPDATE)
+    db.commit()
+    if updated:
+        stick_to_primary(db)
+        # This worker's indexes and JD dictionary still hold the old spellings
+        for emp in db.query(Employee).filter(Employee.id.in_(updated)).all():
+            employee_indexes.upsert(emp)
+        jd_parser.invalidate_skill_dictionary()
+        search_phrase_worker.notify()
+    return {"updated": len(updated)}
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.user import User, UserRole
 from ..schemas.user import UserResponse, UserUpdate, UserCreate
 from .auth_utils import get_admin_user, get_password_hash
 from ..models.employee import Employee
+from ..services import employee_indexes, embedding_index, outbox
 import uuid
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -49,16 +50,20 @@ def create_user(
             status="ON_BENCH"
         )
         db.add(new_employee)
+        db.flush()
+        outbox.record(db, new_employee.id, outbox.INSERT)
     
     db.commit()
     db.refresh(new_user)
+    if not existing_employee:
+        employee_indexes.upsert(new_employee)
     return new_user
 
 @router.get("/", response_model=List[UserResponse])
 def read_users(
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin: User = Depends(get_admin_user)
 ):
     # Admins should see all users, including inactive ones
@@ -125,9 +130,13 @@ def delete_user(
     employee = db.query(Employee).filter(Employee.email == user.email).first()
     if employee:
         db.delete(employee)
+        outbox.record(db, employee.id, outbox.DELETE)
     
     db.delete(user)
     db.commit()
+    if employee:
+        employee_indexes.remove(employee.id)
+        embedding_index.remove_employee_embedding(employee.id)
     return None
 
 @router.patch("/{user_id}/status", response_model=UserResponse)
@@ -1,15 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+import json
+import time
 import logging
 from .models import base  # Ensures all models are registered
-from .api import employees, dashboard, settings, auth, users
+from .database import engine, read_engine, async_engine, replicas, pool_status, SessionLocal
+from .api import employees, dashboard, settings, auth, users, skills
+from .services import search_phrase_worker, search_snapshot, parallel_scoring, timing, metrics, skill_aliases
 
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Employee Management System API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile the skill alias table before the first request
+    with SessionLocal() as db:
+        skill_aliases.refresh(db, force=True)
+    # Keeps search_phrase in sync with profile edits outside the request path
+    if search_phrase_worker.SEARCH_PHRASE_WORKER_ENABLED:
+        search_phrase_worker.worker.start()
+    # One worker process builds the shared search snapshot; all of them map it
+    if search_snapshot.SEARCH_SNAPSHOT_ENABLED:
+        search_snapshot.builder.start()
+    replicas.start()
+    yield
+    replicas.stop()
+    search_snapshot.builder.stop()
+    search_phrase_worker.worker.stop()
+    parallel_scoring.shutdown()
+    await async_engine.dispose()
+
+app = FastAPI(title="Employee Management System API", lifespan=lifespan)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -19,6 +43,47 @@ async def global_exception_handler(request: Request, exc: Exception):
         content={"detail": "An internal server error occurred. Please try again later."},
     )
 
+def _route_label(request: Request) -> str:
+    # Route template ("/api/employees/{emp_id}") keeps labels low-cardinality
+    template = getattr(request.scope.get("route"), "path", None)
+    if not template:
+        return request.url.path
+    # Included routers may report the template without the "/api" mount prefix
+    path_parts = request.url.path.rstrip("/").split("/")
+    template_parts = template.rstrip("/").split("/")
+    prefix = "/".join(path_parts[:len(path_parts) - len(template_parts) + 1])
+    return prefix + template
+
+@app.middleware("http")
+async def instrument_request(request: Request, call_next):
+    timing_enabled = timing.is_enabled()
+    token = timing.start_request() if timing_enabled else None
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        elapsed = time.perf_counter() - start
+        route = _route_label(request)
+        metrics.http_requests.inc(request.method, route, str(status_code))
+        metrics.http_latency.observe(elapsed, request.method, route)
+        spans = timing.finish_request(token) if timing_enabled else None
+
+    if timing_enabled:
+        total_ms = elapsed * 1000
+        timing.record(f"route.{request.method} {route}", total_ms)
+        totals = timing.aggregate(spans)
+        totals["total"] = total_ms
+        response.headers["Server-Timing"] = timing.server_timing_header(totals)
+        logger.info("request_timing " + json.dumps({
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code,
+            "stages_ms": {name: round(ms, 2) for name, ms in totals.items()},
+        }))
+    return response
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -39,6 +104,7 @@ app.include_router(users.router, prefix="/api")
 app.include_router(employees.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
 app.include_router(settings.router, prefix="/api")
+app.include_router(skills.router, prefix="/api")
 
 @app.get("/")
 async def root():
@@ -46,4 +112,17 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    health = {
+        "status": "healthy",
+        "db_pool": pool_status(engine),
+        "async_db_pool": pool_status(async_engine.sync_engine),
+    }
+    if read_engine is not engine:
+        health["read_db_pool"] = pool_status(read_engine)
+    if len(replicas):
+        health["replicas"] = replicas.status()
+    return health
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
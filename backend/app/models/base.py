@@ -4,5 +4,8 @@ from .employee import Employee, WorkMode, EmployeeStatus
 from .work_history import WorkHistory
 from .education import Education
 from .llm_settings import LLMSettings
+from .skill_alias import SkillAlias
+from .employee_change import EmployeeChange, ChangeConsumerOffset
 
-__all__ = ["Base", "User", "Employee", "WorkHistory", "EmployeeStatus", "Education", "LLMSettings"]
+__all__ = ["Base", "User", "Employee", "WorkHistory", "EmployeeStatus", "Education", "LLMSettings", "SkillAlias",
+           "EmployeeChange", "ChangeConsumerOffset"]
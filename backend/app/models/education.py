@@ -6,7 +6,7 @@ class Education(Base):
     __tablename__ = "education"
 
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"))
+    employee_id = Column(Integer, ForeignKey("employees.id"), index=True)
     institution = Column(String(255), nullable=False)
     degree = Column(String(255))
     field_of_study = Column(String(255))
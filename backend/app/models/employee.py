@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, Enum, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, Text, Enum, DateTime, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -30,9 +30,20 @@ class Employee(Base):
     bandwidth = Column(Integer, default=100) # Percentage
     career_summary = Column(Text)
     search_phrase = Column(Text) # For AI-driven search indexing
+    search_phrase_updated_at = Column(DateTime, nullable=True) # last_updated the phrase was generated from
+    search_phrase_generated = Column(Boolean, default=False) # Written by the search phrase worker, not the user
     clients = Column(JSON, default=list) # List of clients: [{client_name, client_status, description}]
     created_at = Column(DateTime, default=datetime.utcnow)
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Search filters: status = ?, bandwidth >= ?, experience_years >= ?; also covers the dashboard counts
+        Index("ix_employees_status_bandwidth_experience", "status", "bandwidth", "experience_years"),
+        # Recent profiles (ORDER BY created_at DESC LIMIT n)
+        Index("ix_employees_created_at", "created_at"),
+        # Search phrase worker scans in (last_updated, id) order
+        Index("ix_employees_last_updated_id", "last_updated", "id"),
+    )
+
     work_history = relationship("WorkHistory", back_populates="employee", cascade="all, delete-orphan")
     education = relationship("Education", back_populates="employee", cascade="all, delete-orphan")
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+from ..database import Base
+
+class EmployeeChange(Base):
+    """Outbox row written in the same transaction as an employee insert/update/delete."""
+    __tablename__ = "employee_changes"
+
+    id = Column(Integer, primary_key=True)  # Consumers' offset; never reused
+    employee_id = Column(Integer, nullable=False)  # No foreign key: deletes are recorded too
+    op = Column(String(10), nullable=False)  # "insert", "update" or "delete"
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Retention pruning deletes by age
+        Index("ix_employee_changes_created_at", "created_at"),
+        # SQLite would otherwise reuse ids after the newest rows are pruned
+        {"sqlite_autoincrement": True},
+    )
+
+class ChangeConsumerOffset(Base):
+    """Last employee_changes.id a named consumer has processed."""
+    __tablename__ = "change_consumer_offsets"
+
+    consumer = Column(String(100), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from ..database import Base
+
+class SkillAlias(Base):
+    __tablename__ = "skill_aliases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    alias = Column(String(100), unique=True, nullable=False)  # Stored normalized (lowercase, single spaces)
+    canonical = Column(String(100), nullable=False)  # Display name written into tech, e.g. "PostgreSQL"
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
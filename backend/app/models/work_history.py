@@ -6,7 +6,7 @@ class WorkHistory(Base):
     __tablename__ = "work_history"
 
     id = Column(Integer, primary_key=True, index=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"))
+    employee_id = Column(Integer, ForeignKey("employees.id"), index=True)
     company = Column(String(255), nullable=False)
     role = Column(String(255), nullable=False)
     start_date = Column(Date)
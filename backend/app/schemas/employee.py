@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Dict, Union
 from datetime import datetime
 from ..models.employee import WorkMode, EmployeeStatus
 from .history_edu import WorkHistoryCreate, EducationCreate, WorkHistoryResponse, EducationResponse
@@ -52,3 +52,18 @@ class EmployeeResponse(EmployeeBase):
 
     class Config:
         from_attributes = True
+
+class FacetCount(BaseModel):
+    value: Union[int, str]
+    count: int
+
+class EmployeeSearchResponse(BaseModel):
+    """/employees/search?facets=true: the page plus counts over the whole result set."""
+    results: List[EmployeeResponse]
+    total: int
+    facets: Dict[str, List[FacetCount]]
+
+class Suggestion(BaseModel):
+    text: str
+    kind: Literal["name", "emp_id", "tech", "location", "client"]
+    count: int  # employees behind the completion
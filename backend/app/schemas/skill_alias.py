@@ -0,0 +1,23 @@
+from datetime import datetime
+from pydantic import BaseModel, field_validator
+
+class SkillAliasCreate(BaseModel):
+    alias: str
+    canonical: str
+
+    @field_validator("alias", "canonical")
+    @classmethod
+    def validate_not_blank(cls, v):
+        v = " ".join(v.split())
+        if len(v) < 2:
+            raise ValueError("Must be at least 2 characters")
+        return v
+
+class SkillAliasResponse(BaseModel):
+    id: int
+    alias: str
+    canonical: str
+    updated_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
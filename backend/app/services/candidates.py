@@ -0,0 +1,68 @@
+from collections import namedtuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session, Query
+from ..models.employee import Employee
+from ..models.work_history import WorkHistory
+
+# The attributes compute_match_score, basic_rank and the fallback tokenizer read
+FIELDS = ("id", "name", "emp_id", "tech", "experience_years", "bandwidth", "clients", "career_summary",
+          "search_phrase", "last_updated", "search_phrase_updated_at", "work_history_count")
+COLUMNS = tuple(getattr(Employee, field) for field in FIELDS[:-1])
+
+# Work history texts, for the fallback tokenizer only (profile_text)
+HistoryText = namedtuple("HistoryText", ("description", "role", "project"))
+
+# Ids per IN (...) when attaching work history
+_ID_CHUNK = 1000
+
+
+class Candidate:
+    """
+    Read-only scoring view of one employee, filled from a column-projected
+    query: no identity map, instrumentation or relationship loading. Scorers
+    write match_score here instead of onto ORM instances.
+    """
+    __slots__ = FIELDS + ("work_history", "match_score")
+
+    def __init__(self, id, name, emp_id, tech, experience_years, bandwidth, clients, career_summary,
+                 search_phrase, last_updated, search_phrase_updated_at, work_history_count):
+        self.id = id
+        self.name = name
+        self.emp_id = emp_id
+        self.tech = tech
+        self.experience_years = experience_years
+        self.bandwidth = bandwidth
+        self.clients = clients
+        self.career_summary = career_summary
+        self.search_phrase = search_phrase
+        self.last_updated = last_updated
+        self.search_phrase_updated_at = search_phrase_updated_at
+        self.work_history_count = work_history_count
+        self.work_history = None  # filled by attach_history when the texts are needed
+        self.match_score = None
+
+
+def load(db: Session, base_query: Query) -> list:
+    """Candidates for the rows of base_query (a Query over Employee), work history counted in SQL."""
+    history_counts = (
+        db.query(WorkHistory.employee_id, func.count(WorkHistory.id).label("work_history_count"))
+        .group_by(WorkHistory.employee_id)
+        .subquery()
+    )
+    rows = base_query.with_entities(
+        *COLUMNS, func.coalesce(history_counts.c.work_history_count, 0),
+    ).outerjoin(history_counts, history_counts.c.employee_id == Employee.id)
+    return [Candidate(*row) for row in rows]
+
+
+def attach_history(db: Session, candidates):
+    """Loads the work history texts of candidates (one query per _ID_CHUNK ids)."""
+    by_id = {c.id: c for c in candidates}
+    for c in candidates:
+        c.work_history = []
+    ids = list(by_id)
+    for start in range(0, len(ids), _ID_CHUNK):
+        rows = db.query(WorkHistory.employee_id, WorkHistory.description, WorkHistory.role, WorkHistory.project) \
+            .filter(WorkHistory.employee_id.in_(ids[start:start + _ID_CHUNK])).order_by(WorkHistory.id)
+        for employee_id, *texts in rows:
+            by_id[employee_id].work_history.append(HistoryText(*texts))
@@ -0,0 +1,525 @@
+import os
+import re
+import json
+import math
+import mmap
+import zlib
+import time
+import random
+import logging
+import threading
+import contextlib
+from array import array
+from operator import mul
+from openai import OpenAI
+from sqlalchemy.orm import Session, selectinload
+from ..models.employee import Employee
+from ..models.llm_settings import LLMSettings
+from . import timing, metrics, outbox
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock; run a single worker per index directory there
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# "local" uses the hashing stand-in below, "ollama" calls the configured api_base
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "local").lower()
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "nomic-embed-text")
+EMBEDDING_INDEX_DIR = os.getenv("EMBEDDING_INDEX_DIR", "./embedding_index")
+# Seconds between outbox checks for employees deleted by processes without the index open
+EMBEDDING_SYNC_INTERVAL = float(os.getenv("EMBEDDING_SYNC_INTERVAL", "5"))
+# Off by default: the first search builds the index inside the request, saves embed synchronously
+# and JD match scores gain a JD_SIMILARITY_WEIGHT similarity component
+SEMANTIC_SEARCH_ENABLED = os.getenv("SEMANTIC_SEARCH_ENABLED", "false").lower() == "true"
+# mode=semantic returns at most this many employees above this cosine similarity
+SEMANTIC_TOP_K = int(os.getenv("SEMANTIC_TOP_K", "50"))
+SEMANTIC_MIN_SCORE = float(os.getenv("SEMANTIC_MIN_SCORE", "0.1"))
+LOCAL_EMBEDDING_DIM = 256
+
+# LSH parameters: TABLES independent hashes of BITS random hyperplanes each
+LSH_TABLES = 4
+LSH_BITS = 10
+# Below this many rows an exact scan is cheaper than probing buckets
+EXACT_SCAN_ROWS = 2000
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def _normalize(vec):
+    norm = math.sqrt(sum(v * v for v in vec))
+    if not norm:
+        return [0.0] * len(vec)
+    return [v / norm for v in vec]
+
+
+class HashingEmbedder:
+    """
+    Offline stand-in for an embedding model: signed feature hashing of words
+    and word bigrams. Stable across processes (crc32, not hash()).
+    """
+
+    def __init__(self, dim: int = LOCAL_EMBEDDING_DIM):
+        self.dim = dim
+        self.name = f"local-hashing-{dim}"
+
+    def _embed_one(self, text: str):
+        vec = [0.0] * self.dim
+        tokens = TOKEN_PATTERN.findall((text or "").lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            h = zlib.crc32(feature.encode("utf-8"))
+            vec[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        return _normalize(vec)
+
+    def embed(self, texts: list) -> list:
+        return [self._embed_one(t) for t in texts]
+
+
+class OllamaEmbedder:
+    """Embeddings from the OpenAI-compatible /v1/embeddings endpoint."""
+
+    def __init__(self, api_base: str, model: str = EMBEDDING_MODEL):
+        self.client = OpenAI(base_url=api_base, api_key="ollama")
+        self.model = model
+        self.name = f"ollama-{model}"
+        self.dim = None
+
+    def embed(self, texts: list) -> list:
+        with timing.span("llm.embeddings"), metrics.llm_latency.time("ollama", self.model, "embeddings"):
+            try:
+                response = self.client.embeddings.create(model=self.model, input=texts)
+            except Exception:
+                metrics.llm_errors.inc("ollama", self.model, "embeddings")
+                raise
+        metrics.record_llm_usage("ollama", self.model, getattr(response, "usage", None))
+        vectors = [_normalize(d.embedding) for d in response.data]
+        if vectors:
+            self.dim = len(vectors[0])
+        return vectors
+
+
+def get_embedder(db: Session):
+    if EMBEDDING_PROVIDER == "ollama":
+        settings = db.query(LLMSettings).first()
+        api_base = (settings.api_base if settings else None) or "http://localhost:11434/v1"
+        return OllamaEmbedder(api_base)
+    return HashingEmbedder()
+
+
+def profile_text(emp) -> str:
+    """Text that represents an employee in the semantic index."""
+    parts = [emp.search_phrase or "", emp.career_summary or ""]
+    if emp.tech:
+        parts.append(" ".join(t.get("tech", "") for t in emp.tech))
+    for h in emp.work_history or []:
+        parts.append(f"{h.role or ''} {h.project or ''} {h.description or ''}")
+    return "\n".join(p for p in parts if p.strip())
+
+
+class _MappedArray:
+    """Growable fixed-width array of one typecode backed by a memory-mapped file."""
+
+    def __init__(self, path: str, typecode: str, width: int):
+        self.path = path
+        self.typecode = typecode
+        self.width = width
+        self.itemsize = array(typecode).itemsize
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(b"\0" * self.itemsize * width * 64)
+        self._file = open(path, "r+b")
+        self._map()
+
+    def _map(self):
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self.view = memoryview(self._mmap).cast(self.typecode)
+        self.capacity = len(self.view) // self.width
+
+    def ensure_capacity(self, rows: int):
+        if rows <= self.capacity:
+            return
+        new_capacity = max(rows, self.capacity * 2)
+        self.view.release()
+        self._mmap.close()
+        self._file.truncate(new_capacity * self.width * self.itemsize)
+        self._map()
+
+    def refresh(self):
+        """Remaps the file if another process grew it."""
+        if os.fstat(self._file.fileno()).st_size != len(self._mmap):
+            self.view.release()
+            self._mmap.close()
+            self._map()
+
+    def row(self, i: int):
+        return self.view[i * self.width:(i + 1) * self.width]
+
+    def set_row(self, i: int, values):
+        self.view[i * self.width:(i + 1) * self.width] = array(self.typecode, values)
+
+    def flush(self):
+        self._mmap.flush()
+
+    def close(self):
+        self.view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class EmbeddingIndex:
+    """
+    Employee embeddings stored as a contiguous float32 matrix (one row per
+    employee) in a memory-mapped file, searched approximately with
+    random-hyperplane LSH and re-ranked exactly by cosine similarity.
+
+    Files in `directory`: vectors.f32 (rows x dim), signatures.u32
+    (rows x LSH_TABLES), ids.i32 (employee id per row, -1 = free), meta.json
+    and lock. Several processes (uvicorn workers) share the files: writes take
+    an exclusive flock on `lock`, reads a shared one, and every write bumps
+    meta["generation"]. A process that sees another generation reloads its
+    in-memory row map, free list and LSH buckets from the files first.
+    """
+
+    def __init__(self, directory: str, embedder_name: str, dim: int):
+        self.directory = directory
+        self.embedder_name = embedder_name
+        self.dim = dim
+        self.lock = threading.RLock()
+        self._lock_depth = 0
+        self._meta_stat = None
+        # Outbox offset this process has applied deletes up to (None = not read from meta yet)
+        self.change_position = None
+        self.checked_at = 0.0
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = open(os.path.join(directory, "lock"), "a")
+
+        rng = random.Random(42)
+        self.planes = [
+            [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(LSH_BITS)]
+            for _ in range(LSH_TABLES)
+        ]
+        with self._file_lock(exclusive=True):
+            meta = self._read_meta()
+            if meta.get("embedder") != embedder_name or meta.get("dim") != dim:
+                # Vectors from another model/dimension are not comparable
+                for name in ("vectors.f32", "signatures.u32", "ids.i32"):
+                    path = os.path.join(directory, name)
+                    if os.path.exists(path):
+                        os.remove(path)
+                meta = {"embedder": embedder_name, "dim": dim, "rows": 0,
+                        "generation": meta.get("generation", 0) + 1}
+            self.meta = meta
+
+            self.vectors = _MappedArray(os.path.join(directory, "vectors.f32"), "f", dim)
+            self.signatures = _MappedArray(os.path.join(directory, "signatures.u32"), "I", LSH_TABLES)
+            self.ids = _MappedArray(os.path.join(directory, "ids.i32"), "i", 1)
+            self._save_meta()
+            self._load_structures()
+
+    @property
+    def rows(self) -> int:
+        return self.meta["rows"]
+
+    @contextlib.contextmanager
+    def _file_lock(self, exclusive: bool):
+        """
+        Cross-process lock on the index files. flock belongs to the open file,
+        which the threads of a process share, so it is only taken under
+        self.lock and only by the outermost caller.
+        """
+        with self.lock:
+            if fcntl is None or self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    @contextlib.contextmanager
+    def writing(self):
+        """
+        Exclusive access for a batch of upserts/removes: reloads what other
+        processes wrote, and publishes one new generation at the end.
+        """
+        with self._file_lock(exclusive=True):
+            outermost = self._lock_depth == 1
+            if outermost:
+                self._sync()
+            yield
+            if outermost:
+                self.meta["generation"] = self.meta.get("generation", 0) + 1
+                self._save_meta()
+
+    @contextlib.contextmanager
+    def reading(self):
+        with self._file_lock(exclusive=False):
+            self._sync()
+            yield
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, "meta.json")
+
+    def _read_meta(self) -> dict:
+        try:
+            with open(self._meta_path()) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _stat_meta(self):
+        try:
+            st = os.stat(self._meta_path())
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _sync(self):
+        """Reloads the in-memory structures if another process changed the files."""
+        stat = self._stat_meta()
+        if stat == self._meta_stat:
+            return
+        meta = self._read_meta()
+        self._meta_stat = stat
+        if meta.get("generation") == self.meta.get("generation"):
+            return
+        if meta.get("embedder") != self.embedder_name or meta.get("dim") != self.dim:
+            # Another process reset the index for a different embedder; keep serving ours
+            logger.warning(f"Embedding index in {self.directory} now belongs to {meta.get('embedder')}")
+            return
+        self.meta = meta
+        for arr in (self.vectors, self.signatures, self.ids):
+            arr.refresh()
+        self._load_structures()
+
+    def _load_structures(self):
+        self.row_of = {}
+        self.free_rows = []
+        self.buckets = [dict() for _ in range(LSH_TABLES)]
+        for row in range(self.rows):
+            emp_id = self.ids.view[row]
+            if emp_id < 0:
+                self.free_rows.append(row)
+                continue
+            self.row_of[emp_id] = row
+            for t, sig in enumerate(self.signatures.row(row)):
+                self.buckets[t].setdefault(sig, set()).add(row)
+
+    def _signature(self, vec):
+        sigs = []
+        for planes in self.planes:
+            sig = 0
+            for bit, plane in enumerate(planes):
+                if sum(map(mul, plane, vec)) >= 0:
+                    sig |= 1 << bit
+            sigs.append(sig)
+        return sigs
+
+    def _save_meta(self):
+        # Replaced atomically: readers in other processes never see a partial file
+        path = self._meta_path()
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.meta, f)
+        os.replace(path + ".tmp", path)
+        self._meta_stat = self._stat_meta()
+
+    def __len__(self):
+        with self.reading():
+            return len(self.row_of)
+
+    def upsert(self, employee_id: int, vec):
+        sigs = self._signature(vec)
+        with self.writing():
+            row = self.row_of.get(employee_id)
+            if row is not None:
+                for t, old in enumerate(self.signatures.row(row)):
+                    self.buckets[t].get(old, set()).discard(row)
+            elif self.free_rows:
+                row = self.free_rows.pop()
+            else:
+                row = self.rows
+                self.meta["rows"] += 1
+                for arr in (self.vectors, self.signatures, self.ids):
+                    arr.ensure_capacity(self.rows)
+
+            self.vectors.set_row(row, vec)
+            self.signatures.set_row(row, sigs)
+            self.ids.set_row(row, [employee_id])
+            self.row_of[employee_id] = row
+            for t, sig in enumerate(sigs):
+                self.buckets[t].setdefault(sig, set()).add(row)
+
+    def remove(self, employee_id: int):
+        with self.writing():
+            row = self.row_of.pop(employee_id, None)
+            if row is None:
+                return
+            for t, sig in enumerate(self.signatures.row(row)):
+                self.buckets[t].get(sig, set()).discard(row)
+            self.ids.set_row(row, [-1])
+            self.free_rows.append(row)
+
+    def flush(self):
+        with self._file_lock(exclusive=False):
+            for arr in (self.vectors, self.signatures, self.ids):
+                arr.flush()
+
+    def _candidate_rows(self, vec):
+        if len(self.row_of) <= EXACT_SCAN_ROWS:
+            return list(self.row_of.values())
+        rows = set()
+        for t, sig in enumerate(self._signature(vec)):
+            table = self.buckets[t]
+            rows |= table.get(sig, set())
+            # Multi-probe: neighbouring buckets one bit away
+            for bit in range(LSH_BITS):
+                rows |= table.get(sig ^ (1 << bit), set())
+        return rows
+
+    def search(self, vec, k: int = 50, min_score: float = 0.0) -> list:
+        """Approximate top-k as [(employee_id, cosine similarity)], best first."""
+        with self.reading():
+            scored = []
+            for row in self._candidate_rows(vec):
+                score = sum(map(mul, vec, self.vectors.row(row)))
+                if score >= min_score:
+                    scored.append((score, self.ids.view[row]))
+        scored.sort(reverse=True)
+        return [(emp_id, score) for score, emp_id in scored[:k]]
+
+    def similarities(self, vec, employee_ids) -> dict:
+        """Exact cosine similarity for the given employees (missing ones omitted)."""
+        with self.reading():
+            result = {}
+            for emp_id in employee_ids:
+                row = self.row_of.get(emp_id)
+                if row is not None:
+                    result[emp_id] = sum(map(mul, vec, self.vectors.row(row)))
+            return result
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            for arr in (self.vectors, self.signatures, self.ids):
+                arr.close()
+            self._lock_file.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index(db: Session, embedder=None) -> EmbeddingIndex:
+    """Opens (and on first use, builds) the process-wide employee embedding index."""
+    global _index
+    embedder = embedder or get_embedder(db)
+    with _index_lock:
+        if _index is None or _index.embedder_name != embedder.name:
+            dim = embedder.dim
+            if dim is None:
+                dim = len(embedder.embed(["dimension probe"])[0])
+            if _index is not None:
+                _index.close()
+            _index = EmbeddingIndex(EMBEDDING_INDEX_DIR, embedder.name, dim)
+            if len(_index) == 0:
+                rebuild_index(db, _index, embedder)
+        if time.monotonic() - _index.checked_at >= EMBEDDING_SYNC_INTERVAL:
+            apply_deletes(db, _index)
+        return _index
+
+
+def apply_deletes(db: Session, index: EmbeddingIndex):
+    """
+    Removes employees deleted since meta["outbox_position"]. A process that
+    deletes an employee without the index open only records the outbox DELETE;
+    the position is saved with the removals, so any process catches up.
+    """
+    position = index.change_position
+    if position is None:
+        with index.reading():
+            position = index.meta.get("outbox_position", 0)
+    while True:
+        changes = outbox.read_changes(db, position)
+        if not changes:
+            break
+        position = changes[-1].id
+        deleted = [employee_id for employee_id, op in outbox.latest_by_employee(changes).items()
+                   if op == outbox.DELETE]
+        if deleted:
+            with index.writing():
+                for employee_id in deleted:
+                    index.remove(employee_id)
+                index.meta["outbox_position"] = max(position, index.meta.get("outbox_position", 0))
+            index.flush()
+        if len(changes) < outbox.OUTBOX_BATCH_SIZE:
+            break
+    index.change_position = position
+    index.checked_at = time.monotonic()
+
+
+def rebuild_index(db: Session, index: EmbeddingIndex, embedder, batch_size: int = 64):
+    # Read first: employees deleted during the scan are removed by the next apply_deletes
+    position = outbox.latest_position(db)
+    employees = db.query(Employee).options(selectinload(Employee.work_history)).yield_per(batch_size)
+    batch = []
+    for emp in employees:
+        batch.append(emp)
+        if len(batch) >= batch_size:
+            _index_batch(index, embedder, batch)
+            batch = []
+    if batch:
+        _index_batch(index, embedder, batch)
+    with index.writing():
+        index.meta["outbox_position"] = position
+    index.change_position = position
+    index.flush()
+    logger.info(f"Embedding index built with {len(index)} employees ({embedder.name})")
+
+
+def _index_batch(index, embedder, employees):
+    vectors = embedder.embed([profile_text(e) for e in employees])
+    with index.writing():
+        for emp, vec in zip(employees, vectors):
+            index.upsert(emp.id, vec)
+
+
+def update_employee_embedding(db: Session, employee):
+    """Re-embeds one employee after a write. Failures never break the save."""
+    try:
+        embedder = get_embedder(db)
+        index = get_index(db, embedder)
+        index.upsert(employee.id, embedder.embed([profile_text(employee)])[0])
+        index.flush()
+    except Exception as e:
+        logger.error(f"Embedding update failed for {employee.emp_id}: {e}")
+
+
+def remove_employee_embedding(employee_id: int):
+    """
+    Drops a deleted employee from this process's index, if it has one open.
+    Never opens or builds the index: other processes and later opens apply
+    the outbox DELETE the caller recorded (apply_deletes).
+    """
+    if _index is None:
+        return
+    try:
+        _index.remove(employee_id)
+        _index.flush()
+    except Exception as e:
+        logger.error(f"Embedding removal failed for employee {employee_id}: {e}")
+
+
+def embed_query(db: Session, text: str):
+    """Returns (index, query vector) for a free-text query or JD."""
+    embedder = get_embedder(db)
+    index = get_index(db, embedder)
+    return index, embedder.embed([text])[0]
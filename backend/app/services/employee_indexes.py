@@ -0,0 +1,22 @@
+from . import filter_index, search_cache, search_snapshot, suggest_index, trigram_index
+
+
+def _indexes():
+    # Looked up per call so a swapped-in index (tests, reloads) receives the writes
+    return (filter_index.index, suggest_index.index, trigram_index.index)
+
+
+def upsert(row):
+    """Applies a committed employee write to this worker's in-memory indexes."""
+    for index in _indexes():
+        index.upsert(row)
+    search_cache.cache.bump()
+    # The shared snapshot is rebuilt by whichever worker holds the builder lock
+    search_snapshot.builder.notify()
+
+
+def remove(employee_id: int):
+    for index in _indexes():
+        index.remove(employee_id)
+    search_cache.cache.bump()
+    search_snapshot.builder.notify()
@@ -0,0 +1,416 @@
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+from ..models.employee import Employee
+from . import outbox, skill_aliases
+
+logger = logging.getLogger(__name__)
+
+# In-process bitmap index over the low-cardinality employee columns
+FILTER_INDEX_ENABLED = os.getenv("FILTER_INDEX_ENABLED", "true").lower() == "true"
+# Seconds between catch-up queries for writes made by other workers/processes
+FILTER_INDEX_SYNC_INTERVAL = float(os.getenv("FILTER_INDEX_SYNC_INTERVAL", "5"))
+
+# Bucket lower bounds for the range columns; ">= x" ORs the whole buckets above x and,
+# inside the bucket that contains x, the per-value bitmaps of values >= x
+BANDWIDTH_BUCKETS = tuple(range(0, 101, 5))
+EXPERIENCE_BUCKETS = tuple(range(0, 41))
+
+# Tech skills listed in the facet counts (the most frequent in the result set)
+FACET_TOP_TECH = int(os.getenv("FACET_TOP_TECH", "10"))
+# Bandwidth facet ranges; each is a union of whole BANDWIDTH_BUCKETS. Unset and negative
+# bandwidths, which no "bandwidth >= x" filter from 0 up returns, are counted as "unknown".
+FACET_BANDWIDTH_BUCKETS = (0, 25, 50, 75, 100)
+UNKNOWN_BANDWIDTH = "unknown"
+
+_CHUNK_BYTES = 512
+
+FIELDS = ("status", "work_mode", "location", "level", "bandwidth", "experience")
+# tech is multi-valued: an employee's bit is set under every skill they list
+INDEXED_FIELDS = FIELDS + ("bandwidth_value", "experience_value", "tech")
+FACET_FIELDS = ("status", "work_mode", "location", "level", "tech", "bandwidth")
+COLUMNS = (Employee.id, Employee.name, Employee.status, Employee.work_mode, Employee.location, Employee.level,
+           Employee.bandwidth, Employee.experience_years, Employee.tech, Employee.last_updated)
+
+
+def bitmap_from_ids(ids) -> int:
+    """Builds a bitset (bit n set = employee id n) in one pass instead of n big-int ORs."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    buf = bytearray(max(ids) // 8 + 1)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def bitmap_ids(bitmap: int, skip: int = 0, limit: int = None) -> list:
+    """Set bit positions in ascending order, optionally paged."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    ids = []
+    # Whole chunks before the page are skipped by popcount alone
+    for base in range(0, len(data), _CHUNK_BYTES):
+        chunk = int.from_bytes(data[base:base + _CHUNK_BYTES], "little")
+        if not chunk:
+            continue
+        count = chunk.bit_count()
+        if skip >= count:
+            skip -= count
+            continue
+        bits = bin(chunk)[:1:-1]  # bit 0 first
+        pos = bits.find("1")
+        while pos != -1:
+            if skip:
+                skip -= 1
+            else:
+                ids.append(base * 8 + pos)
+                if limit is not None and len(ids) >= limit:
+                    return ids
+            pos = bits.find("1", pos + 1)
+    return ids
+
+
+def _bucket(bounds: tuple, value) -> int:
+    return bisect.bisect_right(bounds, value) - 1
+
+
+def _enum_value(value):
+    return getattr(value, "value", value)
+
+
+def _each(key):
+    return key if isinstance(key, frozenset) else (key,)
+
+
+def _tech_keys(row) -> frozenset:
+    """Comparison keys (normalized canonical names) of the skills in row.tech."""
+    keys = skill_aliases.current().keys
+    return frozenset(keys[name] for name in (entry.get("tech") for entry in row.tech or []) if name and name.strip())
+
+
+def _bandwidth_label(bucket: int) -> str:
+    low = FACET_BANDWIDTH_BUCKETS[bucket]
+    if bucket + 1 == len(FACET_BANDWIDTH_BUCKETS):
+        return str(low)
+    return f"{low}-{FACET_BANDWIDTH_BUCKETS[bucket + 1] - 1}"
+
+
+def _keys(row) -> dict:
+    """Index key per field for one employee row (None = not indexed for that field)."""
+    return {
+        "status": _enum_value(row.status),
+        "work_mode": _enum_value(row.work_mode),
+        "location": (row.location or "").strip().lower() or None,
+        "level": row.level,
+        "bandwidth": _bucket(BANDWIDTH_BUCKETS, row.bandwidth) if row.bandwidth is not None else None,
+        "experience": _bucket(EXPERIENCE_BUCKETS, row.experience_years) if row.experience_years is not None else None,
+        "bandwidth_value": row.bandwidth,
+        "experience_value": row.experience_years,
+        "tech": _tech_keys(row) or None,
+    }
+
+
+def _text(row) -> tuple:
+    """
+    (name, tech JSON) lowercased, for the substring name/tech filters; the
+    SQL filters ilike the same name and the tech column cast to text.
+    """
+    return (row.name or "").lower(), json.dumps(row.tech).lower() if row.tech is not None else ""
+
+
+def _add_labels(labels: dict, row, keys: dict):
+    """Display names for normalized keys not seen before: trimmed location, canonical skill name."""
+    location = keys["location"]
+    if location is not None and location not in labels["location"]:
+        labels["location"][location] = row.location.strip()
+    tech = keys["tech"]
+    if tech and not tech <= labels["tech"].keys():
+        table = skill_aliases.current()
+        for entry in row.tech:
+            name = entry.get("tech")
+            if name and name.strip():
+                labels["tech"].setdefault(table.keys[name], table.names[name])
+
+
+def _facet_list(counts: dict, top: int = None) -> list:
+    """[{"value", "count"}] most frequent first, zero counts dropped."""
+    ranked = sorted(((value, n) for value, n in counts.items() if n), key=lambda vn: (-vn[1], str(vn[0])))
+    return [{"value": value, "count": n} for value, n in ranked[:top]]
+
+
+def _bandwidth_facets(counts: list, unknown: int) -> list:
+    """Per-FACET_BANDWIDTH_BUCKETS counts in range order then "unknown", empty ranges included."""
+    facets = [{"value": _bandwidth_label(b), "count": n} for b, n in enumerate(counts)]
+    facets.append({"value": UNKNOWN_BANDWIDTH, "count": unknown})
+    return facets
+
+
+def count_facets(rows) -> dict:
+    """
+    Facet counts over loaded rows (COLUMNS attributes or Employee objects) in
+    one pass; same output as FilterIndex.facets. Used when the result set is
+    already in memory or the index is disabled.
+    """
+    counts = {field: {} for field in FACET_FIELDS}
+    labels = {"location": {}, "tech": {}}
+    bandwidth, unknown = [0] * len(FACET_BANDWIDTH_BUCKETS), 0
+    for row in rows:
+        keys = _keys(row)
+        _add_labels(labels, row, keys)
+        for field in ("status", "work_mode", "location", "level", "tech"):
+            for key in _each(keys[field]):
+                if key is not None:
+                    counts[field][key] = counts[field].get(key, 0) + 1
+        if row.bandwidth is not None and row.bandwidth >= 0:
+            bandwidth[_bucket(FACET_BANDWIDTH_BUCKETS, row.bandwidth)] += 1
+        else:
+            unknown += 1
+    for field, names in labels.items():
+        counts[field] = {names.get(key, key): n for key, n in counts[field].items()}
+    facets = {field: _facet_list(counts[field]) for field in ("status", "work_mode", "location", "level")}
+    facets["tech"] = _facet_list(counts["tech"], FACET_TOP_TECH)
+    facets["bandwidth"] = _bandwidth_facets(bandwidth, unknown)
+    return facets
+
+
+class SyncedIndex:
+    """
+    Base for the per-worker in-memory indexes over employees. Subclasses
+    implement build(rows), upsert(row), remove(id) and __len__ over rows with
+    the `columns` attributes, and call _track(row) for every row indexed;
+    ensure_fresh builds on first use and catches up on other workers' writes.
+    """
+
+    name = "Filter index"
+    columns = COLUMNS
+    sync_interval = FILTER_INDEX_SYNC_INTERVAL
+    # Seconds between full rebuilds, for changes the catch-up query cannot see (None = never)
+    rebuild_interval = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.built = False
+        self.built_at = 0.0
+        self.synced_at = 0.0
+        self.watermark = None
+        self.max_id = 0
+        self.change_position = 0  # last employee_changes id applied
+
+    def _track(self, row):
+        if row.last_updated is not None and (self.watermark is None or row.last_updated > self.watermark):
+            self.watermark = row.last_updated
+        self.max_id = max(self.max_id, row.id)
+
+    def ensure_fresh(self, db: Session, force: bool = False):
+        """Builds on first use, then picks up other writers' changes every sync_interval seconds."""
+        if self.built and not force and time.monotonic() - self.synced_at < self.sync_interval:
+            return
+        # One thread catches up at a time; others keep using the current index
+        if not self._sync_lock.acquire(blocking=not self.built):
+            return
+        try:
+            self._sync(db, force)
+        finally:
+            self._sync_lock.release()
+
+    def _rebuild(self, db: Session):
+        started = time.perf_counter()
+        # Built on the side and swapped in, so searches keep the old index meanwhile;
+        # writes applied to the old one are picked up again by the next catch-up
+        fresh = type(self)()
+        # Read first: changes committed during the build are applied again, never skipped
+        position = outbox.latest_position(db)
+        fresh.build(db.execute(select(*self.columns)).all())
+        fresh.change_position = position
+        state = {k: v for k, v in vars(fresh).items() if k not in ("_lock", "_sync_lock")}
+        with self._lock:
+            vars(self).update(state)
+        logger.info(f"{self.name} built: {len(self)} employees in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    def _sync(self, db: Session, force: bool):
+        expired = self.rebuild_interval is not None and time.monotonic() - self.built_at >= self.rebuild_interval
+        if not self.built or force or expired:
+            self._rebuild(db)
+            return
+
+        changed = Employee.id > self.max_id
+        if self.watermark is not None:
+            changed = or_(changed, Employee.last_updated >= self.watermark)
+        for row in db.execute(select(*self.columns).where(changed)).all():
+            self.upsert(row)
+        self._apply_changes(db)
+        # Writes made without an outbox record (scripts, manual SQL): a count mismatch means a rebuild
+        if db.execute(select(func.count(Employee.id))).scalar() != len(self):
+            self._rebuild(db)
+        self.synced_at = time.monotonic()
+
+    def _apply_changes(self, db: Session):
+        """Applies the outbox changes since change_position: deletes, and updates the watermark misses."""
+        while True:
+            changes = outbox.read_changes(db, self.change_position)
+            if not changes:
+                return
+            latest = outbox.latest_by_employee(changes)
+            ids = [employee_id for employee_id, op in latest.items() if op != outbox.DELETE]
+            rows = db.execute(select(*self.columns).where(Employee.id.in_(ids))).all() if ids else []
+            for row in rows:
+                self.upsert(row)
+            found = {row.id for row in rows}
+            for employee_id in latest.keys() - found:
+                self.remove(employee_id)
+            self.change_position = changes[-1].id
+            if len(changes) < outbox.OUTBOX_BATCH_SIZE:
+                return
+
+
+class FilterIndex(SyncedIndex):
+    """
+    key -> bitset of employee ids for each field in FIELDS. The range fields
+    are indexed twice: by bucket, and by exact value to resolve the one bucket
+    a ">=" bound falls inside. tech is indexed per skill, for facet counts.
+    Kept current by upsert/remove from this worker's write paths and by
+    ensure_fresh, which catches up on writes made elsewhere.
+    """
+
+    def _reset(self):
+        super()._reset()
+        self.bitmaps = {field: {} for field in INDEXED_FIELDS}
+        self.keys = {}  # id -> _keys(row), to clear old bits on update/remove
+        self.text = {}  # id -> _text(row); substring filters scan these
+        self.labels = {"location": {}, "tech": {}}  # normalized key -> display name, for facets
+        self.all = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def build(self, rows):
+        ids_by_key = {field: {} for field in INDEXED_FIELDS}
+        with self._lock:
+            self._reset()
+            for row in rows:
+                keys = _keys(row)
+                self.keys[row.id] = keys
+                self.text[row.id] = _text(row)
+                for field, key in keys.items():
+                    for value in _each(key):
+                        if value is not None:
+                            ids_by_key[field].setdefault(value, []).append(row.id)
+                _add_labels(self.labels, row, keys)
+                self._track(row)
+            for field, values in ids_by_key.items():
+                self.bitmaps[field] = {key: bitmap_from_ids(ids) for key, ids in values.items()}
+            self.all = bitmap_from_ids(self.keys)
+            self.built = True
+            self.built_at = self.synced_at = time.monotonic()
+
+    def upsert(self, row):
+        """Indexes (or re-indexes) one employee; row needs the COLUMNS attributes."""
+        with self._lock:
+            if not self.built:
+                return
+            self._remove(row.id)
+            keys = _keys(row)
+            bit = 1 << row.id
+            for field, key in keys.items():
+                for value in _each(key):
+                    if value is not None:
+                        bitmaps = self.bitmaps[field]
+                        bitmaps[value] = bitmaps.get(value, 0) | bit
+            self.keys[row.id] = keys
+            self.text[row.id] = _text(row)
+            _add_labels(self.labels, row, keys)
+            self.all |= bit
+            self._track(row)
+
+    def remove(self, employee_id: int):
+        with self._lock:
+            self._remove(employee_id)
+
+    def _remove(self, employee_id: int):
+        keys = self.keys.pop(employee_id, None)
+        if keys is None:
+            return
+        del self.text[employee_id]
+        bit = 1 << employee_id
+        for field, key in keys.items():
+            for value in _each(key):
+                if value is not None:
+                    bitmaps = self.bitmaps[field]
+                    remaining = bitmaps[value] & ~bit
+                    if remaining:
+                        bitmaps[value] = remaining
+                    else:
+                        del bitmaps[value]
+        self.all &= ~bit
+
+    def _at_least(self, field: str, bounds: tuple, value: float, candidates: int) -> int:
+        """Ids in candidates whose field is >= value."""
+        boundary = _bucket(bounds, value)
+        result = 0
+        for bucket, bitmap in self.bitmaps[field].items():
+            if bucket > boundary or (bucket == boundary and bounds[bucket] == value):
+                result |= bitmap
+        if boundary < 0 or bounds[boundary] != value:
+            # Only values inside the bucket that contains value need looking at
+            upper = bounds[boundary + 1] if boundary + 1 < len(bounds) else float("inf")
+            for exact, bitmap in self.bitmaps[f"{field}_value"].items():
+                if value <= exact < upper:
+                    result |= bitmap
+        return result & candidates
+
+    def match(self, status=None, work_mode=None, location=None, level=None,
+              bandwidth=None, experience=None, name=None, tech=None) -> int:
+        """
+        Bitset of employees matching every given filter (same semantics as the
+        SQL filters). name and tech are case-insensitive substrings, checked
+        row by row, so they cost one pass over the index.
+        """
+        with self._lock:
+            result = self.all
+            for field, key in (("status", _enum_value(status)), ("work_mode", _enum_value(work_mode)),
+                               ("location", location.strip().lower() if location else None), ("level", level)):
+                if key is not None:
+                    result &= self.bitmaps[field].get(key, 0)
+            if bandwidth is not None:
+                result = self._at_least("bandwidth", BANDWIDTH_BUCKETS, bandwidth, result)
+            if experience is not None:
+                result = self._at_least("experience", EXPERIENCE_BUCKETS, experience, result)
+            if name or tech:
+                name, tech = (name or "").lower(), (tech or "").lower()
+                result &= bitmap_from_ids(emp_id for emp_id, (emp_name, emp_tech) in self.text.items()
+                                          if name in emp_name and tech in emp_tech)
+            return result
+
+    def facets(self, bitmap: int) -> dict:
+        """
+        Facet counts for the employees in bitmap: one AND + popcount per
+        indexed value, so the cost depends on the number of distinct values,
+        not on the size of the result set.
+        """
+        with self._lock:
+            facets = {}
+            for field in ("status", "work_mode", "location", "level", "tech"):
+                labels = self.labels.get(field, {})
+                counts = {labels.get(key, key): (ids & bitmap).bit_count()
+                          for key, ids in self.bitmaps[field].items()}
+                facets[field] = _facet_list(counts, FACET_TOP_TECH if field == "tech" else None)
+            bandwidth = [0] * len(FACET_BANDWIDTH_BUCKETS)
+            for bucket, ids in self.bitmaps["bandwidth"].items():
+                if bucket >= 0:
+                    bandwidth[_bucket(FACET_BANDWIDTH_BUCKETS, BANDWIDTH_BUCKETS[bucket])] += (ids & bitmap).bit_count()
+            # Unset bandwidths are not indexed and negative ones sit in bucket -1
+            unknown = (bitmap & self.all).bit_count() - sum(bandwidth)
+            facets["bandwidth"] = _bandwidth_facets(bandwidth, unknown)
+            return facets
+
+
+index = FilterIndex()
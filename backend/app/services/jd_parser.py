@@ -0,0 +1,278 @@
+import os
+import re
+import time
+import logging
+from collections import Counter
+from sqlalchemy.orm import Session
+from ..models.employee import Employee
+from . import metrics, skill_aliases
+
+logger = logging.getLogger(__name__)
+
+# Parser modes for LLMService.parse_jd:
+#   local  - deterministic extraction only, never calls the LLM
+#   llm    - always call the LLM (previous behaviour)
+#   hybrid - local first, LLM only enriches JDs the local pass could not resolve
+JD_PARSER_MODES = ("local", "llm", "hybrid")
+JD_PARSER_MODE = os.getenv("JD_PARSER_MODE", "hybrid").lower()
+
+# Seconds before the skill dictionary is rebuilt from the employees table
+SKILL_DICTIONARY_TTL = int(os.getenv("JD_SKILL_DICTIONARY_TTL", "300"))
+
+# "5+ years", "5 + yrs", "4-6 years", "minimum 4 years", "at least 3 years", "min. 2 yrs"
+EXPERIENCE_PATTERNS = [
+    re.compile(r"\b(?:minimum|min\.?|at\s+least|atleast)\s+(?:of\s+)?(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)\b", re.I),
+    re.compile(r"\b(\d+(?:\.\d+)?)\s*(?:-|to|–)\s*\d+(?:\.\d+)?\s*(?:years?|yrs?)\b", re.I),
+    re.compile(r"\b(\d+(?:\.\d+)?)\s*\+\s*(?:years?|yrs?)\b", re.I),
+    re.compile(r"\b(\d+(?:\.\d+)?)\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)\b", re.I),
+]
+
+KEYWORD_PATTERN = re.compile(r"\b[a-z][a-z0-9+#.]{2,}\b")
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+doing for from had has have having he her here how i if in into is it its job looking may me more
+most must need needs new not of on one or our out over own per role should so some such team than
+that the their them then there these they this those through to under until up very via want was
+we well were what when where which while who will with within work would you your years year yrs
+experience required requirements responsibilities candidate candidates strong good excellent ability
+plus preferred minimum least etc using based knowledge skills skill hands understanding working
+""".split())
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher. Finds every dictionary term in a text in a single
+    pass, regardless of how many terms the dictionary holds.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pattern)
+
+    def _build(self):
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """Yields (end_index, pattern) for every occurrence of every pattern."""
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for pattern in out[node]:
+                    yield i, pattern
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+class SkillDictionary:
+    """
+    Known skill names (from employee tech stacks) compiled into an automaton.
+    With an alias table, skills are reported by canonical name and every alias
+    ("k8s", "postgres") is recognised as its canonical skill.
+    """
+
+    def __init__(self, skills, aliases: skill_aliases.SkillAliasTable = None):
+        # lowercase term -> most common display spelling
+        self.display = {}
+        counts = Counter()
+        for skill in skills:
+            name = (skill or "").strip()
+            if len(name) < 2:
+                continue
+            counts[aliases.canonical(name) if aliases else name] += 1
+        for name, _ in counts.most_common():
+            self.display.setdefault(name.lower(), name)
+        if aliases:
+            for alias, canonical in aliases.aliases.items():
+                self.display.setdefault(skill_aliases.normalize(alias), canonical)
+        self.automaton = AhoCorasick(self.display.keys())
+
+    @classmethod
+    def from_db(cls, db: Session, aliases: skill_aliases.SkillAliasTable = None) -> "SkillDictionary":
+        skills = []
+        for (tech,) in db.query(Employee.tech).filter(Employee.tech.isnot(None)).all():
+            for t in tech or []:
+                if isinstance(t, dict) and t.get("tech"):
+                    skills.append(t["tech"])
+        return cls(skills, aliases)
+
+    def find(self, text: str) -> list:
+        """Returns display names of skills present in text, in order of first mention."""
+        lowered = text.lower()
+        found = {}
+        for end, term in self.automaton.iter_matches(lowered):
+            start = end - len(term) + 1
+            if _is_boundary(lowered, start - 1) and _is_boundary(lowered, end + 1):
+                found.setdefault(term, start)
+        # Drop terms fully contained in a longer match ("java" inside "java ee")
+        terms = sorted(found, key=lambda t: (found[t], -len(t)))
+        result, covered_until = [], -1
+        for term in terms:
+            start = found[term]
+            if start + len(term) - 1 <= covered_until:
+                continue
+            # "postgres ... postgresql" both resolve to PostgreSQL
+            if self.display[term] not in result:
+                result.append(self.display[term])
+            covered_until = max(covered_until, start + len(term) - 1)
+        return result
+
+
+_dictionary_cache = {"dictionary": None, "built_at": 0.0, "aliases": None}
+
+
+def get_skill_dictionary(db: Session) -> SkillDictionary:
+    aliases = skill_aliases.refresh(db)
+    cached = _dictionary_cache["dictionary"]
+    if (cached is not None and _dictionary_cache["aliases"] is aliases
+            and time.monotonic() - _dictionary_cache["built_at"] < SKILL_DICTIONARY_TTL):
+        metrics.record_cache("skill_dictionary", True)
+        return cached
+    metrics.record_cache("skill_dictionary", False)
+    dictionary = SkillDictionary.from_db(db, aliases)
+    _dictionary_cache["dictionary"] = dictionary
+    _dictionary_cache["built_at"] = time.monotonic()
+    _dictionary_cache["aliases"] = aliases
+    return dictionary
+
+
+def invalidate_skill_dictionary():
+    """Forces the next parse to rebuild the dictionary (call after tech changes)."""
+    _dictionary_cache["dictionary"] = None
+
+
+def extract_min_experience(jd_text: str):
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(jd_text)
+        if match:
+            value = float(match.group(1))
+            return int(value) if value.is_integer() else value
+    return None
+
+
+def extract_keywords(jd_text: str, skills: list, limit: int = 20) -> list:
+    skill_terms = {s.lower() for s in skills}
+    keywords = []
+    for token in KEYWORD_PATTERN.findall(jd_text.lower()):
+        token = token.rstrip(".")
+        if token in STOPWORDS or token in skill_terms or token in keywords or len(token) < 3:
+            continue
+        keywords.append(token)
+        if len(keywords) >= limit:
+            break
+    return keywords
+
+
+def parse_jd_locally(jd_text: str, dictionary: SkillDictionary) -> dict:
+    """Same output shape as LLMService.parse_jd_with_llm, without the LLM."""
+    skills = dictionary.find(jd_text)
+    return {
+        "required_skills": skills,
+        "minimum_experience_years": extract_min_experience(jd_text),
+        "keywords": extract_keywords(jd_text, skills),
+    }
+
+
+def canonicalize_parsed(parsed: dict) -> dict:
+    """LLM output with required_skills mapped to canonical names (duplicates dropped)."""
+    skills = []
+    for skill in parsed.get("required_skills") or []:
+        skill = skill_aliases.canonical(skill)
+        if skill and skill not in skills:
+            skills.append(skill)
+    return {**parsed, "required_skills": skills}
+
+
+def merge_parsed_jd(local: dict, llm: dict) -> dict:
+    """Local results win; the LLM only adds what the local pass did not find."""
+    skills = list(local.get("required_skills") or [])
+    seen = {s.lower() for s in skills}
+    for skill in llm.get("required_skills") or []:
+        skill = skill_aliases.canonical(skill)
+        if skill and skill.lower() not in seen:
+            skills.append(skill)
+            seen.add(skill.lower())
+
+    keywords = list(local.get("keywords") or [])
+    for kw in llm.get("keywords") or []:
+        if kw and kw.lower() not in keywords:
+            keywords.append(kw.lower())
+
+    min_exp = local.get("minimum_experience_years")
+    if min_exp is None:
+        min_exp = llm.get("minimum_experience_years")
+
+    return {"required_skills": skills, "minimum_experience_years": min_exp, "keywords": keywords}
+
+
+def compare_with_llm(cases: list, dictionary: SkillDictionary) -> dict:
+    """
+    Accuracy of the local parser against cached LLM outputs.
+    cases: [{"jd": str, "llm": {required_skills, minimum_experience_years, keywords}}]
+    """
+    tp = fp = fn = 0
+    exp_correct = 0
+    elapsed = 0.0
+    per_case = []
+    for case in cases:
+        start = time.perf_counter()
+        local = parse_jd_locally(case["jd"], dictionary)
+        elapsed += time.perf_counter() - start
+
+        expected = {s.lower() for s in case["llm"].get("required_skills") or []}
+        got = {s.lower() for s in local["required_skills"]}
+        tp += len(expected & got)
+        fp += len(got - expected)
+        fn += len(expected - got)
+        exp_match = local["minimum_experience_years"] == case["llm"].get("minimum_experience_years")
+        exp_correct += exp_match
+        per_case.append({
+            "missing": sorted(expected - got),
+            "extra": sorted(got - expected),
+            "experience_match": exp_match,
+        })
+
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return {
+        "cases": len(cases),
+        "skill_precision": round(precision, 3),
+        "skill_recall": round(recall, 3),
+        "experience_accuracy": round(exp_correct / len(cases), 3) if cases else 1.0,
+        "avg_parse_us": round(elapsed / len(cases) * 1e6, 1) if cases else 0.0,
+        "details": per_case,
+    }
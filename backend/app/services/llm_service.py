@@ -4,6 +4,10 @@ import logging
 from openai import OpenAI
 from ..models.llm_settings import LLMSettings
 from sqlalchemy.orm import Session
+from . import jd_parser, timing, metrics, skill_aliases
+
+# Share of the JD match score taken by embedding similarity (when available)
+JD_SIMILARITY_WEIGHT = float(os.getenv("JD_SIMILARITY_WEIGHT", "0.15"))
 
 class LLMService:
     def __init__(self, db: Session):
@@ -21,6 +25,22 @@ class LLMService:
                 return None
         return self._settings
 
+    def _chat_completion(self, client: OpenAI, operation: str, **kwargs):
+        """
+        Every chat completion goes through here so it is timed as llm.<operation>
+        and counted in the LLM latency/token/error metrics.
+        """
+        provider = self.settings.provider.lower() if self.settings else "unknown"
+        model = kwargs.get("model", "unknown")
+        with timing.span(f"llm.{operation}"), metrics.llm_latency.time(provider, model, operation):
+            try:
+                response = client.chat.completions.create(**kwargs)
+            except Exception:
+                metrics.llm_errors.inc(provider, model, operation)
+                raise
+        metrics.record_llm_usage(provider, model, getattr(response, "usage", None))
+        return response
+
     def generate_profile(self, partial_data: str) -> dict:
         if not self.settings:
             return self._generate_mock_profile(partial_data)
@@ -87,6 +107,34 @@ class LLMService:
         
         return "\n".join(lines)
 
+    def generate_search_phrase_llm(self, profile_data: dict) -> str:
+        """
+        Keyword-dense one-sentence phrase from the configured LLM.
+        Falls back to the deterministic phrase when no LLM is available.
+        """
+        if not self.settings:
+            return self.generate_search_phrase(profile_data)
+        provider = self.settings.provider.lower()
+
+        if provider == "ollama":
+            client = OpenAI(base_url=self.settings.api_base or "http://localhost:11434/v1", api_key="ollama")
+        elif provider == "openai" and os.getenv("OPENAI_API_KEY"):
+            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        else:
+            return self.generate_search_phrase(profile_data)
+
+        try:
+            response = self._chat_completion(
+                client, "search_phrase",
+                model=self.settings.model_name,
+                messages=[{"role": "user", "content": self._get_search_phrase_prompt(profile_data)}],
+                temperature=0,
+            )
+            return response.choices[0].message.content.strip().strip('"')
+        except Exception as e:
+            self.logger.error(f"Search phrase LLM error: {e}")
+            return self.generate_search_phrase(profile_data)
+
     def generate_profile_summary(self, profile_data: dict) -> str:
         if not self.settings:
             return self._generate_mock_summary(profile_data)
@@ -103,6 +151,26 @@ class LLMService:
         else:
              return self._generate_mock_summary(profile_data)
 
+    def parse_jd(self, jd_text: str, mode: str = None) -> dict:
+        """
+        Extract structured info from JD according to JD_PARSER_MODE:
+        local (dictionary + regex only), llm (parse_jd_with_llm), or hybrid
+        (local first, LLM enrichment only when no skills were recognised).
+        """
+        mode = (mode or jd_parser.JD_PARSER_MODE).lower()
+        if mode not in jd_parser.JD_PARSER_MODES:
+            self.logger.warning(f"Unknown JD parser mode '{mode}', using hybrid")
+            mode = "hybrid"
+
+        if mode == "llm":
+            return jd_parser.canonicalize_parsed(self.parse_jd_with_llm(jd_text))
+
+        with timing.span("jd.local_parse"):
+            local = jd_parser.parse_jd_locally(jd_text, jd_parser.get_skill_dictionary(self.db))
+        if mode == "local" or local["required_skills"]:
+            return local
+        return jd_parser.merge_parsed_jd(local, self.parse_jd_with_llm(jd_text))
+
     def parse_jd_with_llm(self, jd_text: str) -> dict:
         """
         Extract structured info from JD using qwen3 (via Ollama).
@@ -155,7 +223,8 @@ JD CONTENT:
 """
         
         try:
-            response = client.chat.completions.create(
+            response = self._chat_completion(
+                client, "parse_jd",
                 model="qwen3", # Hardcoded model as per requirement
                 messages=[
                     {"role": "user", "content": prompt}
@@ -168,7 +237,7 @@ JD CONTENT:
             self.logger.error(f"JD Parsing Error: {e}")
             return {"required_skills": [], "minimum_experience_years": None, "keywords": []}
 
-    def compute_match_score(self, profile, parsed_jd: dict) -> dict:
+    def compute_match_score(self, profile, parsed_jd: dict, jd_similarity: float = None) -> dict:
         """
         Scoring logic:
         skill_score = (matched_skills / required_skills) * 0.4
@@ -176,14 +245,18 @@ JD CONTENT:
         bandwidth_score = 0.2 if bandwidth > 0 else 0
         project_score = normalized project count * 0.1
         client_score = normalized active client count (less overload preferred) * 0.1
+        If jd_similarity (embedding cosine, JD vs profile) is given, it is blended in
+        with weight JD_SIMILARITY_WEIGHT.
         """
-        required_skills = [s.lower() for s in parsed_jd.get("required_skills", [])]
+        # Skills compare by canonical name, so "Postgres" matches "PostgreSQL"
+        skill_keys = skill_aliases.current().keys
+        required_skills = [skill_keys[s] for s in parsed_jd.get("required_skills", [])]
         min_exp = parsed_jd.get("minimum_experience_years")
         
         # Skill Score (40%)
         emp_skills = []
         if hasattr(profile, 'tech') and profile.tech:
-            emp_skills = [t.get("tech", "").lower() for t in profile.tech]
+            emp_skills = [skill_keys[t.get("tech", "")] for t in profile.tech]
         
         skill_match_count = 0
         if required_skills:
@@ -214,7 +287,10 @@ JD CONTENT:
 
         # Project Score (10%)
         # Normalizing project count: assume 5 projects is a solid "full" score
-        work_history_count = len(profile.work_history) if hasattr(profile, 'work_history') and profile.work_history else 0
+        # Column-projected candidates carry a precomputed work_history_count
+        work_history_count = getattr(profile, 'work_history_count', None)
+        if not isinstance(work_history_count, int):
+            work_history_count = len(profile.work_history) if hasattr(profile, 'work_history') and profile.work_history else 0
         project_score = min(work_history_count, 5) / 5 * 0.1
 
         # Client Score (10%)
@@ -224,6 +300,10 @@ JD CONTENT:
         client_score = max(0, (5 - client_count) / 5) * 0.1
 
         final_score = skill_score + experience_score + bandwidth_score + project_score + client_score
+
+        # Semantic JD similarity catches related skills the exact name match misses
+        if jd_similarity is not None:
+            final_score = (1 - JD_SIMILARITY_WEIGHT) * final_score + JD_SIMILARITY_WEIGHT * max(jd_similarity, 0.0)
         
         matched_skills_list = list(set(emp_skills).intersection(set(required_skills))) if required_skills else []
 
@@ -235,7 +315,8 @@ JD CONTENT:
     def _generate_openai_profile(self, partial_data: str, api_key: str) -> dict:
         client = OpenAI(api_key=api_key)
         prompt = self._get_profile_prompt(partial_data)
-        response = client.chat.completions.create(
+        response = self._chat_completion(
+            client, "profile",
             model=self.settings.model_name,
             messages=[
                 {"role": "system", "content": "You are a strict structured profile updater."},
@@ -260,7 +341,8 @@ JD CONTENT:
         prompt = self._get_profile_prompt(partial_data)
         
         try:
-            response = client.chat.completions.create(
+            response = self._chat_completion(
+                client, "profile",
                 model=self.settings.model_name,
                 messages=[
                     {"role": "system", "content": "You are a strict structured profile updater."},
@@ -281,7 +363,8 @@ JD CONTENT:
     def _generate_openai_summary(self, profile_data: dict, api_key: str) -> str:
         client = OpenAI(api_key=api_key)
         prompt = self._get_summary_prompt(profile_data)
-        response = client.chat.completions.create(
+        response = self._chat_completion(
+            client, "summary",
             model=self.settings.model_name,
             messages=[
                 {"role": "system", "content": "You are a professional resume writer."},
@@ -299,7 +382,8 @@ JD CONTENT:
         )
         prompt = self._get_summary_prompt(profile_data)
         try:
-            response = client.chat.completions.create(
+            response = self._chat_completion(
+                client, "summary",
                 model=self.settings.model_name,
                 messages=[
                     {"role": "system", "content": "You are a professional resume writer."},
@@ -0,0 +1,302 @@
+import time
+import bisect
+import threading
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class _Shards:
+    """
+    One private dict per thread. Writers only ever touch their own dict, so the
+    hot path takes no lock; the lock is used once per thread (registration) and
+    by the scraper when it copies the list of shards.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._all = []
+        self._lock = threading.Lock()
+
+    def mine(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._all.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def all(self) -> list:
+        with self._lock:
+            # dict.copy() runs without releasing the GIL, so each copy is consistent
+            return [shard.copy() for shard in self._all]
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._shards = _Shards()
+
+    def inc(self, *labelvalues, amount: float = 1.0):
+        shard = self._shards.mine()
+        shard[labelvalues] = shard.get(labelvalues, 0.0) + amount
+
+    def values(self) -> dict:
+        totals = {}
+        for shard in self._shards.all():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._shards = _Shards()
+
+    def observe(self, value: float, *labelvalues):
+        shard = self._shards.mine()
+        state = shard.get(labelvalues)
+        if state is None:
+            # [per-bucket counts..., +Inf count, sum]
+            state = shard[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def time(self, *labelvalues):
+        return _Timer(self, labelvalues)
+
+    def values(self) -> dict:
+        merged = {}
+        for shard in self._shards.all():
+            for key, state in shard.items():
+                total = merged.get(key)
+                if total is None:
+                    merged[key] = list(state)
+                else:
+                    for i, v in enumerate(state):
+                        total[i] += v
+        return merged
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, state in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labelvalues", "start")
+
+    def __init__(self, histogram: Histogram, labelvalues: tuple):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelvalues)
+        return False
+
+
+class Gauge:
+    """Sampled at scrape time from a callback returning {labelvalues tuple: value}."""
+
+    def __init__(self, name: str, help_text: str, labelnames, callback):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self.callback().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}")
+        return lines
+
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def register(metric):
+    with _registry_lock:
+        _registry.append(metric)
+    return metric
+
+
+def render_prometheus() -> str:
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------
+# Application metrics
+# ---------------------------------------------------------
+http_requests = register(Counter(
+    "ems_http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")))
+http_latency = register(Histogram(
+    "ems_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")))
+
+db_statements = register(Counter(
+    "ems_db_statements_total", "SQL statements executed by verb.", ("verb",)))
+db_statement_latency = register(Histogram(
+    "ems_db_statement_duration_seconds", "SQL statement execution time by verb.", ("verb",)))
+db_pool_wait = register(Histogram(
+    "ems_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection.", ("engine",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)))
+db_pool_errors = register(Counter(
+    "ems_db_pool_checkout_errors_total", "Failed connection checkouts (timeouts, connect errors).", ("engine",)))
+
+llm_latency = register(Histogram(
+    "ems_llm_request_duration_seconds", "LLM call latency.", ("provider", "model", "operation")))
+llm_tokens = register(Counter(
+    "ems_llm_tokens_total", "LLM tokens reported by the provider.", ("provider", "model", "kind")))
+llm_errors = register(Counter(
+    "ems_llm_errors_total", "Failed LLM calls.", ("provider", "model", "operation")))
+
+cache_requests = register(Counter(
+    "ems_cache_requests_total", "Cache lookups by cache and result (hit/miss).", ("cache", "result")))
+
+
+def _cache_hit_ratio():
+    totals = {}
+    for (cache, result), value in cache_requests.values().items():
+        hits, lookups = totals.get(cache, (0.0, 0.0))
+        totals[cache] = (hits + (value if result == "hit" else 0.0), lookups + value)
+    return {(cache,): hits / lookups for cache, (hits, lookups) in totals.items() if lookups}
+
+
+cache_hit_ratio = register(Gauge(
+    "ems_cache_hit_ratio", "Cache hits / lookups since start.", ("cache",), _cache_hit_ratio))
+
+
+def record_cache(cache: str, hit: bool):
+    cache_requests.inc(cache, "hit" if hit else "miss")
+
+
+def record_llm_usage(provider: str, model: str, usage):
+    """Counts prompt/completion tokens from an OpenAI-style usage object, if present."""
+    if usage is None:
+        return
+    prompt = getattr(usage, "prompt_tokens", None)
+    completion = getattr(usage, "completion_tokens", None)
+    if prompt:
+        llm_tokens.inc(provider, model, "prompt", amount=prompt)
+    if completion:
+        llm_tokens.inc(provider, model, "completion", amount=completion)
+
+
+_engines = {}
+
+
+def _pool_connections():
+    values = {}
+    for name, engine in list(_engines.items()):
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            continue
+        values[(name, "checked_out")] = pool.checkedout()
+        values[(name, "checked_in")] = pool.checkedin()
+        values[(name, "overflow")] = max(pool.overflow(), 0)
+        values[(name, "size")] = pool.size()
+    return values
+
+
+db_pool_connections = register(Gauge(
+    "ems_db_pool_connections", "Pooled DB connections by state.", ("engine", "state"), _pool_connections))
+
+
+def instrument_engine(engine, name: str = "primary"):
+    """Statement counts/latency via engine events, checkout wait by wrapping pool.connect."""
+    from sqlalchemy import event
+
+    _engines[name] = engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_metrics_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_metrics_start")
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        db_statements.inc(verb)
+        if starts:
+            db_statement_latency.observe(time.perf_counter() - starts.pop(), verb)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("_metrics_start"):
+            conn.info["_metrics_start"].pop()
+
+    _instrument_pool(engine.pool, name)
+
+    @event.listens_for(engine, "engine_disposed")
+    def _disposed(disposed_engine):
+        # dispose() swaps in a fresh pool object
+        _instrument_pool(disposed_engine.pool, name)
+
+
+def _instrument_pool(pool, name: str):
+    if getattr(pool, "_ems_instrumented", False):
+        return
+    original_connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return original_connect()
+        except Exception:
+            db_pool_errors.inc(name)
+            raise
+        finally:
+            db_pool_wait.observe(time.perf_counter() - start, name)
+
+    pool.connect = timed_connect
+    pool._ems_instrumented = True
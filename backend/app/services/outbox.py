@@ -0,0 +1,134 @@
+import os
+import time
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ..models.employee_change import EmployeeChange, ChangeConsumerOffset
+
+logger = logging.getLogger(__name__)
+
+# Changes returned per poll
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+# Seconds a missing id may still belong to an uncommitted transaction; readers stop before
+# a younger gap so a late commit is not skipped (older gaps are rollbacks and are passed)
+OUTBOX_GAP_WAIT = float(os.getenv("OUTBOX_GAP_WAIT", "5"))
+# Changes older than this are deleted; consumers further behind must rescan employees
+OUTBOX_RETENTION_HOURS = float(os.getenv("OUTBOX_RETENTION_HOURS", "168"))
+# Seconds between retention passes
+OUTBOX_PRUNE_INTERVAL = float(os.getenv("OUTBOX_PRUNE_INTERVAL", "3600"))
+
+INSERT, UPDATE, DELETE = "insert", "update", "delete"
+
+_last_pruned = 0.0
+
+
+def record(db: Session, employee_id: int, op: str):
+    """
+    Adds a change row to the caller's transaction; it commits or rolls back with
+    the employee write. New employees need an id first (db.flush()).
+    """
+    db.add(EmployeeChange(employee_id=employee_id, op=op))
+
+
+def record_many(db: Session, employee_ids, op: str):
+    db.add_all([EmployeeChange(employee_id=employee_id, op=op) for employee_id in employee_ids])
+
+
+def latest_position(db: Session) -> int:
+    """Offset of the newest change; a reader starting here sees only later changes."""
+    return db.query(func.max(EmployeeChange.id)).scalar() or 0
+
+
+def read_changes(db: Session, after: int, limit: int = OUTBOX_BATCH_SIZE) -> list:
+    """
+    Changes with id > after in id order, at most limit. Ids are handed out at
+    insert time but become visible at commit, so the batch ends before the
+    first gap younger than OUTBOX_GAP_WAIT; the next read picks it up.
+    """
+    rows = (
+        db.query(EmployeeChange)
+        .filter(EmployeeChange.id > after)
+        .order_by(EmployeeChange.id)
+        .limit(limit)
+        .all()
+    )
+    cutoff = datetime.utcnow() - timedelta(seconds=OUTBOX_GAP_WAIT)
+    expected = after + 1
+    for n, row in enumerate(rows):
+        # A reader starting from 0 takes the oldest row left after pruning as is
+        starting = n == 0 and after == 0
+        if row.id != expected and not starting and row.created_at > cutoff:
+            return rows[:n]
+        expected = row.id + 1
+    return rows
+
+
+def latest_by_employee(changes) -> dict:
+    """{employee id: last op} for a batch, so each employee is processed once."""
+    return {change.employee_id: change.op for change in changes}
+
+
+class ChangeConsumer:
+    """
+    A named reader of employee_changes whose offset is stored in
+    change_consumer_offsets. Processing is at-least-once: the offset moves
+    only after the handler returns, so a crash replays the last batch.
+    """
+
+    def __init__(self, name: str, batch_size: int = OUTBOX_BATCH_SIZE):
+        self.name = name
+        self.batch_size = batch_size
+
+    def position(self, db: Session) -> int:
+        offset = db.get(ChangeConsumerOffset, self.name)
+        return offset.position if offset is not None else 0
+
+    def poll(self, db: Session) -> list:
+        """Next batch after the stored offset (empty when caught up)."""
+        return read_changes(db, self.position(db), self.batch_size)
+
+    def ack(self, db: Session, position: int):
+        """Stores position as processed and commits."""
+        offset = db.get(ChangeConsumerOffset, self.name)
+        if offset is None:
+            db.add(ChangeConsumerOffset(consumer=self.name, position=position))
+        elif position > offset.position:
+            offset.position = position
+        db.commit()
+
+    def process(self, db: Session, handler) -> int:
+        """
+        Calls handler(changes) for each batch until caught up, acknowledging
+        after every batch. Returns the number of changes handled.
+        """
+        total = 0
+        while True:
+            changes = self.poll(db)
+            if not changes:
+                return total
+            handler(changes)
+            self.ack(db, changes[-1].id)
+            total += len(changes)
+            if len(changes) < self.batch_size:
+                return total
+
+
+def prune(db: Session, retention_hours: float = OUTBOX_RETENTION_HOURS) -> int:
+    """Deletes changes older than the retention window; returns how many."""
+    cutoff = datetime.utcnow() - timedelta(hours=retention_hours)
+    deleted = db.query(EmployeeChange).filter(EmployeeChange.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def prune_if_due(db: Session) -> int:
+    """prune() at most every OUTBOX_PRUNE_INTERVAL seconds per process."""
+    global _last_pruned
+    if time.monotonic() - _last_pruned < OUTBOX_PRUNE_INTERVAL:
+        return 0
+    _last_pruned = time.monotonic()
+    deleted = prune(db)
+    if deleted:
+        logger.info(f"Pruned {deleted} employee changes older than {OUTBOX_RETENTION_HOURS:g} h")
+    return deleted
@@ -0,0 +1,124 @@
+import os
+import heapq
+import logging
+import itertools
+import threading
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from . import skill_aliases
+from .llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+# JD scoring moves to a process pool from this many candidates up; below it the pool costs more than it saves
+PARALLEL_SCORING_MIN_CANDIDATES = int(os.getenv("PARALLEL_SCORING_MIN_CANDIDATES", "20000"))
+# Scoring processes; the default 1 scores in the request thread. The pool only pays off with spare
+# cores: check the "parallel-scoring" benchmark on the target host before raising it
+PARALLEL_SCORING_WORKERS = int(os.getenv("PARALLEL_SCORING_WORKERS", "1"))
+# Chunks per worker, so a slow chunk does not leave the other workers idle
+_CHUNKS_PER_WORKER = 4
+
+# What compute_match_score reads, rebuilt in the scoring process from a plain tuple
+_Profile = namedtuple("_Profile", ("tech", "experience_years", "bandwidth", "clients", "career_summary",
+                                   "search_phrase", "work_history_count"))
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _wire_row(candidate, with_text: bool, similarity) -> tuple:
+    """
+    A candidate as a tuple of builtins: skill names instead of tech dicts,
+    client count instead of the client list, texts only when they are scored.
+    """
+    return (
+        tuple(t.get("tech", "") for t in candidate.tech or ()),
+        candidate.experience_years, candidate.bandwidth, len(candidate.clients or ()),
+        candidate.career_summary if with_text else None, candidate.search_phrase if with_text else None,
+        candidate.work_history_count, similarity,
+    )
+
+
+def _profile(row: tuple) -> _Profile:
+    tech, experience_years, bandwidth, client_count, career_summary, search_phrase, history_count, _ = row
+    return _Profile([{"tech": name} for name in tech], experience_years, bandwidth, range(client_count),
+                    career_summary, search_phrase, history_count)
+
+
+def _score(profiles, parsed_jd: dict, start: int, top_k: int = None) -> list:
+    """
+    [(-score, position)] for (profile, JD similarity) pairs numbered from start,
+    sorted (the top_k only, if given). Positions break ties, so merging sorted
+    chunks gives the same order as one stable sort.
+    """
+    scorer = LLMService(None)
+    scored = ((-scorer.compute_match_score(profile, parsed_jd, similarity)["match_score"], start + n)
+              for n, (profile, similarity) in enumerate(profiles))
+    if top_k is not None:
+        return heapq.nsmallest(top_k, scored)
+    return sorted(scored)
+
+
+def _score_chunk(aliases: dict, parsed_jd: dict, start: int, rows: list, top_k: int = None) -> list:
+    """Runs in a scoring process: _score over rows made by _wire_row."""
+    if skill_aliases.current().aliases != aliases:
+        # Skill keys must match the request process's alias table
+        skill_aliases.install(aliases)
+    return _score(((_profile(row), row[-1]) for row in rows), parsed_jd, start, top_k)
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            # spawn: forking a process that runs DB pools and background threads is unsafe
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def rank(candidates: list, parsed_jd: dict, similarities: dict = None, top_k: int = None,
+         workers: int = None) -> list:
+    """
+    Scores candidates against parsed_jd and returns them best first (ties in
+    input order) with match_score set; only the top_k if given. From
+    PARALLEL_SCORING_MIN_CANDIDATES on, chunks are scored in a process pool
+    and the sorted chunks are merged through a heap.
+    """
+    similarities = similarities or {}
+    workers = PARALLEL_SCORING_WORKERS if workers is None else workers
+    parallel = workers > 1 and len(candidates) >= PARALLEL_SCORING_MIN_CANDIDATES
+    runs = None
+    if parallel:
+        with_text = not parsed_jd.get("required_skills")
+        rows = [_wire_row(c, with_text, similarities.get(c.id)) for c in candidates]
+        aliases = skill_aliases.current().aliases
+        size = -(-len(rows) // (workers * _CHUNKS_PER_WORKER))
+        try:
+            executor = _get_executor(workers)
+            futures = [executor.submit(_score_chunk, aliases, parsed_jd, start, rows[start:start + size], top_k)
+                       for start in range(0, len(rows), size)]
+            runs = [future.result() for future in futures]
+        except Exception as e:
+            logger.error(f"Parallel scoring failed, scoring in-process: {e}")
+    if runs is None:
+        runs = [_score(((c, similarities.get(c.id)) for c in candidates), parsed_jd, 0, top_k)]
+
+    ranked = []
+    for neg_score, position in itertools.islice(heapq.merge(*runs), top_k):
+        candidate = candidates[position]
+        candidate.match_score = -neg_score
+        ranked.append(candidate)
+    return ranked
@@ -0,0 +1,252 @@
+import os
+import logging
+from sqlalchemy import Text
+from sqlalchemy.orm import Session, Query
+from ..models.employee import Employee
+from . import candidates, embedding_index, metrics, search_snapshot, timing, tokenizer
+from .llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+# Default fusion weights per candidate source; overridable per request
+DEFAULT_WEIGHTS = {
+    "keyword": float(os.getenv("RANK_WEIGHT_KEYWORD", "1.0")),
+    "skill": float(os.getenv("RANK_WEIGHT_SKILL", "1.0")),
+    "semantic": float(os.getenv("RANK_WEIGHT_SEMANTIC", "0.5")),
+}
+FUSION_METHODS = ("rrf", "weighted")
+# Reciprocal rank fusion constant (Cormack et al. use 60)
+RRF_K = 60
+# Semantic candidates pulled from the vector index before intersecting with filters
+SEMANTIC_CANDIDATES = 500
+# Keyword hits that only match location/career summary still rank above non-matches
+KEYWORD_MATCH_FLOOR = 20
+# Hybrid searches return this many employees unless the request passes limit
+HYBRID_PAGE_SIZE = 50
+# Above this many profiles changed since the search snapshot, skill scoring reads them all from the DB
+SNAPSHOT_MAX_STALE = 1000
+
+
+def keyword_filter(search_text: str):
+    """The multi-column ilike condition used by /employees/search?query=."""
+    search_filter = f"%{search_text}%"
+    return (
+        (Employee.name.ilike(search_filter)) |
+        (Employee.emp_id.ilike(search_filter)) |
+        (Employee.location.ilike(search_filter)) |
+        (Employee.career_summary.ilike(search_filter)) |
+        (Employee.search_phrase.ilike(search_filter)) |
+        (Employee.tech.cast(Text).ilike(search_filter))
+    )
+
+
+def basic_rank(emp, q_lower: str) -> int:
+    """Keyword relevance of one profile (anything with name/emp_id/search_phrase/tech)."""
+    # Rank 1 (Top): Exact Name or Emp ID match
+    if emp.name.lower() == q_lower or emp.emp_id.lower() == q_lower:
+        return 100
+    # Rank 2: Exact Search Phrase match
+    if emp.search_phrase and emp.search_phrase.lower() == q_lower:
+        return 90
+    # Rank 3: Query in Name
+    if q_lower in emp.name.lower():
+        return 80
+    # Rank 4: Query in Search Phrase
+    if emp.search_phrase and q_lower in emp.search_phrase.lower():
+        return 60
+    # Rank 5: Query in Tech
+    tech_str = " ".join([t.get("tech", "") for t in emp.tech]) if emp.tech else ""
+    if q_lower in tech_str.lower():
+        return 40
+    return 0
+
+
+def regex_fallback_rank(employees, jd: str) -> list:
+    """
+    JD scoring used when parsing/scoring the JD fails: the share of the JD's
+    words (3+ letters, no stopwords) found in a profile's tech, search phrase,
+    career summary, work history and client descriptions. Profiles matching at
+    least 50% get that percentage as match_score and are returned best first.
+    Profile tokens come from the shared search snapshot when it has the
+    profile's current version, else from tokenizer.profile_tokens, so a query
+    costs one set intersection per candidate.
+    """
+    jd_keywords = tokenizer.tokenize(jd)
+
+    if not jd_keywords:
+        return []
+
+    snapshot = search_snapshot.current()
+    if snapshot is not None:
+        jd_token_ids = {snapshot.token_ids[t] for t in jd_keywords if t in snapshot.token_ids}
+
+    scored_results = []
+    for emp in employees:
+        row = snapshot.fresh_row(emp) if snapshot is not None else None
+        if row is not None:
+            metrics.record_cache("search_snapshot", True)
+            matched = len(jd_token_ids.intersection(snapshot.token_index_of(row)))
+        else:
+            if snapshot is not None:
+                metrics.record_cache("search_snapshot", False)
+            matched = len(jd_keywords.intersection(tokenizer.profile_tokens.get(emp)))
+        percentage = (matched / len(jd_keywords)) * 100
+
+        if percentage >= 50:
+            emp.match_score = round(percentage, 1)
+            scored_results.append(emp)
+
+    scored_results.sort(key=lambda x: x.match_score, reverse=True)
+    return scored_results
+
+
+def keyword_candidates(base_query: Query, query: str) -> dict:
+    """{employee id: score in [0, 1]} for rows matching the ilike keyword filter."""
+    rows = base_query.with_entities(
+        Employee.id, Employee.name, Employee.emp_id, Employee.search_phrase, Employee.tech
+    ).filter(keyword_filter(query)).all()
+    q_lower = query.lower()
+    return {row.id: max(basic_rank(row, q_lower), KEYWORD_MATCH_FLOOR) / 100 for row in rows}
+
+
+def skill_candidates(db: Session, base_query: Query, parsed_jd: dict) -> dict:
+    """
+    {employee id: JD match score in [0, 1]} computed from the search snapshot
+    for profiles it has current, and from candidates.load rows for the rest.
+    With required skills, only profiles matching at least one of them are
+    candidates: experience, bandwidth and clients alone give every profile a
+    score.
+    """
+    scorer = LLMService(db)
+    required = bool(parsed_jd.get("required_skills"))
+
+    def score(profile):
+        result = scorer.compute_match_score(profile, parsed_jd)
+        if required and not result["matched_skills"]:
+            return None
+        return result["match_score"] / 100
+
+    scores = {}
+    snapshot = search_snapshot.current()
+    # Without required skills the scorer falls back to profile text, which the snapshot lacks
+    if snapshot is not None and required:
+        stale_ids = []
+        for row in base_query.with_entities(Employee.id, Employee.last_updated, Employee.search_phrase_updated_at):
+            r = snapshot.fresh_row(row)
+            if r is None:
+                stale_ids.append(row.id)
+                continue
+            s = score(snapshot.profile(r))
+            if s:
+                scores[row.id] = s
+        if not stale_ids:
+            return scores
+        if len(stale_ids) <= SNAPSHOT_MAX_STALE:
+            base_query = base_query.filter(Employee.id.in_(stale_ids))
+        else:
+            scores = {}
+
+    for c in candidates.load(db, base_query):
+        s = score(c)
+        if s:
+            scores[c.id] = s
+    return scores
+
+
+def semantic_candidates(db: Session, text: str, allowed_ids: set) -> dict:
+    """{employee id: cosine similarity clipped to [0, 1]} restricted to allowed_ids."""
+    index, vec = embedding_index.embed_query(db, text)
+    if len(allowed_ids) <= SEMANTIC_CANDIDATES:
+        scores = index.similarities(vec, allowed_ids)
+    else:
+        scores = {emp_id: s for emp_id, s in index.search(vec, k=SEMANTIC_CANDIDATES) if emp_id in allowed_ids}
+    return {emp_id: max(s, 0.0) for emp_id, s in scores.items() if s > 0}
+
+
+def fuse(sources: dict, weights: dict, method: str = "rrf") -> list:
+    """
+    Combines {source: {id: score}} into [(id, fused score in [0, 1])], best first.
+    rrf: sum of weight / (RRF_K + rank), normalised by the best achievable value.
+    weighted: weighted mean of the per-source scores.
+    A score of 0 is no match: such ids are not ranked by that source.
+    """
+    active = {name: {emp_id: s for emp_id, s in scores.items() if s > 0}
+              for name, scores in sources.items() if weights.get(name, 0) > 0}
+    total_weight = sum(weights[name] for name in active)
+    if not active or not total_weight:
+        return []
+
+    fused = {}
+    if method == "rrf":
+        for name, scores in active.items():
+            ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+            for rank, (emp_id, _) in enumerate(ranked, start=1):
+                fused[emp_id] = fused.get(emp_id, 0.0) + weights[name] / (RRF_K + rank)
+        best = total_weight / (RRF_K + 1)
+    else:
+        for name, scores in active.items():
+            for emp_id, score in scores.items():
+                fused[emp_id] = fused.get(emp_id, 0.0) + weights[name] * score
+        best = total_weight
+
+    return sorted(((emp_id, s / best) for emp_id, s in fused.items()), key=lambda kv: (-kv[1], kv[0]))
+
+
+def hybrid_search(db: Session, base_query: Query, query: str = None, jd: str = None,
+                  weights: dict = None, method: str = "rrf", skip: int = 0, limit: int = HYBRID_PAGE_SIZE,
+                  ranked_ids: list = None):
+    """
+    Unified ranking: candidates from the keyword filter, the JD skill scorer and
+    the vector index are fused in one pass and only the requested page of
+    Employee rows is loaded. Returns (employees, stage timings in ms); if given,
+    ranked_ids is filled with the ids of the whole ranked result set.
+    """
+    weights = {**DEFAULT_WEIGHTS, **{k: v for k, v in (weights or {}).items() if v is not None}}
+    if method not in FUSION_METHODS:
+        method = "rrf"
+    timings = {}
+
+    with timing.span("rank.filter", timings):
+        allowed_ids = {row.id for row in base_query.with_entities(Employee.id).all()}
+
+    sources = {}
+    if query:
+        with timing.span("rank.keyword", timings):
+            sources["keyword"] = keyword_candidates(base_query, query)
+    if jd:
+        with timing.span("rank.parse_jd", timings):
+            parsed_jd = LLMService(db).parse_jd(jd)
+        with timing.span("rank.skill", timings):
+            sources["skill"] = skill_candidates(db, base_query, parsed_jd)
+    if (query or jd) and embedding_index.SEMANTIC_SEARCH_ENABLED and weights["semantic"] > 0:
+        with timing.span("rank.semantic", timings):
+            try:
+                sources["semantic"] = semantic_candidates(db, jd or query, allowed_ids)
+            except Exception as e:
+                logger.error(f"Semantic candidates unavailable: {e}")
+
+    with timing.span("rank.fuse", timings):
+        if sources:
+            ranked = fuse(sources, weights, method)
+        else:
+            ranked = [(emp_id, None) for emp_id in sorted(allowed_ids)]
+        page = ranked[skip:skip + limit]
+        if ranked_ids is not None:
+            ranked_ids.extend(emp_id for emp_id, _ in ranked)
+
+    with timing.span("rank.materialize", timings):
+        page_ids = [emp_id for emp_id, _ in page]
+        by_id = {e.id: e for e in db.query(Employee).filter(Employee.id.in_(page_ids)).all()} if page_ids else {}
+        results = []
+        for emp_id, score in page:
+            emp = by_id.get(emp_id)
+            if emp is None:
+                continue
+            emp.match_score = round(score * 100, 1) if score is not None else None
+            results.append(emp)
+
+    logger.info(
+        f"Hybrid ranking ({method}, {len(allowed_ids)} filtered, {len(ranked)} ranked): "
+        + ", ".join(f"{k}={v}ms" for k, v in timings.items())
+    )
+    return results, timings
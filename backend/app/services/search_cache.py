@@ -0,0 +1,149 @@
+import os
+import math
+import time
+import threading
+from array import array
+from collections import OrderedDict
+from sqlalchemy import func, select
+from ..models.employee_change import EmployeeChange
+from ..models.user import UserRole
+from . import metrics
+
+# Per-worker cache of /employees/search result orders (ids and scores, not rows)
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+# Memory bound: ids and scores take 12 bytes per result; least recently used entries go first
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Seconds an entry lives at most, for inputs the employee version does not cover
+# (skill aliases, LLM settings, embeddings)
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "60"))
+# Seconds between reads of the newest outbox id, which versions other workers' writes
+SEARCH_CACHE_VERSION_INTERVAL = float(os.getenv("SEARCH_CACHE_VERSION_INTERVAL", "1"))
+
+# Key and bookkeeping overhead charged per entry on top of the arrays
+_ENTRY_OVERHEAD = 512
+# Modes whose query goes to an embedding model, where case may matter
+_EMBEDDED_MODES = ("semantic", "hybrid")
+
+
+def _text(value, lower: bool = True):
+    if not value or not value.strip():
+        return None
+    value = " ".join(value.split())
+    return value.lower() if lower else value
+
+
+def _number(value, parse):
+    # Unparsable numbers are ignored by the filters, so they share the unfiltered key
+    try:
+        return parse(value) if value else None
+    except ValueError:
+        return None
+
+
+def cache_key(current_user, query=None, name=None, tech=None, status=None, bandwidth=None, experience=None,
+              jd=None, mode=None, fusion="rrf", weights=None, skip=0, limit=50, facets=False, fuzzy=False) -> tuple:
+    """
+    The search parameters in a canonical form, plus the caller's scope: admins
+    share results, anyone else only ever sees their own profile.
+    """
+    mode = _text(mode)
+    scope = ("admin",) if current_user.role == UserRole.ADMIN else ("user", current_user.email)
+    weights = tuple(sorted((k, float(v)) for k, v in (weights or {}).items() if v is not None))
+    return scope + (
+        _text(query, lower=mode not in _EMBEDDED_MODES), _text(name), _text(tech), _text(status, lower=False),
+        _number(bandwidth, int), _number(experience, float), _text(jd, lower=False), mode, _text(fusion),
+        weights, skip, limit, bool(facets), bool(fuzzy) and bool(_text(query)),
+    )
+
+
+class CachedSearch:
+    """One cached result: the page (or whole list) in order, and the facets response parts."""
+    __slots__ = ("version", "expires_at", "ids", "scores", "total", "facets", "nbytes")
+
+    def __init__(self, version, ids, scores, total=None, facets=None):
+        self.version = version
+        self.expires_at = time.monotonic() + SEARCH_CACHE_TTL
+        self.ids = array("i", ids)
+        # NaN stands for "no score" (match_score None)
+        self.scores = array("d", (math.nan if s is None else s for s in scores))
+        self.total = total
+        self.facets = facets
+        self.nbytes = _ENTRY_OVERHEAD + len(self.ids) * (self.ids.itemsize + self.scores.itemsize)
+
+    def results(self) -> list:
+        """[(employee id, match_score or None)] in result order."""
+        return [(i, None if math.isnan(s) else s) for i, s in zip(self.ids, self.scores)]
+
+
+class SearchResultCache:
+    """
+    LRU over cache_key -> CachedSearch, bounded by SEARCH_CACHE_MAX_BYTES.
+    Entries carry the employee version they were computed at; a lookup at
+    another version is a miss, so a write invalidates everything at once.
+    """
+
+    def __init__(self, max_bytes: int = SEARCH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local_writes = 0
+        self._outbox_position = 0
+        self._checked_at = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def version(self) -> tuple:
+        return (self._local_writes, self._outbox_position)
+
+    def bump(self):
+        """This worker committed an employee write; invalidates at once."""
+        with self._lock:
+            self._local_writes += 1
+
+    async def sync_version(self, db):
+        """Folds in other workers' writes (newest outbox id) every SEARCH_CACHE_VERSION_INTERVAL."""
+        if time.monotonic() - self._checked_at < SEARCH_CACHE_VERSION_INTERVAL:
+            return
+        self._checked_at = time.monotonic()
+        position = (await db.execute(select(func.max(EmployeeChange.id)))).scalar() or 0
+        with self._lock:
+            self._outbox_position = max(self._outbox_position, position)
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.version != self.version or entry.expires_at <= time.monotonic()):
+                self._discard(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        metrics.record_cache("search_results", entry is not None)
+        return entry
+
+    def put(self, key: tuple, entry: CachedSearch, version: tuple):
+        """Stores entry unless a write happened since version was read (the result may predate it)."""
+        with self._lock:
+            if version != self.version or entry.nbytes > self.max_bytes:
+                return
+            entry.version = version
+            self._discard(key)
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            while self.nbytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+cache = SearchResultCache()
@@ -0,0 +1,242 @@
+import os
+import time
+import logging
+import threading
+from sqlalchemy import update, bindparam, or_, and_
+from sqlalchemy.orm import selectinload
+from ..database import SessionLocal
+from ..models.employee import Employee
+from . import embedding_index, outbox, trigram_index
+from .llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PHRASE_WORKER_ENABLED = os.getenv("SEARCH_PHRASE_WORKER_ENABLED", "true").lower() == "true"
+# Seconds between scans when nobody calls notify()
+SEARCH_PHRASE_WORKER_INTERVAL = float(os.getenv("SEARCH_PHRASE_WORKER_INTERVAL", "30"))
+SEARCH_PHRASE_BATCH_SIZE = int(os.getenv("SEARCH_PHRASE_BATCH_SIZE", "100"))
+# "template" (deterministic generate_search_phrase) or "llm" (generate_search_phrase_llm)
+SEARCH_PHRASE_MODE = os.getenv("SEARCH_PHRASE_MODE", "template").lower()
+# Maximum LLM phrase generations per second
+SEARCH_PHRASE_LLM_RATE = float(os.getenv("SEARCH_PHRASE_LLM_RATE", "1"))
+
+
+def _profile_data(emp) -> dict:
+    """The dict shape generate_search_phrase expects (as posted by the frontend)."""
+    return {
+        "name": emp.name,
+        "emp_id": emp.emp_id,
+        "location": emp.location,
+        "bandwidth": emp.bandwidth,
+        "status": emp.status.value if emp.status else None,
+        "work_mode": emp.work_mode.value if emp.work_mode else None,
+        "experience_years": emp.experience_years,
+        "tech": emp.tech or [],
+        "work_history": [
+            {"company": h.company, "role": h.role, "project": h.project, "description": h.description}
+            for h in emp.work_history
+        ],
+        "clients": emp.clients or [],
+    }
+
+
+class _Throttle:
+    """Spaces calls at least 1/rate seconds apart; waits are interruptible by stop."""
+
+    def __init__(self, rate: float, stop_event: threading.Event):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.stop_event = stop_event
+        self.next_at = 0.0
+
+    def wait(self) -> bool:
+        delay = self.next_at - time.monotonic()
+        if delay > 0 and self.stop_event.wait(delay):
+            return False
+        self.next_at = time.monotonic() + self.interval
+        return True
+
+
+class SearchPhraseWorker:
+    """
+    Fills in Employee.search_phrase in the background for employees without one,
+    and regenerates the phrases it wrote itself (search_phrase_generated) once
+    last_updated is newer than search_phrase_updated_at. Phrases supplied on save
+    (typed in the profile or made by the LLM) are never replaced. Saves only call
+    notify(); the phrase is written later with a bulk UPDATE guarded by
+    last_updated, so a profile edited again in the meantime is simply picked up
+    on the next pass. After the first pass only employees in the outbox are
+    looked at: profiles changed by hand in SQL wait for the next restart.
+    """
+
+    def __init__(self, session_factory=SessionLocal, batch_size: int = SEARCH_PHRASE_BATCH_SIZE,
+                 interval: float = SEARCH_PHRASE_WORKER_INTERVAL, mode: str = SEARCH_PHRASE_MODE,
+                 llm_rate: float = SEARCH_PHRASE_LLM_RATE):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval = interval
+        self.mode = mode
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._throttle = _Throttle(llm_rate, self._stop)
+        self._thread = None
+        # Outbox offset checked up to (None = first pass not finished yet)
+        self.change_position = None
+
+    def notify(self):
+        """Signals that an employee changed; returns immediately."""
+        self._wake.set()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="search-phrase-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                self._prune_outbox()
+            except Exception as e:
+                logger.error(f"Search phrase worker pass failed: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _prune_outbox(self):
+        # Housekeeping rides on this thread; the retention window makes it rare
+        db = self.session_factory()
+        try:
+            outbox.prune_if_due(db)
+        finally:
+            db.close()
+
+    def run_once(self) -> int:
+        """
+        The first pass checks every employee; later passes only the employees
+        with outbox changes since the last one, so an idle poll reads no
+        employee rows. Returns the number of phrases written.
+        """
+        if self.change_position is None:
+            db = self.session_factory()
+            try:
+                # Read first: changes committed during the scan are checked again
+                position = outbox.latest_position(db)
+            finally:
+                db.close()
+            total, finished = self._process(None)
+            if finished:
+                self.change_position = position
+        else:
+            total = 0
+            while not self._stop.is_set():
+                db = self.session_factory()
+                try:
+                    changes = outbox.read_changes(db, self.change_position)
+                finally:
+                    db.close()
+                if not changes:
+                    break
+                ids = [employee_id for employee_id, op in outbox.latest_by_employee(changes).items()
+                       if op != outbox.DELETE]
+                updated, finished = self._process(ids)
+                total += updated
+                if not finished:
+                    break
+                self.change_position = changes[-1].id
+                if len(changes) < outbox.OUTBOX_BATCH_SIZE:
+                    break
+        if total:
+            logger.info(f"Regenerated {total} search phrases ({self.mode})")
+        return total
+
+    def _process(self, ids) -> tuple:
+        """
+        Regenerates the stale phrases among ids (None = all employees) batch by
+        batch; returns (phrases written, whether it got through them all).
+        """
+        total = 0
+        while not self._stop.is_set():
+            db = self.session_factory()
+            try:
+                batch = self._find_stale(db, ids)
+                if not batch:
+                    return total, True
+                updated = self._regenerate(db, batch)
+            finally:
+                db.close()
+            total += updated
+            if self._stop.is_set():
+                break
+            if updated == 0 or len(batch) < self.batch_size:
+                # Rows left were edited concurrently; their own outbox changes bring them back
+                return total, True
+        return total, False
+
+    def _find_stale(self, db, ids=None):
+        query = (
+            db.query(Employee)
+            .options(selectinload(Employee.work_history))
+            .filter(or_(
+                Employee.search_phrase.is_(None),
+                Employee.search_phrase == "",
+                and_(
+                    Employee.search_phrase_generated.is_(True),
+                    or_(Employee.search_phrase_updated_at.is_(None),
+                        Employee.last_updated > Employee.search_phrase_updated_at),
+                ),
+            ))
+        )
+        if ids is not None:
+            query = query.filter(Employee.id.in_(ids))
+        return query.order_by(Employee.last_updated, Employee.id).limit(self.batch_size).all()
+
+    def _regenerate(self, db, batch) -> int:
+        llm_service = LLMService(db)
+        params = []
+        for emp in batch:
+            profile_data = _profile_data(emp)
+            if self.mode == "llm":
+                if not self._throttle.wait():
+                    break
+                phrase = llm_service.generate_search_phrase_llm(profile_data)
+            else:
+                phrase = llm_service.generate_search_phrase(profile_data)
+            params.append({"b_id": emp.id, "b_stamp": emp.last_updated, "b_phrase": phrase})
+
+        if not params:
+            return 0
+
+        # last_updated is written back unchanged so Employee's onupdate does not fire
+        stmt = (
+            update(Employee)
+            .where(Employee.id == bindparam("b_id"), Employee.last_updated == bindparam("b_stamp"))
+            .values(
+                search_phrase=bindparam("b_phrase"),
+                search_phrase_updated_at=bindparam("b_stamp"),
+                search_phrase_generated=True,
+                last_updated=bindparam("b_stamp"),
+            )
+        )
+        result = db.connection().execute(stmt, params)
+        # Rows skipped by the last_updated guard are recorded too; consumers re-read the row anyway
+        outbox.record_many(db, [param["b_id"] for param in params], outbox.UPDATE)
+        db.commit()
+
+        # Committed rows reload with the new phrase on access
+        for emp in batch[:len(params)]:
+            if embedding_index.SEMANTIC_SEARCH_ENABLED:
+                embedding_index.update_employee_embedding(db, emp)
+            # The phrase keeps the row's last_updated, so the catch-up query would not see it
+            trigram_index.index.upsert(emp)
+        return result.rowcount
+
+
+worker = SearchPhraseWorker()
@@ -0,0 +1,320 @@
+import os
+import json
+import mmap
+import time
+import bisect
+import struct
+import logging
+import threading
+from array import array
+from sqlalchemy.orm import selectinload
+from ..database import ReadSessionLocal
+from ..models.employee import Employee
+from . import outbox, skill_aliases, tokenizer
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock; every process then builds for itself
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Read-only scoring snapshot shared by all worker processes through mmap
+SEARCH_SNAPSHOT_ENABLED = os.getenv("SEARCH_SNAPSHOT_ENABLED", "true").lower() == "true"
+SEARCH_SNAPSHOT_DIR = os.getenv("SEARCH_SNAPSHOT_DIR", "./search_snapshot")
+# Seconds between checks: the builder for DB changes, readers for a newly published version
+SEARCH_SNAPSHOT_INTERVAL = float(os.getenv("SEARCH_SNAPSHOT_INTERVAL", "2"))
+# Published versions kept on disk (older ones may still be mapped by slow readers)
+SEARCH_SNAPSHOT_KEEP = int(os.getenv("SEARCH_SNAPSHOT_KEEP", "3"))
+
+MAGIC = b"EMSSNAP1"
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = "builder.lock"
+
+# (section, array typecode); one entry per employee unless noted, rows sorted by id
+SECTIONS = (
+    ("ids", "i"),
+    ("updated", "d"),  # last_updated as a timestamp, to tell whether a row is still current
+    ("phrase_updated", "d"),  # search_phrase_updated_at likewise (0 = never)
+    ("experience", "d"),  # doubles, so ">= minimum experience" compares exactly
+    ("bandwidth", "i"),
+    ("history_count", "i"),
+    ("client_count", "i"),
+    ("skill_offsets", "i"),  # rows + 1; a row's skills are skill_index[offsets[r]:offsets[r + 1]]
+    ("skill_index", "i"),  # ids into header["skills"] (comparison keys)
+    ("token_offsets", "i"),  # rows + 1, as skill_offsets
+    ("token_index", "i"),  # ids into header["tokens"] (tokenizer.tokenize of the profile text)
+)
+
+
+def _stamp(value) -> float:
+    return value.timestamp() if value is not None else 0.0
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class _SnapshotProfile:
+    """What compute_match_score reads from a profile, served from the snapshot."""
+    __slots__ = ("tech", "experience_years", "bandwidth", "work_history_count", "clients",
+                 "career_summary", "search_phrase")
+
+    def __init__(self, skills, experience_years, bandwidth, work_history_count, client_count):
+        self.tech = [{"tech": skill} for skill in skills]
+        self.experience_years = experience_years
+        self.bandwidth = bandwidth
+        self.work_history_count = work_history_count
+        self.clients = range(client_count)  # only the count is scored
+        # Not in the snapshot; callers that need keyword scoring use the DB row
+        self.career_summary = None
+        self.search_phrase = None
+
+
+class SearchSnapshot:
+    """
+    One published snapshot file, mapped read-only. Section arrays are
+    memoryviews into the mapping, so every worker shares the same pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a search snapshot")
+        header_len = struct.unpack_from("<I", self._mmap, len(MAGIC))[0]
+        start = len(MAGIC) + 4
+        header = json.loads(bytes(view[start:start + header_len]))
+        data = _align(start + header_len)
+
+        self.version = header["version"]
+        self.signature = header["signature"]
+        self.rows = header["rows"]
+        self.skills = header["skills"]
+        self.tokens = header["tokens"]
+        self.token_ids = {token: i for i, token in enumerate(self.tokens)}
+        for name, (offset, typecode, length) in header["sections"].items():
+            begin = data + offset
+            setattr(self, name, view[begin:begin + length * array(typecode).itemsize].cast(typecode))
+
+    def __len__(self):
+        return self.rows
+
+    def row(self, employee_id: int):
+        r = bisect.bisect_left(self.ids, employee_id)
+        return r if r < self.rows and self.ids[r] == employee_id else None
+
+    def fresh_row(self, emp):
+        """Row of emp if the snapshot has its current version (last_updated and phrase), else None."""
+        r = self.row(emp.id)
+        if r is None or self.updated[r] != _stamp(emp.last_updated):
+            return None
+        if self.phrase_updated[r] != _stamp(emp.search_phrase_updated_at):
+            return None
+        return r
+
+    def token_index_of(self, r: int):
+        return self.token_index[self.token_offsets[r]:self.token_offsets[r + 1]]
+
+    def profile(self, r: int) -> _SnapshotProfile:
+        skills = self.skill_index[self.skill_offsets[r]:self.skill_offsets[r + 1]]
+        return _SnapshotProfile([self.skills[s] for s in skills], self.experience[r], self.bandwidth[r],
+                                self.history_count[r], self.client_count[r])
+
+
+def db_signature(db) -> list:
+    """
+    Changes whenever a snapshot would differ: any employee write (the newest
+    outbox change) or a new skill alias table. Rows written without an outbox
+    record are still never served stale: fresh_row compares their stamps.
+    """
+    return [outbox.latest_position(db), skill_aliases.current().version]
+
+
+def build_snapshot(db, directory: str = SEARCH_SNAPSHOT_DIR) -> str:
+    """Writes a new snapshot version next to the published one and returns its path (not yet published)."""
+    signature = db_signature(db)
+    skill_keys = skill_aliases.current().keys
+    arrays = {name: array(typecode) for name, typecode in SECTIONS}
+    skills, tokens = {}, {}
+    arrays["skill_offsets"].append(0)
+    arrays["token_offsets"].append(0)
+
+    employees = db.query(Employee).options(selectinload(Employee.work_history)).order_by(Employee.id).yield_per(500)
+    for emp in employees:
+        arrays["ids"].append(emp.id)
+        arrays["updated"].append(_stamp(emp.last_updated))
+        arrays["phrase_updated"].append(_stamp(emp.search_phrase_updated_at))
+        arrays["experience"].append(emp.experience_years or 0.0)
+        arrays["bandwidth"].append(emp.bandwidth or 0)
+        arrays["history_count"].append(len(emp.work_history))
+        arrays["client_count"].append(len(emp.clients or []))
+        for key in {skill_keys[t.get("tech", "")] for t in emp.tech or []}:
+            arrays["skill_index"].append(skills.setdefault(key, len(skills)))
+        arrays["skill_offsets"].append(len(arrays["skill_index"]))
+        for token in tokenizer.tokenize(tokenizer.profile_text(emp)):
+            arrays["token_index"].append(tokens.setdefault(token, len(tokens)))
+        arrays["token_offsets"].append(len(arrays["token_index"]))
+
+    sections, offset = {}, 0
+    for name, typecode in SECTIONS:
+        sections[name] = [offset, typecode, len(arrays[name])]
+        offset = _align(offset + len(arrays[name]) * arrays[name].itemsize)
+    version = time.time_ns()
+    header = json.dumps({
+        "version": version, "signature": signature, "rows": len(arrays["ids"]),
+        "skills": list(skills), "tokens": list(tokens), "sections": sections,
+    }).encode()
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"snapshot-{version}.bin")
+    with open(path + ".tmp", "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        for name, _ in SECTIONS:
+            arrays[name].tofile(f)
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def publish(path: str, directory: str = SEARCH_SNAPSHOT_DIR):
+    """Points CURRENT at path (atomic rename) and deletes versions beyond SEARCH_SNAPSHOT_KEEP."""
+    pointer = os.path.join(directory, CURRENT_FILE)
+    with open(pointer + ".tmp", "w") as f:
+        f.write(os.path.basename(path))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer + ".tmp", pointer)
+    versions = sorted(name for name in os.listdir(directory) if name.startswith("snapshot-") and name.endswith(".bin"))
+    # Unlinking a mapped file is safe on POSIX: readers keep their pages until they swap
+    for name in versions[:-SEARCH_SNAPSHOT_KEEP]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+
+_state = {"snapshot": None, "name": None, "checked_at": 0.0}
+_state_lock = threading.Lock()
+
+
+def current(directory: str = SEARCH_SNAPSHOT_DIR):
+    """The newest published snapshot (re-checked every SEARCH_SNAPSHOT_INTERVAL), or None."""
+    if not SEARCH_SNAPSHOT_ENABLED:
+        return None
+    if time.monotonic() - _state["checked_at"] >= SEARCH_SNAPSHOT_INTERVAL:
+        with _state_lock:
+            if time.monotonic() - _state["checked_at"] >= SEARCH_SNAPSHOT_INTERVAL:
+                _load_published(directory)
+                _state["checked_at"] = time.monotonic()
+    return _state["snapshot"]
+
+
+def _load_published(directory: str):
+    try:
+        with open(os.path.join(directory, CURRENT_FILE)) as f:
+            name = f.read().strip()
+    except OSError:
+        return
+    if name == _state["name"]:
+        return
+    try:
+        snapshot = SearchSnapshot(os.path.join(directory, name))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Search snapshot {name} unavailable, keeping the current one: {e}")
+        return
+    # Requests holding the old snapshot keep it (and its mapping) until they finish
+    _state["snapshot"], _state["name"] = snapshot, name
+
+
+class SnapshotBuilder:
+    """
+    Background thread in every worker; the one holding the builder lock file
+    rebuilds and publishes when the DB signature changes. The others only map
+    what it publishes. notify() (after this worker's writes) checks at once.
+    """
+
+    # Built from a read session: the scan must not hold the (SQLite production: only) writer connection
+    def __init__(self, session_factory=ReadSessionLocal, directory: str = SEARCH_SNAPSHOT_DIR,
+                 interval: float = SEARCH_SNAPSHOT_INTERVAL):
+        self.session_factory = session_factory
+        self.directory = directory
+        self.interval = interval
+        self._lock_file = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def notify(self):
+        self._wake.set()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="search-snapshot-builder", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Search snapshot build failed: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def is_leader(self) -> bool:
+        """Takes the builder lock if no other process holds it; kept until stop()."""
+        if self._lock_file is not None:
+            return True
+        if fcntl is None:
+            return True
+        os.makedirs(self.directory, exist_ok=True)
+        lock_file = open(os.path.join(self.directory, LOCK_FILE), "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def run_once(self) -> bool:
+        """Builds and publishes a new version if this process leads and the DB changed."""
+        if not self.is_leader():
+            return False
+        db = self.session_factory()
+        try:
+            published = current(self.directory)
+            skill_aliases.refresh(db)
+            if published is not None and published.signature == db_signature(db):
+                return False
+            started = time.perf_counter()
+            path = build_snapshot(db, self.directory)
+        finally:
+            db.close()
+        publish(path, self.directory)
+        with _state_lock:
+            _load_published(self.directory)
+            _state["checked_at"] = time.monotonic()
+        logger.info(f"Search snapshot {os.path.basename(path)} published in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+
+
+builder = SnapshotBuilder()
@@ -0,0 +1,153 @@
+import os
+import json
+import zlib
+import time
+import logging
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from ..models.skill_alias import SkillAlias
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a worker re-reads the alias table (writes reload the writing worker at once)
+SKILL_ALIAS_TTL = int(os.getenv("SKILL_ALIAS_TTL", "60"))
+
+# Seeded into skill_aliases by migration 5b7e3c9d2a14 (or seed_defaults); also used while the table
+# is missing or empty, e.g. for a database made by init_db.py/create_all before the first alias is saved
+DEFAULT_ALIASES = {
+    "postgres": "PostgreSQL", "postgre": "PostgreSQL", "psql": "PostgreSQL",
+    "k8s": "Kubernetes", "kube": "Kubernetes",
+    "reactjs": "React", "react.js": "React", "react js": "React",
+    "nodejs": "Node.js", "node js": "Node.js",
+    "vuejs": "Vue.js", "vue": "Vue.js",
+    "angularjs": "Angular", "angular.js": "Angular",
+    "js": "JavaScript", "ecmascript": "JavaScript",
+    "ts": "TypeScript",
+    "golang": "Go",
+    "springboot": "Spring Boot", "spring-boot": "Spring Boot",
+    "dotnet": ".NET", ".net core": ".NET", "asp.net": ".NET",
+    "c sharp": "C#", "csharp": "C#",
+    "cpp": "C++",
+    "amazon web services": "AWS",
+    "google cloud": "GCP", "google cloud platform": "GCP",
+    "microsoft azure": "Azure",
+    "mongo": "MongoDB",
+    "ml": "Machine Learning",
+    "powerbi": "Power BI",
+    "rails": "Ruby on Rails", "ror": "Ruby on Rails",
+    "pyspark": "Spark", "apache spark": "Spark",
+    "apache kafka": "Kafka",
+    "apache airflow": "Airflow",
+}
+
+
+def normalize(name: str) -> str:
+    """Lookup key for a skill name: lowercase, single spaces."""
+    return " ".join((name or "").lower().split())
+
+
+class _Memo(dict):
+    """Raw spelling -> derived value, filled on first use (skill spellings are few)."""
+
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+
+    def __missing__(self, name):
+        value = self[name] = self.func(name)
+        return value
+
+
+class SkillAliasTable:
+    """alias -> canonical name, compiled into one dict keyed by normalized spelling."""
+
+    def __init__(self, aliases: dict):
+        self.aliases = dict(aliases)
+        # Same aliases, same version (in every process); consumers compare it to notice a new table
+        self.version = zlib.crc32(json.dumps(sorted(self.aliases.items())).encode())
+        self._lookup = {}
+        # Scoring and the in-memory indexes look up every tech entry of every profile
+        self.keys = _Memo(lambda name: normalize(self.canonical(name)))
+        self.names = _Memo(self.canonical)
+        for alias, canonical in self.aliases.items():
+            self._lookup[normalize(alias)] = canonical
+            # Any casing of the canonical name itself maps to its display form
+            self._lookup.setdefault(normalize(canonical), canonical)
+
+    def canonical(self, name: str) -> str:
+        """Canonical display name, or the name itself (trimmed) if it has no alias."""
+        return self._lookup.get(normalize(name), (name or "").strip())
+
+    def key(self, name: str) -> str:
+        """Normalized canonical name, for comparing skills."""
+        return self.keys[name]
+
+    def canonicalize_tech(self, tech: list) -> list:
+        """
+        Rewrites tech entries to canonical names. Entries that collapse onto the
+        same skill ("Postgres" and "PostgreSQL") are merged, keeping the one with
+        the most experience.
+        """
+        if tech is None:
+            return None
+        merged = {}
+        for entry in tech:
+            entry = dict(entry)
+            entry["tech"] = self.canonical(entry.get("tech", ""))
+            key = normalize(entry["tech"])
+            current = merged.get(key)
+            if current is None or (entry.get("experience_years") or 0) > (current.get("experience_years") or 0):
+                merged[key] = entry
+        return list(merged.values())
+
+
+_state = {"table": SkillAliasTable(DEFAULT_ALIASES), "loaded_at": None}
+
+
+def current() -> SkillAliasTable:
+    """The compiled table as last loaded; never touches the database."""
+    return _state["table"]
+
+
+def refresh(db: Session, force: bool = False) -> SkillAliasTable:
+    """Reloads the table from skill_aliases when forced or older than SKILL_ALIAS_TTL."""
+    loaded_at = _state["loaded_at"]
+    if not force and loaded_at is not None and time.monotonic() - loaded_at < SKILL_ALIAS_TTL:
+        metrics.record_cache("skill_aliases", True)
+        return _state["table"]
+    metrics.record_cache("skill_aliases", False)
+    try:
+        rows = db.query(SkillAlias.alias, SkillAlias.canonical).all()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning(f"Skill aliases unavailable, keeping the current table: {e}")
+        _state["loaded_at"] = time.monotonic()
+        return _state["table"]
+    table = SkillAliasTable({alias: canonical for alias, canonical in rows} or DEFAULT_ALIASES)
+    _state["table"] = table
+    _state["loaded_at"] = time.monotonic()
+    return table
+
+
+def install(aliases: dict) -> SkillAliasTable:
+    """Makes aliases the current table without reading the database (e.g. in a scoring process)."""
+    table = SkillAliasTable(aliases)
+    _state["table"] = table
+    return table
+
+
+def seed_defaults(db: Session) -> int:
+    """Adds DEFAULT_ALIASES to an empty skill_aliases table (not committed); returns the rows added."""
+    if db.query(SkillAlias.id).first() is not None:
+        return 0
+    db.add_all(SkillAlias(alias=alias, canonical=canonical) for alias, canonical in DEFAULT_ALIASES.items())
+    return len(DEFAULT_ALIASES)
+
+
+def canonical(name: str) -> str:
+    return current().canonical(name)
+
+
+def canonicalize_tech(tech: list) -> list:
+    return current().canonicalize_tech(tech)
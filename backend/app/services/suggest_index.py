@@ -0,0 +1,239 @@
+import os
+import time
+import heapq
+from ..models.employee import Employee
+from . import skill_aliases
+from .filter_index import SyncedIndex
+
+# Completions cached per trie node; also the largest limit /employees/suggest serves
+SUGGEST_TOP_N = int(os.getenv("SUGGEST_TOP_N", "20"))
+# Seconds between catch-up queries for writes made by other workers/processes
+SUGGEST_SYNC_INTERVAL = float(os.getenv("SUGGEST_SYNC_INTERVAL", "5"))
+
+KINDS = ("name", "emp_id", "tech", "location", "client")
+# Kinds that identify people or accounts; only admins get these suggested
+PRIVATE_KINDS = ("name", "emp_id", "client")
+COLUMNS = (Employee.id, Employee.name, Employee.emp_id, Employee.tech, Employee.location,
+           Employee.clients, Employee.last_updated)
+
+
+def normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _trie_keys(kind: str, text: str) -> set:
+    """The whole text and, except for ids, every word start ("smi" finds "John Smith")."""
+    key = normalize(text)
+    if kind == "emp_id":
+        return {key}
+    return {key[i:] for i in range(len(key)) if i == 0 or key[i - 1] in " -./"}
+
+
+def _terms(row) -> set:
+    """(kind, display text) pairs one employee contributes."""
+    terms = set()
+    for kind, text in (("name", row.name), ("emp_id", row.emp_id), ("location", row.location)):
+        if text and text.strip():
+            terms.add((kind, " ".join(text.split())))
+    names = skill_aliases.current().names
+    for entry in row.tech or []:
+        if entry.get("tech") and entry["tech"].strip():
+            terms.add(("tech", names[entry["tech"]]))
+    for client in row.clients or []:
+        if client.get("client_name") and client["client_name"].strip():
+            terms.add(("client", " ".join(client["client_name"].split())))
+    return terms
+
+
+class _Node:
+    __slots__ = ("edge", "children", "terms", "top")
+
+    def __init__(self, edge: str = ""):
+        self.edge = edge
+        self.children = {}  # first character of the child's edge -> child
+        self.terms = set()  # display texts whose key ends here
+        self.top = None  # cached [(-count, text)] best first; None = recompute
+
+
+class _Trie:
+    """
+    Compressed (radix) trie: edges carry whole runs of characters, so a
+    lookup costs one dict access per branch point. Each node caches the
+    SUGGEST_TOP_N most frequent texts below it, merged from its children's
+    caches; writes only clear the caches on their own path.
+    """
+
+    def __init__(self, counts: dict):
+        self.root = _Node()
+        self.counts = counts  # display text -> employees, shared with the owner
+
+    def _path(self, key: str, create: bool):
+        """Nodes from the root to the node for key (None if missing and not create)."""
+        node, i, path = self.root, 0, [self.root]
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[key[i]] = _Node(key[i:])
+            edge = child.edge
+            common = 0
+            while common < len(edge) and i + common < len(key) and edge[common] == key[i + common]:
+                common += 1
+            if common < len(edge):
+                if not create:
+                    return None
+                # Split the edge where key leaves it
+                middle = _Node(edge[:common])
+                child.edge = edge[common:]
+                middle.children[child.edge[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+            i += common
+            node = child
+            path.append(node)
+        return path
+
+    def add(self, key: str, text: str):
+        path = self._path(key, create=True)
+        path[-1].terms.add(text)
+        self._invalidate(path)
+
+    def discard(self, key: str, text: str):
+        path = self._path(key, create=False)
+        if path:
+            path[-1].terms.discard(text)
+            self._invalidate(path)
+
+    def touch(self, key: str):
+        """A count changed: clear the cached completions on key's path."""
+        path = self._path(key, create=False)
+        if path:
+            self._invalidate(path)
+
+    @staticmethod
+    def _invalidate(path):
+        for node in path:
+            node.top = None
+
+    def find(self, prefix: str):
+        """Node whose subtree holds every key starting with prefix."""
+        node, i = self.root, 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None
+            rest = prefix[i:]
+            if rest.startswith(child.edge):
+                i += len(child.edge)
+                node = child
+            elif child.edge.startswith(rest):
+                return child
+            else:
+                return None
+        return node
+
+    def top(self, node: _Node) -> list:
+        if node.top is None:
+            # A text reached through several keys (word starts) is listed once
+            candidates = {(-self.counts[text], text) for text in node.terms}
+            for child in node.children.values():
+                candidates.update(self.top(child))
+            node.top = heapq.nsmallest(SUGGEST_TOP_N, candidates)
+        return node.top
+
+
+class SuggestIndex(SyncedIndex):
+    """
+    Typeahead over names, emp_ids, tech, locations and client names: one trie
+    per kind, counting the employees behind each text. Kept current like the
+    filter index.
+    """
+
+    name = "Suggest index"
+    columns = COLUMNS
+    sync_interval = SUGGEST_SYNC_INTERVAL
+
+    def _reset(self):
+        super()._reset()
+        self.counts = {kind: {} for kind in KINDS}
+        self.tries = {kind: _Trie(self.counts[kind]) for kind in KINDS}
+        self.terms = {}  # id -> _terms(row), to undo an employee's contribution
+
+    def __len__(self):
+        return len(self.terms)
+
+    def build(self, rows):
+        with self._lock:
+            self._reset()
+            for row in rows:
+                terms = _terms(row)
+                self.terms[row.id] = terms
+                for kind, text in terms:
+                    counts = self.counts[kind]
+                    counts[text] = counts.get(text, 0) + 1
+                self._track(row)
+            for kind, counts in self.counts.items():
+                trie = self.tries[kind]
+                for text in counts:
+                    for key in _trie_keys(kind, text):
+                        trie.add(key, text)
+                # Fill every node's cache now rather than on the first keystrokes
+                trie.top(trie.root)
+            self.built = True
+            self.built_at = self.synced_at = time.monotonic()
+
+    def upsert(self, row):
+        """Re-indexes one employee; row needs the COLUMNS attributes."""
+        with self._lock:
+            if not self.built:
+                return
+            old, new = self.terms.get(row.id, set()), _terms(row)
+            for term in old - new:
+                self._count(term, -1)
+            for term in new - old:
+                self._count(term, 1)
+            self.terms[row.id] = new
+            self._track(row)
+
+    def remove(self, employee_id: int):
+        with self._lock:
+            for term in self.terms.pop(employee_id, ()):
+                self._count(term, -1)
+
+    def _count(self, term: tuple, delta: int):
+        kind, text = term
+        counts, trie = self.counts[kind], self.tries[kind]
+        count = counts.get(text, 0) + delta
+        keys = _trie_keys(kind, text)
+        if count <= 0:
+            counts.pop(text, None)
+            for key in keys:
+                trie.discard(key, text)
+        elif count == delta:
+            counts[text] = count
+            for key in keys:
+                trie.add(key, text)
+        else:
+            counts[text] = count
+            for key in keys:
+                trie.touch(key)
+
+    def suggest(self, prefix: str, limit: int = 10, kinds=KINDS) -> list:
+        """Most frequent completions of prefix across kinds: [{"text", "kind", "count"}]."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        limit = min(limit, SUGGEST_TOP_N)
+        with self._lock:
+            candidates = []
+            for kind in kinds:
+                trie = self.tries[kind]
+                node = trie.find(prefix)
+                if node is not None:
+                    candidates.extend((neg_count, text, kind) for neg_count, text in trie.top(node))
+        return [{"text": text, "kind": kind, "count": -neg_count}
+                for neg_count, text, kind in heapq.nsmallest(limit, candidates)]
+
+
+index = SuggestIndex()
@@ -0,0 +1,143 @@
+import os
+import time
+import bisect
+import threading
+import contextvars
+
+# Span collection is off unless enabled by env or at runtime (POST /api/settings/timing)
+_enabled = os.getenv("REQUEST_TIMING_ENABLED", "false").lower() == "true"
+
+# Histogram bucket upper bounds in milliseconds
+BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Spans of the current request: [(name, ms)], or None outside a request
+_request_spans = contextvars.ContextVar("request_spans", default=None)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def snapshot(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, n in zip(BUCKETS_MS + ("+Inf",), self.counts):
+            cumulative += n
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+def record(name: str, ms: float):
+    """Adds one duration to the current request (if any) and the stage histogram."""
+    if not _enabled:
+        return
+    spans = _request_spans.get()
+    if spans is not None:
+        spans.append((name, ms))
+    with _histograms_lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = _Histogram()
+        hist.observe(ms)
+
+
+class _Span:
+    __slots__ = ("name", "start", "timings")
+
+    def __init__(self, name: str, timings: dict = None):
+        self.name = name
+        self.timings = timings
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self.start) * 1000
+        record(self.name, ms)
+        if self.timings is not None:
+            self.timings[self.name] = round(ms, 2)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, timings: dict = None):
+    """
+    Times a block: `with timing.span("search.sql_filter"): ...`.
+    With a timings dict the block is always timed and its milliseconds are
+    also stored there under name; otherwise a shared no-op context manager is
+    returned when timing is disabled.
+    """
+    return _Span(name, timings) if _enabled or timings is not None else _NOOP
+
+
+def start_request():
+    """Begins span collection for the current request; returns the reset token."""
+    return _request_spans.set([])
+
+
+def finish_request(token) -> list:
+    spans = _request_spans.get() or []
+    _request_spans.reset(token)
+    return spans
+
+
+def aggregate(spans: list) -> dict:
+    """{name: total ms} in first-seen order (repeated spans are summed)."""
+    totals = {}
+    for name, ms in spans:
+        totals[name] = totals.get(name, 0.0) + ms
+    return totals
+
+
+def server_timing_header(totals: dict) -> str:
+    return ", ".join(f"{name};dur={ms:.2f}" for name, ms in totals.items())
+
+
+def histograms() -> dict:
+    with _histograms_lock:
+        return {name: hist.snapshot() for name, hist in sorted(_histograms.items())}
+
+
+def reset_histograms():
+    with _histograms_lock:
+        _histograms.clear()
@@ -0,0 +1,77 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from .jd_parser import STOPWORDS
+from . import metrics
+
+# Words of 3+ letters; the token definition the JD regex fallback has always used
+TOKEN_PATTERN = re.compile(r"\b[a-z]{3,}\b")
+
+# Employees whose profile token sets are kept in memory (least recently used evicted)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "50000"))
+
+
+def tokenize(text: str) -> frozenset:
+    """Distinct lower-case words of `text`, without stopwords."""
+    if not text:
+        return frozenset()
+    return frozenset(TOKEN_PATTERN.findall(text.lower())).difference(STOPWORDS)
+
+
+def profile_text(emp) -> str:
+    """Everything the fallback scorer matches against: tech, phrase, summary, history, clients."""
+    parts = [t.get("tech", "") for t in emp.tech] if emp.tech else []
+    parts.append(emp.search_phrase or "")
+    parts.append(emp.career_summary or "")
+    for h in emp.work_history or []:
+        parts.extend(value for value in (h.description, h.role, h.project) if value)
+    for c in emp.clients or []:
+        parts.append(c.get("description", ""))
+    return " ".join(parts)
+
+
+class ProfileTokenCache:
+    """
+    Token set per employee id, reused until the profile changes. The version
+    is (last_updated, search_phrase_updated_at): saves bump last_updated, and
+    the search phrase worker rewrites the phrase without touching it.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, emp) -> frozenset:
+        if emp.id is None:
+            return tokenize(profile_text(emp))
+        version = (emp.last_updated, getattr(emp, "search_phrase_updated_at", None))
+        with self._lock:
+            entry = self._entries.get(emp.id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(emp.id)
+                metrics.record_cache("profile_tokens", True)
+                return entry[1]
+        metrics.record_cache("profile_tokens", False)
+        tokens = tokenize(profile_text(emp))
+        with self._lock:
+            self._entries[emp.id] = (version, tokens)
+            self._entries.move_to_end(emp.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return tokens
+
+    def discard(self, employee_id: int):
+        with self._lock:
+            self._entries.pop(employee_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+profile_tokens = ProfileTokenCache()
@@ -0,0 +1,265 @@
+import os
+import re
+import time
+import heapq
+import itertools
+from collections import Counter
+from ..models.employee import Employee
+from . import skill_aliases
+from .filter_index import SyncedIndex, bitmap_from_ids, bitmap_ids
+
+# Minimum trigram similarity of a fuzzy match (pg_trgm's default similarity_threshold)
+FUZZY_SIMILARITY_THRESHOLD = float(os.getenv("FUZZY_SIMILARITY_THRESHOLD", "0.3"))
+# Most profiles a fuzzy search returns, best first
+FUZZY_MAX_RESULTS = int(os.getenv("FUZZY_MAX_RESULTS", "200"))
+# Seconds between catch-up queries for writes made by other workers/processes
+FUZZY_SYNC_INTERVAL = float(os.getenv("FUZZY_SYNC_INTERVAL", "5"))
+# Seconds between full rebuilds, a backstop for profile writes made without an outbox record
+FUZZY_REBUILD_INTERVAL = float(os.getenv("FUZZY_REBUILD_INTERVAL", "600"))
+
+_WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+# Terms with at least this many profiles keep their bitset cached between queries
+_CACHED_BITMAP_SIZE = 256
+
+COLUMNS = (Employee.id, Employee.name, Employee.tech, Employee.search_phrase, Employee.last_updated)
+
+
+def words(text: str) -> list:
+    return _WORD_PATTERN.findall((text or "").lower())
+
+
+def trigrams(word: str) -> frozenset:
+    """pg_trgm's trigrams of one word: padded with two spaces in front and one behind."""
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(a: str, b: str) -> float:
+    """Shared trigrams over all trigrams of the two words, as pg_trgm's similarity()."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb)
+
+
+def max_edits(word: str) -> int:
+    """Edit distance a fuzzy match may have: one per four characters, at least one."""
+    return max(1, len(word) // 4)
+
+
+def within_distance(a: str, b: str, k: int) -> bool:
+    """
+    Optimal string alignment distance <= k (Levenshtein plus swapping two adjacent
+    characters as one edit), giving up as soon as a whole row exceeds k.
+    """
+    if abs(len(a) - len(b)) > k:
+        return False
+    before, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > k:
+            return False
+        before, previous = previous, current
+    return previous[-1] <= k
+
+
+def is_transposition(a: str, b: str) -> bool:
+    """The words differ only by two swapped adjacent characters ("pyhton" / "python")."""
+    if len(a) != len(b) or a == b:
+        return False
+    diff = [i for i, (ca, cb) in enumerate(zip(a, b)) if ca != cb]
+    return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+
+
+def _profile_words(row) -> frozenset:
+    """Words of the name, canonical skill names and search phrase."""
+    names = skill_aliases.current().names
+    texts = [row.name, row.search_phrase]
+    texts.extend(names[entry["tech"]] for entry in row.tech or [] if entry.get("tech"))
+    return frozenset(word for text in texts for word in words(text))
+
+
+class TrigramIndex(SyncedIndex):
+    """
+    Vocabulary of profile words with a trigram -> words posting list, and the
+    profiles behind each word. A query word is matched against vocabulary words
+    sharing trigrams with it, scored by trigram similarity and verified by a
+    bounded edit distance; a partly typed last word also matches as a prefix.
+    """
+
+    name = "Trigram index"
+    columns = COLUMNS
+    sync_interval = FUZZY_SYNC_INTERVAL
+    rebuild_interval = FUZZY_REBUILD_INTERVAL
+
+    def _reset(self):
+        super()._reset()
+        self.vocab = {}  # word -> term id
+        self.terms = []  # term id -> word
+        self.sizes = []  # term id -> number of trigrams
+        self.grams = {}  # trigram -> [term id]
+        self.postings = []  # term id -> {employee id}
+        self._bitmaps = {}  # term id -> bitset, for terms with many profiles
+        self.words = {}  # employee id -> _profile_words(row), to undo on update/remove
+
+    def __len__(self):
+        return len(self.words)
+
+    def _term(self, word: str) -> int:
+        term = self.vocab.get(word)
+        if term is None:
+            # Words stay in the vocabulary once seen; an empty posting is skipped at query time
+            term = self.vocab[word] = len(self.terms)
+            grams = trigrams(word)
+            self.terms.append(word)
+            self.sizes.append(len(grams))
+            self.postings.append(set())
+            for gram in grams:
+                self.grams.setdefault(gram, []).append(term)
+        return term
+
+    def build(self, rows):
+        with self._lock:
+            self._reset()
+            for row in rows:
+                profile_words = _profile_words(row)
+                self.words[row.id] = profile_words
+                for word in profile_words:
+                    self.postings[self._term(word)].add(row.id)
+                self._track(row)
+            self.built = True
+            self.built_at = self.synced_at = time.monotonic()
+
+    def upsert(self, row):
+        """Re-indexes one employee; row needs the COLUMNS attributes."""
+        with self._lock:
+            if not self.built:
+                return
+            old, new = self.words.get(row.id, frozenset()), _profile_words(row)
+            for word in old - new:
+                self._unpost(self.vocab[word], row.id)
+            for word in new - old:
+                term = self._term(word)
+                self.postings[term].add(row.id)
+                self._bitmaps.pop(term, None)
+            self.words[row.id] = new
+            self._track(row)
+
+    def remove(self, employee_id: int):
+        with self._lock:
+            for word in self.words.pop(employee_id, ()):
+                self._unpost(self.vocab[word], employee_id)
+
+    def _unpost(self, term: int, employee_id: int):
+        self.postings[term].discard(employee_id)
+        self._bitmaps.pop(term, None)
+
+    def _bitmap(self, term: int) -> int:
+        bitmap = self._bitmaps.get(term)
+        if bitmap is None:
+            bitmap = bitmap_from_ids(self.postings[term])
+            if len(self.postings[term]) >= _CACHED_BITMAP_SIZE:
+                self._bitmaps[term] = bitmap
+        return bitmap
+
+    def match_word(self, word: str, prefix: bool = False) -> list:
+        """[(similarity, vocabulary word)] for one query word, best first."""
+        with self._lock:
+            return sorted(((sim, self.terms[term]) for sim, term in self._match(word, prefix)), reverse=True)
+
+    def _match(self, word: str, prefix: bool) -> list:
+        grams = trigrams(word)
+        shared_counts = Counter(itertools.chain.from_iterable(self.grams.get(gram, ()) for gram in grams))
+        edits = max_edits(word)
+        matches = []
+        for term, shared in shared_counts.items():
+            if not self.postings[term]:
+                continue
+            sim = shared / (len(grams) + self.sizes[term] - shared)
+            candidate = self.terms[term]
+            # A swap breaks up to four trigrams of an otherwise correct word, so it skips the threshold
+            if (sim >= FUZZY_SIMILARITY_THRESHOLD or is_transposition(word, candidate)) \
+                    and within_distance(word, candidate, edits):
+                matches.append((sim, term))
+            elif prefix and len(word) >= 3 and candidate.startswith(word):
+                matches.append((sim, term))
+        return matches
+
+    def search(self, text: str, allowed: int = None, limit: int = FUZZY_MAX_RESULTS) -> list:
+        """
+        [(employee id, score in [0, 1])] best first, up to limit. Every query
+        word must match some word of the profile; the score is the mean
+        similarity of each query word's best match. allowed (a filter_index
+        bitset) restricts the profiles.
+        """
+        return self.search_matches(text, allowed, limit)[0]
+
+    def search_matches(self, text: str, allowed: int = None, limit: int = FUZZY_MAX_RESULTS) -> tuple:
+        """search() plus the bitset of every matching profile, for totals and facets beyond limit."""
+        query_words = list(dict.fromkeys(words(text)))
+        if not query_words:
+            return [], 0
+        with self._lock:
+            per_word = []
+            for n, word in enumerate(query_words):
+                tiers = {}
+                for sim, term in self._match(word, prefix=n == len(query_words) - 1):
+                    sim = round(sim, 3)
+                    tiers[sim] = tiers.get(sim, 0) | self._bitmap(term)
+                # A profile counts at its best tier only
+                seen, word_tiers = 0, []
+                for sim in sorted(tiers, reverse=True):
+                    bitmap = tiers[sim] & ~seen
+                    seen |= tiers[sim]
+                    if allowed is not None:
+                        bitmap &= allowed
+                    if bitmap:
+                        word_tiers.append((sim, bitmap))
+                if not word_tiers:
+                    return [], 0
+                per_word.append(word_tiers)
+
+        # Profiles matching every word; each sits in exactly one tier per word
+        remaining = None
+        for word_tiers in per_word:
+            matched = 0
+            for _, bitmap in word_tiers:
+                matched |= bitmap
+            remaining = matched if remaining is None else remaining & matched
+        per_word = [[(sim, bitmap & remaining) for sim, bitmap in word_tiers if bitmap & remaining]
+                    for word_tiers in per_word]
+        if not remaining:
+            return [], 0
+        matched = remaining
+
+        # Tier combinations (one tier index per word) lazily, highest mean similarity first,
+        # until limit is filled or every matching profile has been returned
+        def total(combo):
+            return sum(per_word[w][i][0] for w, i in enumerate(combo))
+
+        start = (0,) * len(per_word)
+        heap, queued = [(-total(start), start)], {start}
+        results = []
+        while heap and remaining and len(results) < limit:
+            negative, combo = heapq.heappop(heap)
+            bitmap = remaining
+            for w, i in enumerate(combo):
+                bitmap &= per_word[w][i][1]
+                if not bitmap:
+                    break
+            if bitmap:
+                remaining &= ~bitmap
+                score = -negative / len(combo)
+                results.extend((emp_id, score) for emp_id in bitmap_ids(bitmap, limit=limit - len(results)))
+            for w, i in enumerate(combo):
+                if i + 1 < len(per_word[w]):
+                    following = combo[:w] + (i + 1,) + combo[w + 1:]
+                    if following not in queued:
+                        queued.add(following)
+                        heapq.heappush(heap, (-total(following), following))
+        return results, matched
+
+index = TrigramIndex()
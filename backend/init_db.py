@@ -2,13 +2,23 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import engine
+from app.database import engine, SessionLocal
 from app.models.base import Base
+from app.services import skill_aliases
 
 def init_db():
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
     print("Tables created successfully.")
+    # Alembic's skill_aliases migration seeds these; create_all does not
+    db = SessionLocal()
+    try:
+        added = skill_aliases.seed_defaults(db)
+        db.commit()
+    finally:
+        db.close()
+    if added:
+        print(f"Seeded {added} default skill aliases.")
 
 if __name__ == "__main__":
     init_db()
@@ -0,0 +1,254 @@
+"""
+Synthetic employees for load and scale testing.
+
+Usage:
+    python seed_synthetic.py --employees 100000 [--batch-size 2000] [--skew 1.1] [--bench-ratio 0.3]
+                             [--seed 42] [--users 50] [--password loadtest] [--reset]
+
+Skills, locations and clients follow a Zipf-like distribution (--skew 0 is
+uniform, larger values concentrate on the most popular entries), so search and
+JD scoring see realistic hot and cold terms. Rows are written with batched
+INSERT ... VALUES statements; work history and education are attached by
+looking up the new employee ids once per batch. Employee ids are SYN000000..
+and login users are loadtest-admin@example.com plus loadtest-user{n}@example.com.
+"""
+import sys
+import os
+import time
+import random
+import argparse
+from datetime import date, datetime, timedelta
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select, delete
+from app.database import SessionLocal, engine, Base
+from app.models.base import Employee, WorkMode, EmployeeStatus
+from app.models.work_history import WorkHistory
+from app.models.education import Education
+from app.models.user import User, UserRole
+from app.api.auth_utils import get_password_hash
+from app.services.llm_service import LLMService
+
+EMP_PREFIX = "SYN"
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "SQL", "React", "AWS", "TypeScript", "Node.js", "Docker", "Kubernetes",
+    "Spring Boot", "Angular", "C#", ".NET", "Azure", "Go", "Django", "FastAPI", "PostgreSQL", "MySQL",
+    "MongoDB", "Redis", "Kafka", "Terraform", "GCP", "Vue.js", "Flutter", "Kotlin", "Swift", "Scala",
+    "Spark", "Airflow", "Pandas", "TensorFlow", "PyTorch", "Machine Learning", "Power BI", "Tableau",
+    "Selenium", "Jenkins", "GraphQL", "Rust", "C++", "PHP", "Laravel", "Ruby on Rails", "Salesforce",
+    "SAP", "Snowflake", "Hadoop",
+]
+# Skills that tend to appear together, so stacks look like real profiles
+STACKS = [
+    ["Python", "Django", "PostgreSQL", "Redis"],
+    ["Python", "FastAPI", "Docker", "AWS"],
+    ["Java", "Spring Boot", "MySQL", "Kafka"],
+    ["JavaScript", "React", "Node.js", "TypeScript"],
+    ["C#", ".NET", "Azure", "SQL"],
+    ["Python", "Pandas", "Spark", "Airflow"],
+    ["Python", "Machine Learning", "TensorFlow", "PyTorch"],
+    ["Docker", "Kubernetes", "Terraform", "AWS"],
+    ["Angular", "TypeScript", "Node.js", "MongoDB"],
+    ["Kotlin", "Swift", "Flutter"],
+]
+LEVELS = ["Beginner", "Intermediate", "Advanced", "Expert"]
+LOCATIONS = [
+    "Pune", "Bangalore", "Hyderabad", "Mumbai", "Chennai", "Bhubaneswar", "Noida", "Gurgaon", "Kolkata",
+    "Ahmedabad", "Remote", "London", "New York", "Dubai", "Singapore",
+]
+FIRST_NAMES = [
+    "Aarav", "Vivaan", "Aditya", "Ananya", "Diya", "Ishaan", "Kavya", "Rohan", "Sneha", "Priya", "Rahul",
+    "Neha", "Arjun", "Meera", "Karan", "Pooja", "Vikram", "Sara", "Nikhil", "Tanvi", "Alex", "Sam", "Maria",
+]
+LAST_NAMES = [
+    "Sharma", "Patel", "Reddy", "Iyer", "Nair", "Gupta", "Kulkarni", "Das", "Mehta", "Joshi", "Rao",
+    "Singh", "Parida", "Lawande", "Khan", "Fernandes", "Smith", "Garcia",
+]
+COMPANIES = ["NeoSoft", "Infosys", "TCS", "Wipro", "Accenture", "Capgemini", "Cognizant", "HCL", "Startup Labs"]
+ROLES = ["Software Engineer", "Senior Software Engineer", "Tech Lead", "Data Engineer", "QA Engineer",
+         "DevOps Engineer", "Full Stack Developer", "Architect"]
+CLIENTS = ["Acme Bank", "Globex Retail", "Initech Insurance", "Umbrella Health", "Stark Logistics",
+           "Wayne Telecom", "Hooli Cloud", "Soylent Foods", "Vandelay Imports", "Tyrell Energy"]
+DOMAINS = ["payments platform", "claims processing", "e-commerce checkout", "data warehouse migration",
+           "mobile banking app", "supply chain analytics", "customer portal", "fraud detection pipeline"]
+INSTITUTIONS = ["IIT Bombay", "NIT Trichy", "Pune University", "BITS Pilani", "VIT Vellore", "Anna University"]
+DEGREES = [("B.Tech", "Computer Science"), ("B.E.", "Information Technology"), ("MCA", "Computer Applications"),
+           ("M.Tech", "Software Engineering"), ("B.Sc", "Mathematics")]
+
+
+def zipf_weights(n: int, skew: float) -> list:
+    return [1.0 / (rank ** skew) for rank in range(1, n + 1)]
+
+
+class ProfileGenerator:
+    """Deterministic for a given seed; index i always yields the same profile."""
+
+    def __init__(self, seed: int = 42, skew: float = 1.1, bench_ratio: float = 0.3):
+        self.seed = seed
+        self.bench_ratio = bench_ratio
+        self.skill_weights = zipf_weights(len(SKILLS), skew)
+        self.location_weights = zipf_weights(len(LOCATIONS), skew)
+        self.client_weights = zipf_weights(len(CLIENTS), skew)
+        self.phrases = LLMService(None)
+        self.now = datetime.utcnow()
+
+    def tech_stack(self, rng: random.Random, experience: float) -> list:
+        if rng.random() < 0.6:
+            names = list(rng.choice(STACKS))
+            names += rng.choices(SKILLS, weights=self.skill_weights, k=rng.randint(0, 2))
+        else:
+            names = rng.choices(SKILLS, weights=self.skill_weights, k=rng.randint(2, 6))
+        stack = []
+        for name in dict.fromkeys(names):
+            years = round(min(experience, rng.uniform(0.5, max(experience, 1.0))), 1)
+            level = LEVELS[min(3, int(years // 2.5))]
+            stack.append({"tech": name, "experience_years": years, "level": level})
+        return stack
+
+    def profile(self, i: int) -> dict:
+        rng = random.Random(f"{self.seed}:{i}")
+        experience = round(min(25.0, rng.expovariate(1 / 6)), 1)
+        tech = self.tech_stack(rng, experience)
+        status = EmployeeStatus.ON_BENCH if rng.random() < self.bench_ratio else EmployeeStatus.ON_CLIENT
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        location = rng.choices(LOCATIONS, weights=self.location_weights)[0]
+
+        work_history = []
+        start = date.today() - timedelta(days=int(experience * 365))
+        for _ in range(rng.randint(1, 4)):
+            end = start + timedelta(days=rng.randint(200, 1500))
+            skill = rng.choice(tech)["tech"]
+            work_history.append({
+                "company": rng.choice(COMPANIES),
+                "role": rng.choice(ROLES),
+                "start_date": start,
+                "end_date": end if end < date.today() else None,
+                "project": rng.choice(DOMAINS).title(),
+                "description": f"Built {rng.choice(DOMAINS)} features using {skill}.",
+            })
+            start = end
+
+        clients = [
+            {
+                "client_name": client,
+                "client_status": "Active" if status == EmployeeStatus.ON_CLIENT and n == 0 else "Completed",
+                "description": f"Delivered {rng.choice(DOMAINS)} for {client} with {rng.choice(tech)['tech']}.",
+            }
+            for n, client in enumerate(dict.fromkeys(
+                rng.choices(CLIENTS, weights=self.client_weights, k=rng.randint(0, 3))))
+        ]
+        degree, field = rng.choice(DEGREES)
+        education = [{
+            "institution": rng.choice(INSTITUTIONS),
+            "degree": degree,
+            "field_of_study": field,
+            "graduation_year": date.today().year - int(experience) - rng.randint(0, 2),
+        }]
+
+        row = {
+            "emp_id": f"{EMP_PREFIX}{i:06d}",
+            "name": name,
+            "email": f"{first}.{last}.{i}@synthetic.example.com".lower(),
+            "phone": f"+91{rng.randint(7000000000, 9999999999)}",
+            "location": location,
+            "tech": tech,
+            "level": max(1, min(10, int(experience // 2) + rng.randint(1, 3))),
+            "experience_years": experience,
+            "work_mode": rng.choice(list(WorkMode)),
+            "status": status,
+            "bandwidth": 100 if status == EmployeeStatus.ON_BENCH else rng.choice([0, 25, 50, 75]),
+            "career_summary": f"{ROLES[min(len(ROLES) - 1, int(experience // 3))]} with {experience} years "
+                              f"in {', '.join(t['tech'] for t in tech[:3])}.",
+            "clients": clients,
+            "created_at": self.now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+            "last_updated": self.now,
+        }
+        # Template phrase up front, marked fresh so the background worker skips these rows
+        row["search_phrase"] = self.phrases.generate_search_phrase({
+            **row,
+            "status": status.value,
+            "work_mode": row["work_mode"].value,
+            "work_history": work_history,
+        })
+        row["search_phrase_updated_at"] = self.now
+        return {"employee": row, "work_history": work_history, "education": education}
+
+
+def load(db, generator: ProfileGenerator, count: int, batch_size: int, start: int = 0) -> float:
+    started = time.perf_counter()
+    for offset in range(start, start + count, batch_size):
+        batch = [generator.profile(i) for i in range(offset, min(offset + batch_size, start + count))]
+        db.execute(insert(Employee), [p["employee"] for p in batch])
+        emp_ids = [p["employee"]["emp_id"] for p in batch]
+        ids = dict(db.execute(select(Employee.emp_id, Employee.id).where(Employee.emp_id.in_(emp_ids))).all())
+        history, education = [], []
+        for p in batch:
+            emp_pk = ids[p["employee"]["emp_id"]]
+            history.extend({**h, "employee_id": emp_pk} for h in p["work_history"])
+            education.extend({**e, "employee_id": emp_pk} for e in p["education"])
+        if history:
+            db.execute(insert(WorkHistory), history)
+        if education:
+            db.execute(insert(Education), education)
+        db.commit()
+        done = offset + len(batch) - start
+        rate = done / (time.perf_counter() - started)
+        print(f"  {done}/{count} employees ({rate:.0f}/s)", end="\r", flush=True)
+    print()
+    return time.perf_counter() - started
+
+
+def reset(db):
+    synthetic = select(Employee.id).where(Employee.emp_id.like(f"{EMP_PREFIX}%")).scalar_subquery()
+    db.execute(delete(WorkHistory).where(WorkHistory.employee_id.in_(synthetic)))
+    db.execute(delete(Education).where(Education.employee_id.in_(synthetic)))
+    db.execute(delete(Employee).where(Employee.emp_id.like(f"{EMP_PREFIX}%")))
+    db.execute(delete(User).where(User.email.like("loadtest-%@example.com")))
+    db.commit()
+
+
+def create_users(db, count: int, password: str):
+    # One hash for all: same password, and hashing per user would dominate small runs
+    hashed = get_password_hash(password)
+    existing = {e for (e,) in db.query(User.email).filter(User.email.like("loadtest-%@example.com"))}
+    rows = [{"email": "loadtest-admin@example.com", "name": "Load Test Admin", "role": UserRole.ADMIN}]
+    rows += [{"email": f"loadtest-user{n}@example.com", "name": f"Load Test User {n}", "role": UserRole.USER}
+             for n in range(count)]
+    rows = [{**r, "hashed_password": hashed, "is_active": True} for r in rows if r["email"] not in existing]
+    if rows:
+        db.execute(insert(User), rows)
+        db.commit()
+    return len(rows)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--bench-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--password", default="loadtest")
+    parser.add_argument("--reset", action="store_true", help="delete previously generated rows first")
+    args = parser.parse_args(argv)
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if args.reset:
+            reset(db)
+        start = db.query(Employee).filter(Employee.emp_id.like(f"{EMP_PREFIX}%")).count()
+        generator = ProfileGenerator(seed=args.seed, skew=args.skew, bench_ratio=args.bench_ratio)
+        print(f"Generating {args.employees} employees (starting at {EMP_PREFIX}{start:06d})...")
+        elapsed = load(db, generator, args.employees, args.batch_size, start=start)
+        users = create_users(db, args.users, args.password)
+        print(f"Inserted {args.employees} employees in {elapsed:.1f}s and {users} users")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
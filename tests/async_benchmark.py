@@ -0,0 +1,164 @@
+"""
+Requests/sec of the sync (threadpool + Session) and async (AsyncSession) request
+paths at increasing concurrency.
+
+Usage:
+    python tests/async_benchmark.py [--url URL] [--concurrency 50,200] [--requests 1000] [--db-latency-ms 50]
+
+Both endpoints run the read_employee query; the sync one is the previous
+`def` + get_db implementation, which occupies one of the 40 threadpool workers
+while it waits on the database. Without --url a temporary SQLite file is used
+and every query is slowed down by --db-latency-ms inside SQLite (standing in
+for MySQL round trips), which blocks the sync driver's thread but not the event
+loop of the async one.
+
+Expect the sync path to collapse once concurrency exceeds the pool: sessions
+are closed by the dependency teardown, which itself waits for a threadpool
+slot, so checked-out connections pile up until checkouts time out.
+"""
+import sys
+import os
+import time
+import random
+import asyncio
+import tempfile
+import argparse
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import httpx
+from fastapi import FastAPI, Depends, HTTPException
+from sqlalchemy import create_engine, event, select, func
+from sqlalchemy.orm import Session, sessionmaker, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from app.database import Base, build_engine_args, to_async_url
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeResponse
+
+def seed(url: str, count: int = 1000):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    if db.query(Employee).count() == 0:
+        db.add_all(
+            Employee(emp_id=f"E{i:05d}", name=f"Employee {i}", email=f"e{i}@example.com",
+                     tech=[{"tech": "Python", "experience_years": i % 10, "level": "Advanced"}])
+            for i in range(count)
+        )
+        db.commit()
+    db.close()
+    engine.dispose()
+    return count
+
+def add_latency(sync_engine, latency_ms: float):
+    @event.listens_for(sync_engine, "connect")
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+def build_app(url: str, latency_ms: float) -> FastAPI:
+    engine = create_engine(url, **build_engine_args(url))
+    async_url = to_async_url(url)
+    async_engine = create_async_engine(async_url, **build_engine_args(async_url))
+    delay = None
+    if url.startswith("sqlite") and latency_ms > 0:
+        add_latency(engine, latency_ms)
+        add_latency(async_engine.sync_engine, latency_ms)
+        delay = func.sleep_ms(latency_ms) == 0
+
+    SyncSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    AsyncSessionFactory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSessionFactory() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync/{emp_id}", response_model=EmployeeResponse)
+    def read_sync(emp_id: str, db: Session = Depends(get_db)):
+        query = db.query(Employee).filter(Employee.emp_id == emp_id)
+        if delay is not None:
+            query = query.filter(delay)
+        emp = query.first()
+        if emp is None:
+            raise HTTPException(status_code=404)
+        return emp
+
+    @app.get("/async/{emp_id}", response_model=EmployeeResponse)
+    async def read_async(emp_id: str, db: AsyncSession = Depends(get_async_db)):
+        stmt = select(Employee).options(selectinload(Employee.work_history), selectinload(Employee.education))
+        stmt = stmt.filter(Employee.emp_id == emp_id)
+        if delay is not None:
+            stmt = stmt.filter(delay)
+        emp = (await db.execute(stmt)).scalars().first()
+        if emp is None:
+            raise HTTPException(status_code=404)
+        return emp
+
+    app.state.engines = (engine, async_engine)
+    return app
+
+async def run(app: FastAPI, path: str, count: int, concurrency: int, requests: int) -> dict:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    latencies, failures = [], 0
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(f"{path}/E{random.randrange(count):05d}")
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal failures
+            while not queue.empty():
+                url = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(url)
+                if response.status_code != 200:
+                    failures += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": round(requests / wall, 1),
+        "p50_ms": round(latencies[len(latencies) // 2], 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)], 1),
+        "failures": failures,
+    }
+
+async def compare(app: FastAPI, count: int, levels: list, requests: int):
+    # One event loop for all runs: the async pool's connections belong to it
+    print(f"{'path':<6} {'conc':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'fail':>5}")
+    for concurrency in levels:
+        for path in ("/sync", "/async"):
+            r = await run(app, path, count, concurrency, requests)
+            print(f"{path[1:]:<6} {concurrency:>5} {r['rps']:>8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['failures']:>5}")
+    await app.state.engines[1].dispose()
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url")
+    parser.add_argument("--concurrency", default="50,200")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--db-latency-ms", type=float, default=50)
+    args = parser.parse_args(argv)
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'async_bench.db')}"
+    count = seed(url)
+    app = build_app(url, args.db_latency_ms)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    asyncio.run(compare(app, count, levels, args.requests))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
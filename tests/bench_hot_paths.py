@@ -0,0 +1,313 @@
+"""
+pytest-benchmark micro-benchmarks for the per-request hot functions.
+
+Not collected by a plain `pytest tests/` run (the file name does not start
+with test_); run it through tests/run_benchmarks.py, which saves baselines and
+compares against them, or directly:
+    python -m pytest tests/bench_hot_paths.py --benchmark-only
+
+Inputs are pinned: profiles come from seed_synthetic.ProfileGenerator with a
+fixed seed and the JD / parsed JD / credentials are constants, so two runs on
+the same machine measure the same work.
+"""
+import sys
+import os
+import tempfile
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("pytest_benchmark")
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.database import Base
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.work_history import WorkHistory
+from app.models.education import Education
+from app.schemas.employee import EmployeeResponse
+from app.services import ranking, filter_index, suggest_index, trigram_index, candidates, parallel_scoring
+from app.services.llm_service import LLMService
+from app.api import auth_utils
+from seed_synthetic import ProfileGenerator, load
+
+SEED = 1234
+PROFILES = 200
+JD = ("Looking for a senior Python developer with 5+ years of experience. Must know FastAPI, "
+      "Docker and AWS; Kafka or Spark for the data pipeline is a plus.")
+PARSED_JD = {
+    "required_skills": ["Python", "FastAPI", "Docker", "AWS"],
+    "minimum_experience_years": 5,
+    "keywords": ["python", "fastapi", "docker", "aws", "kafka", "spark", "pipeline"],
+}
+PASSWORD = "benchmark-password"
+PINNED_TIME = datetime(2026, 1, 1)
+INDEXED_EMPLOYEES = 100_000
+# Employees in the SQLite database the candidate-loading benchmarks read
+SCORED_EMPLOYEES = 5_000
+# Candidates in the parallel scoring benchmark (an org-wide JD search with no filters)
+PARALLEL_CANDIDATES = 100_000
+
+
+def _employee(i: int, profile: dict) -> Employee:
+    emp = Employee(id=i + 1, **{**profile["employee"], "last_updated": PINNED_TIME})
+    emp.work_history = [WorkHistory(id=n + 1, employee_id=i + 1, **h) for n, h in enumerate(profile["work_history"])]
+    emp.education = [Education(id=n + 1, employee_id=i + 1, **e) for n, e in enumerate(profile["education"])]
+    return emp
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    generator = ProfileGenerator(seed=SEED)
+    return [generator.profile(i) for i in range(PROFILES)]
+
+
+@pytest.fixture(scope="module")
+def employees(profiles):
+    # Transient ORM objects: same attribute access as query results, no database
+    return [_employee(i, p) for i, p in enumerate(profiles)]
+
+
+@pytest.fixture(scope="module")
+def llm_service():
+    return LLMService(None)
+
+
+@pytest.fixture(scope="module")
+def filter_rows(profiles):
+    # INDEXED_EMPLOYEES rows cycling through the pinned profiles' filter columns
+    rows = []
+    for i in range(INDEXED_EMPLOYEES):
+        emp = profiles[i % PROFILES]["employee"]
+        rows.append(SimpleNamespace(id=i + 1, status=emp["status"], work_mode=emp["work_mode"],
+                                    location=emp["location"], level=emp["level"], bandwidth=emp["bandwidth"],
+                                    experience_years=emp["experience_years"] + (i % 7) / 10,
+                                    tech=emp["tech"], last_updated=PINNED_TIME))
+    return rows
+
+
+@pytest.fixture(scope="module")
+def suggest_rows(profiles):
+    # INDEXED_EMPLOYEES rows; first/last names recombined so most names are distinct
+    rows = []
+    for i in range(INDEXED_EMPLOYEES):
+        emp = profiles[i % PROFILES]["employee"]
+        last = profiles[(i // PROFILES * 7 + i) % PROFILES]["employee"]["name"].split()[-1]
+        rows.append(SimpleNamespace(id=i + 1, name=f"{emp['name'].split()[0]} {last}", emp_id=f"EMP{i + 1:06d}",
+                                    tech=emp["tech"], location=emp["location"],
+                                    clients=emp["clients"], search_phrase=emp["search_phrase"],
+                                    last_updated=PINNED_TIME))
+    return rows
+
+
+@pytest.mark.benchmark(group="scoring")
+def test_compute_match_score(benchmark, llm_service, employees):
+    def score_all():
+        return [llm_service.compute_match_score(emp, PARSED_JD) for emp in employees]
+    assert len(benchmark(score_all)) == PROFILES
+
+
+@pytest.mark.benchmark(group="scoring")
+def test_regex_fallback_rank(benchmark, employees):
+    ranked = benchmark(ranking.regex_fallback_rank, employees, JD)
+    assert all(emp.match_score >= 50 for emp in ranked)
+
+
+@pytest.mark.benchmark(group="scoring")
+def test_basic_rank(benchmark, employees):
+    def rank_all():
+        return sorted(employees, key=lambda emp: ranking.basic_rank(emp, "python"), reverse=True)
+    assert len(benchmark(rank_all)) == PROFILES
+
+
+@pytest.mark.benchmark(group="profiles")
+def test_generate_search_phrase(benchmark, llm_service, profiles):
+    def phrase_all():
+        return [llm_service.generate_search_phrase({**p["employee"], "work_history": p["work_history"]})
+                for p in profiles]
+    assert len(benchmark(phrase_all)) == PROFILES
+
+
+@pytest.mark.benchmark(group="profiles")
+def test_employee_response_serialization(benchmark, employees):
+    def serialize_all():
+        return [EmployeeResponse.model_validate(emp).model_dump(mode="json") for emp in employees]
+    assert len(benchmark(serialize_all)) == PROFILES
+
+
+@pytest.mark.benchmark(group="auth")
+def test_jwt_encode(benchmark):
+    token = benchmark(auth_utils.create_access_token, {"sub": "bench@example.com"})
+    assert token.count(".") == 2
+
+
+@pytest.mark.benchmark(group="auth")
+def test_jwt_decode(benchmark):
+    token = auth_utils.create_access_token({"sub": "bench@example.com"})
+    payload = benchmark(auth_utils.jwt.decode, token, auth_utils.SECRET_KEY, algorithms=[auth_utils.ALGORITHM])
+    assert payload["sub"] == "bench@example.com"
+
+
+@pytest.mark.benchmark(group="auth")
+def test_verify_password(benchmark):
+    hashed = auth_utils.get_password_hash(PASSWORD)
+    assert benchmark(auth_utils.verify_password, PASSWORD, hashed)
+
+
+@pytest.mark.benchmark(group="filters")
+def test_filter_index_build(benchmark, filter_rows):
+    index = filter_index.FilterIndex()
+    benchmark(index.build, filter_rows)
+    assert len(index) == INDEXED_EMPLOYEES
+
+
+@pytest.mark.benchmark(group="filters")
+def test_filter_index_match_page(benchmark, filter_rows):
+    index = filter_index.FilterIndex()
+    index.build(filter_rows)
+
+    def match_page():
+        matches = index.match(status="ON_CLIENT", bandwidth=50, experience=3.5)
+        return filter_index.bitmap_ids(matches, skip=100, limit=50)
+    assert len(benchmark(match_page)) == 50
+
+
+@pytest.mark.benchmark(group="filters")
+def test_filter_index_facets(benchmark, filter_rows):
+    index = filter_index.FilterIndex()
+    index.build(filter_rows)
+    matches = index.match(bandwidth=50)
+    facets = benchmark(index.facets, matches)
+    assert sum(f["count"] for f in facets["status"]) == matches.bit_count()
+
+
+@pytest.mark.benchmark(group="suggest")
+def test_suggest_index_build(benchmark, suggest_rows):
+    index = suggest_index.SuggestIndex()
+    benchmark.pedantic(index.build, args=(suggest_rows,), rounds=3)
+    assert len(index) == INDEXED_EMPLOYEES
+
+
+@pytest.fixture(scope="module")
+def suggest_built(suggest_rows):
+    index = suggest_index.SuggestIndex()
+    index.build(suggest_rows)
+    return index
+
+
+@pytest.mark.benchmark(group="suggest")
+@pytest.mark.parametrize("prefix", ["a", "sa", "pyt", "emp0012"])
+def test_suggest_lookup(benchmark, suggest_built, prefix):
+    assert benchmark(suggest_built.suggest, prefix, 10)
+
+
+@pytest.fixture(scope="module")
+def trigram_built(suggest_rows):
+    index = trigram_index.TrigramIndex()
+    index.build(suggest_rows)
+    return index
+
+
+@pytest.mark.benchmark(group="fuzzy")
+def test_trigram_index_build(benchmark, suggest_rows):
+    index = trigram_index.TrigramIndex()
+    benchmark.pedantic(index.build, args=(suggest_rows,), rounds=3)
+    assert len(index) == INDEXED_EMPLOYEES
+
+
+@pytest.mark.benchmark(group="fuzzy")
+@pytest.mark.parametrize("query", ["kubernets", "pythn fastapi", "doc"])
+def test_fuzzy_search(benchmark, trigram_built, query):
+    assert benchmark(trigram_built.search, query)
+
+
+@pytest.fixture(scope="module")
+def scoring_sessions():
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    load(db, ProfileGenerator(seed=SEED), count=SCORED_EMPLOYEES, batch_size=500)
+    db.close()
+    return factory
+
+
+def _orm_scoring(db):
+    # The JD path before candidates: full instances, work history lazy-loaded per row by the scorer
+    scorer = LLMService(db)
+    rows = db.query(Employee).all()
+    for emp in rows:
+        emp.match_score = scorer.compute_match_score(emp, PARSED_JD)["match_score"]
+    return rows
+
+
+def _candidate_scoring(db):
+    scorer = LLMService(db)
+    pool = candidates.load(db, db.query(Employee))
+    for candidate in pool:
+        candidate.match_score = scorer.compute_match_score(candidate, PARSED_JD)["match_score"]
+    return pool
+
+
+def _bytes_per_row(factory, load_rows) -> float:
+    db = factory()
+    try:
+        tracemalloc.start()
+        rows = load_rows(db)
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return retained / len(rows)
+    finally:
+        db.close()
+
+
+@pytest.mark.benchmark(group="candidates")
+@pytest.mark.parametrize("path", ["orm", "candidates"])
+def test_load_and_score_candidates(benchmark, scoring_sessions, path):
+    load_rows = _orm_scoring if path == "orm" else _candidate_scoring
+
+    def run():
+        # A fresh session per round, so no identity map carries rows over
+        db = scoring_sessions()
+        try:
+            return len(load_rows(db))
+        finally:
+            db.close()
+    benchmark.extra_info["bytes_per_candidate"] = round(_bytes_per_row(scoring_sessions, load_rows))
+    assert benchmark.pedantic(run, rounds=5) == SCORED_EMPLOYEES
+    benchmark.extra_info["candidates_per_sec"] = round(SCORED_EMPLOYEES / benchmark.stats.stats.mean)
+
+
+@pytest.fixture(scope="module")
+def candidate_pool(profiles):
+    pool = []
+    for i in range(PARALLEL_CANDIDATES):
+        p = profiles[i % PROFILES]
+        emp = p["employee"]
+        pool.append(candidates.Candidate(i + 1, emp["name"], emp["emp_id"], emp["tech"], emp["experience_years"],
+                                         emp["bandwidth"], emp["clients"], emp["career_summary"], emp["search_phrase"],
+                                         PINNED_TIME, None, len(p["work_history"])))
+    return pool
+
+
+@pytest.mark.benchmark(group="parallel-scoring")
+@pytest.mark.parametrize("workers", sorted({1, 2, 4, os.cpu_count() or 1}))
+def test_parallel_scoring(benchmark, candidate_pool, workers):
+    threshold = parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES
+    parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES = 1
+    try:
+        # Start the pool outside the timed rounds
+        parallel_scoring.rank(candidate_pool[:workers * 10], PARSED_JD, workers=workers)
+        ranked = benchmark.pedantic(parallel_scoring.rank, args=(candidate_pool, PARSED_JD),
+                                    kwargs={"top_k": 100, "workers": workers}, rounds=3)
+    finally:
+        parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES = threshold
+        parallel_scoring.shutdown()
+    benchmark.extra_info["cpu_count"] = os.cpu_count()
+    assert len(ranked) == 100
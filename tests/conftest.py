@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+# Helpers shared by several test modules; import them with `from conftest import ...`
+# so each module still runs on its own (pytest or `python tests/test_x.py`).
+import tempfile
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models import base  # Ensures all models are registered
+from app.models.user import UserRole
+from seed_synthetic import ProfileGenerator, load
+
+ADMIN = SimpleNamespace(role=UserRole.ADMIN, email="admin@x.com")
+USER = SimpleNamespace(role=UserRole.USER, email="user@x.com")
+
+
+def seeded_db(count=300):
+    """A file-backed SQLite database with `count` synthetic profiles; returns (url, session)."""
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'seeded.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    load(db, ProfileGenerator(seed=9), count=count, batch_size=100)
+    return url, db
@@ -0,0 +1,329 @@
+"""
+Fake OpenAI-compatible LLM server for offline and load testing of the
+LLM-dependent endpoints (JD parsing, profile generation, search phrases,
+embeddings) with no model and no network.
+
+Usage:
+    python tests/fake_llm_server.py [--host 127.0.0.1] [--port 11434] [--script responses.json]
+                                    [--latency lognormal:120,0.5] [--token-ms 15] [--error-rate 0.02]
+                                    [--error-status 500,503,429] [--hang-rate 0] [--max-concurrency 4]
+                                    [--max-queue 16] [--seed 7] [--models qwen3,llama3:latest]
+
+then point LLM settings (api_base) at http://127.0.0.1:11434/v1, as for Ollama.
+
+Endpoints:
+    POST /v1/chat/completions   JSON or text; "stream": true answers with SSE chunks
+    POST /v1/embeddings         the backend's HashingEmbedder vectors (stable across runs)
+    GET  /api/tags, /v1/models  the --models list
+    GET  /fake/stats            requests, errors, rejections, peak concurrency
+
+Replies: the first rule of --script whose "match" regex is found in the last
+user message (and whose "model", if given, equals the request's) answers with
+its "response" (a string, or an object sent as JSON) or fails with its
+"status". Without a matching rule, JD extraction prompts get the backend's
+local JD parse, other JSON requests a profile-shaped object, and text
+requests a fixed sentence. Latency, errors and hangs are drawn from a
+random.Random(--seed), so a run with the same request sequence repeats.
+
+Latency specs (milliseconds): fixed:MS, uniform:LOW,HIGH, normal:MEAN,STDDEV,
+lognormal:MEDIAN,SIGMA, exp:MEAN. Requests beyond --max-concurrency wait;
+beyond --max-queue waiting they are refused with 503, as Ollama does.
+"""
+import sys
+import os
+import re
+import json
+import math
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.services import jd_parser
+from app.services.embedding_index import HashingEmbedder
+from seed_synthetic import SKILLS
+
+JD_MARKER = "JD CONTENT:"
+TEXT_REPLY = "Experienced engineer delivering reliable backend and cloud solutions."
+ERROR_TYPES = {400: "invalid_request_error", 429: "rate_limit_error", 500: "server_error", 503: "server_overloaded"}
+
+
+def parse_latency(spec: str):
+    """'kind:a,b' -> function(rng) returning seconds."""
+    kind, _, args = (spec or "fixed:0").partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    samplers = {
+        "fixed": lambda rng: values[0],
+        "uniform": lambda rng: rng.uniform(values[0], values[1]),
+        "normal": lambda rng: rng.gauss(values[0], values[1]),
+        "lognormal": lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+        "exp": lambda rng: rng.expovariate(1 / values[0]),
+    }
+    if kind not in samplers:
+        raise ValueError(f"Unknown latency distribution '{kind}' (use {', '.join(samplers)})")
+    sampler = samplers[kind]
+    return lambda rng: max(sampler(rng), 0.0) / 1000
+
+
+class FakeLLMConfig:
+    def __init__(self, rules=None, latency: str = "fixed:0", token_ms: float = 0.0, error_rate: float = 0.0,
+                 error_statuses=(500,), hang_rate: float = 0.0, hang_seconds: float = 600.0,
+                 max_concurrency: int = 0, max_queue: int = 0, seed: int = 0,
+                 models=("qwen3", "llama3:latest"), embedding_dim: int = 256):
+        self.rules = [dict(rule, pattern=re.compile(rule.get("match", ""), re.I)) for rule in rules or []]
+        self.latency = parse_latency(latency)
+        self.token_ms = token_ms
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.max_concurrency = max_concurrency  # 0 = unlimited
+        self.max_queue = max_queue
+        self.seed = seed
+        self.models = list(models)
+        self.embedding_dim = embedding_dim
+
+
+def _error(status: int, message: str, headers=None):
+    return JSONResponse(
+        {"error": {"message": message, "type": ERROR_TYPES.get(status, "server_error"), "code": status}},
+        status_code=status, headers=headers,
+    )
+
+
+def _last_user_message(messages) -> str:
+    for message in reversed(messages or []):
+        if message.get("role") == "user":
+            content = message.get("content")
+            if isinstance(content, list):  # content parts
+                return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+            return content or ""
+    return ""
+
+
+def _default_reply(prompt: str, json_mode: bool, dictionary) -> str:
+    if JD_MARKER in prompt:
+        return json.dumps(jd_parser.parse_jd_locally(prompt.split(JD_MARKER, 1)[1], dictionary))
+    if json_mode:
+        return json.dumps({
+            "tech_stack": dictionary.find(prompt), "work_history": [], "education": [], "email": None,
+            "phone": None, "location": None, "status": None, "bandwidth": None, "work_mode": None,
+            "experience": jd_parser.extract_min_experience(prompt), "career_summary": None, "search_phrase": None,
+        })
+    return TEXT_REPLY
+
+
+def create_app(config: FakeLLMConfig) -> FastAPI:
+    app = FastAPI(title="Fake LLM server")
+    rng = random.Random(config.seed)
+    dictionary = jd_parser.SkillDictionary(SKILLS)
+    embedder = HashingEmbedder(config.embedding_dim)
+    stats = {"requests": 0, "errors": 0, "rejected": 0, "in_flight": 0, "peak_in_flight": 0, "waiting": 0}
+    slots = asyncio.Semaphore(config.max_concurrency) if config.max_concurrency else None
+
+    async def admit():
+        """None when admitted, else the 503 response; callers release() after admission."""
+        stats["requests"] += 1
+        if slots is not None:
+            if slots.locked() and stats["waiting"] >= config.max_queue:
+                stats["rejected"] += 1
+                return _error(503, "server busy, please try again. maximum pending requests exceeded")
+            stats["waiting"] += 1
+            try:
+                await slots.acquire()
+            finally:
+                stats["waiting"] -= 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        return None
+
+    def release():
+        stats["in_flight"] -= 1
+        if slots is not None:
+            slots.release()
+
+    async def delay_or_fail():
+        """Sleeps the drawn latency; returns an injected error response, if any."""
+        latency, failing, hanging = config.latency(rng), rng.random() < config.error_rate, rng.random() < config.hang_rate
+        status = rng.choice(config.error_statuses)
+        await asyncio.sleep(config.hang_seconds if hanging else latency)
+        if failing:
+            stats["errors"] += 1
+            headers = {"Retry-After": "1"} if status == 429 else None
+            return _error(status, "injected failure", headers)
+        return None
+
+    def match_rule(prompt: str, model: str):
+        for rule in config.rules:
+            if rule.get("model") not in (None, model):
+                continue
+            if rule["pattern"].search(prompt):
+                return rule
+        return None
+
+    def usage(prompt: str, reply: str) -> dict:
+        prompt_tokens, completion_tokens = len(prompt.split()), len(reply.split())
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        prompt = _last_user_message(body.get("messages"))
+        json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+
+        rejected = await admit()
+        if rejected is not None:
+            return rejected
+        streaming = False
+        try:
+            failure = await delay_or_fail()
+            if failure is not None:
+                return failure
+            rule = match_rule(prompt, model)
+            if rule is not None and rule.get("status"):
+                stats["errors"] += 1
+                return _error(rule["status"], rule.get("message", "scripted failure"))
+            if rule is not None:
+                reply = rule["response"] if isinstance(rule["response"], str) else json.dumps(rule["response"])
+            else:
+                reply = _default_reply(prompt, json_mode, dictionary)
+
+            completion_id, created = f"chatcmpl-{uuid.uuid4().hex[:12]}", int(time.time())
+            if body.get("stream"):
+                streaming = True
+                return StreamingResponse(stream(completion_id, created, model, prompt, reply),
+                                         media_type="text/event-stream")
+            return {
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply},
+                             "finish_reason": "stop"}],
+                "usage": usage(prompt, reply),
+            }
+        finally:
+            # A stream keeps its slot until the last chunk is sent
+            if not streaming:
+                release()
+
+    async def stream(completion_id, created, model, prompt, reply):
+        def chunk(delta, finish_reason=None, **extra):
+            return "data: " + json.dumps({
+                "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}], **extra,
+            }) + "\n\n"
+        try:
+            yield chunk({"role": "assistant", "content": ""})
+            for token in re.findall(r"\S+\s*", reply):
+                if config.token_ms:
+                    await asyncio.sleep(config.token_ms / 1000)
+                yield chunk({"content": token})
+            yield chunk({}, "stop", usage=usage(prompt, reply))
+            yield "data: [DONE]\n\n"
+        finally:
+            release()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        texts = body.get("input")
+        texts = [texts] if isinstance(texts, str) else texts or []
+        rejected = await admit()
+        if rejected is not None:
+            return rejected
+        try:
+            failure = await delay_or_fail()
+            if failure is not None:
+                return failure
+            vectors = embedder.embed(texts)
+        finally:
+            release()
+        tokens = sum(len(t.split()) for t in texts)
+        return {
+            "object": "list", "model": body.get("model", "fake"),
+            "data": [{"object": "embedding", "index": i, "embedding": vec} for i, vec in enumerate(vectors)],
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": name, "model": name, "modified_at": "2026-01-01T00:00:00Z", "size": 0,
+                            "digest": uuid.uuid5(uuid.NAMESPACE_DNS, name).hex} for name in config.models]}
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": name, "object": "model", "created": 0, "owned_by": "fake"}
+                                           for name in config.models]}
+
+    @app.get("/fake/stats")
+    async def fake_stats():
+        return dict(stats)
+
+    return app
+
+
+class ServerThread:
+    """Runs the fake server in a background thread (for tests); port 0 picks a free port."""
+
+    def __init__(self, config: FakeLLMConfig, host: str = "127.0.0.1", port: int = 0):
+        self.server = uvicorn.Server(uvicorn.Config(create_app(config), host=host, port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, name="fake-llm-server", daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError("Fake LLM server did not start")
+            time.sleep(0.01)
+        host, port = self.server.servers[0].sockets[0].getsockname()[:2]
+        self.base_url = f"http://{host}:{port}"
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(10)
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--script", help="JSON list of {match, model?, response | status, message?} rules")
+    parser.add_argument("--latency", default="fixed:0", help="latency distribution in ms, e.g. lognormal:120,0.5")
+    parser.add_argument("--token-ms", type=float, default=0.0, help="delay between streamed tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", default="500", help="comma-separated statuses injected errors use")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="share of requests that never answer in time")
+    parser.add_argument("--hang-seconds", type=float, default=600.0)
+    parser.add_argument("--max-concurrency", type=int, default=0, help="requests served at once (0 = unlimited)")
+    parser.add_argument("--max-queue", type=int, default=0, help="requests waiting for a slot before 503s")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--models", default="qwen3,llama3:latest")
+    parser.add_argument("--embedding-dim", type=int, default=256)
+    args = parser.parse_args()
+
+    rules = []
+    if args.script:
+        with open(args.script) as f:
+            rules = json.load(f)
+    config = FakeLLMConfig(
+        rules=rules, latency=args.latency, token_ms=args.token_ms, error_rate=args.error_rate,
+        error_statuses=[int(s) for s in args.error_status.split(",")], hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds, max_concurrency=args.max_concurrency, max_queue=args.max_queue,
+        seed=args.seed, models=args.models.split(","), embedding_dim=args.embedding_dim,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
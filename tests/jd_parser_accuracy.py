@@ -0,0 +1,46 @@
+"""
+Compares the local JD parser against cached LLM outputs.
+
+Usage:
+    python tests/jd_parser_accuracy.py [cache.json]
+
+The cache is a list of {"jd": ..., "llm": <parse_jd_with_llm output>}. The skill
+dictionary is built from the skills in the cache itself, or from the configured
+database when --db is passed.
+"""
+import sys
+import os
+import json
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.services.jd_parser import SkillDictionary, compare_with_llm, get_skill_dictionary
+
+DEFAULT_CACHE = os.path.join(os.path.dirname(__file__), 'fixtures', 'jd_llm_cache.json')
+
+def main(argv):
+    use_db = "--db" in argv
+    args = [a for a in argv if a != "--db"]
+    cache_path = args[0] if args else DEFAULT_CACHE
+    with open(cache_path) as f:
+        cases = json.load(f)
+
+    if use_db:
+        from app.database import SessionLocal
+        db = SessionLocal()
+        try:
+            dictionary = get_skill_dictionary(db)
+        finally:
+            db.close()
+    else:
+        dictionary = SkillDictionary(s for c in cases for s in c["llm"].get("required_skills", []))
+
+    report = compare_with_llm(cases, dictionary)
+    for i, detail in enumerate(report.pop("details")):
+        if detail["missing"] or detail["extra"] or not detail["experience_match"]:
+            print(f"Case {i}: missing={detail['missing']} extra={detail['extra']} exp_ok={detail['experience_match']}")
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,189 @@
+"""
+Offline load test for a running EMS API (e.g. `uvicorn app.main:app` on a
+database filled by backend/seed_synthetic.py).
+
+Usage:
+    python tests/load_test.py [--base-url http://localhost:8000] [--users 50] [--duration 60]
+                              [--ramp 10] [--employees 10000] [--mix search=50,jd=15,update=10,read=20,login=5]
+                              [--think-ms 100] [--json report.json]
+
+Each virtual user logs in as loadtest-admin@example.com, then repeatedly picks
+a scenario by weight:
+    search  GET /api/employees/search?query=<skill|name>[&status=]
+    jd      GET /api/employees/search?jd=<generated job description>
+    read    GET /api/employees/{emp_id}
+    update  GET + PUT /api/employees/{emp_id} with a changed bandwidth
+    login   POST /api/auth/login as a random loadtest-user{n}
+and the report lists requests, errors, req/s and p50/p95/p99 latency per scenario.
+"""
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+import argparse
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import httpx
+from seed_synthetic import SKILLS, FIRST_NAMES, EMP_PREFIX
+
+DEFAULT_MIX = "search=50,jd=15,update=10,read=20,login=5"
+JD_TEMPLATES = [
+    "Looking for a {0} developer with {n}+ years of experience. Must know {1} and {2}.",
+    "We need a senior engineer skilled in {0}, {1} and {2}, minimum {n} years.",
+    "Backend role: {0} and {1} required, {2} is a plus. {n}-{m} years experience.",
+]
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, name: str, ms: float, ok: bool):
+        self.latencies.setdefault(name, []).append(ms)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, elapsed: float) -> dict:
+        rows = {}
+        for name, values in sorted(self.latencies.items()):
+            values.sort()
+            rows[name] = {
+                "requests": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 1),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(values[-1], 1),
+            }
+        return rows
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, stats: Stats, args, rng: random.Random):
+        self.client = client
+        self.stats = stats
+        self.args = args
+        self.rng = rng
+        self.headers = {}
+
+    async def timed(self, name: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.stats.record(name, (time.perf_counter() - start) * 1000, ok)
+        return response if ok else None
+
+    async def login(self, email: str, name: str = "login"):
+        response = await self.timed(name, "POST", "/api/auth/login",
+                                    data={"username": email, "password": self.args.password})
+        return response.json()["access_token"] if response is not None else None
+
+    def random_emp_id(self) -> str:
+        return f"{EMP_PREFIX}{self.rng.randrange(self.args.employees):06d}"
+
+    async def search(self):
+        term = self.rng.choice(SKILLS) if self.rng.random() < 0.8 else self.rng.choice(FIRST_NAMES)
+        params = {"query": term}
+        if self.rng.random() < 0.3:
+            params["status"] = self.rng.choice(["ON_BENCH", "ON_CLIENT"])
+        await self.timed("search", "GET", "/api/employees/search", params=params, headers=self.headers)
+
+    async def jd(self):
+        skills = self.rng.sample(SKILLS, 3)
+        n = self.rng.randint(2, 8)
+        text = self.rng.choice(JD_TEMPLATES).format(*skills, n=n, m=n + 3)
+        await self.timed("jd", "GET", "/api/employees/search", params={"jd": text}, headers=self.headers)
+
+    async def read(self):
+        await self.timed("read", "GET", f"/api/employees/{self.random_emp_id()}", headers=self.headers)
+
+    async def update(self):
+        emp_id = self.random_emp_id()
+        response = await self.timed("read", "GET", f"/api/employees/{emp_id}", headers=self.headers)
+        if response is None:
+            return
+        body = response.json()
+        for key in ("id", "last_updated", "match_score"):
+            body.pop(key, None)
+        body["bandwidth"] = self.rng.choice([0, 25, 50, 75, 100])
+        await self.timed("update", "PUT", f"/api/employees/{emp_id}", json=body, headers=self.headers)
+
+    async def login_scenario(self):
+        await self.login(f"loadtest-user{self.rng.randrange(self.args.login_users)}@example.com")
+
+    async def run(self, mix: dict, deadline: float):
+        token = await self.login("loadtest-admin@example.com", name="login_admin")
+        if token is None:
+            return
+        self.headers = {"Authorization": f"Bearer {token}"}
+        scenarios = {
+            "search": self.search, "jd": self.jd, "read": self.read,
+            "update": self.update, "login": self.login_scenario,
+        }
+        names = list(mix)
+        weights = [mix[n] for n in names]
+        while time.monotonic() < deadline:
+            await scenarios[self.rng.choices(names, weights=weights)[0]]()
+            if self.args.think_ms:
+                await asyncio.sleep(self.rng.uniform(0, 2 * self.args.think_ms) / 1000)
+
+async def run(args) -> dict:
+    mix = {k: float(v) for k, v in (item.split("=") for item in args.mix.split(","))}
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        started = time.monotonic()
+        deadline = started + args.duration
+        tasks = []
+        for n in range(args.users):
+            user = VirtualUser(client, stats, args, random.Random(args.seed + n))
+            tasks.append(asyncio.create_task(user.run(mix, deadline)))
+            if args.ramp:
+                await asyncio.sleep(args.ramp / args.users)
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - started
+    return {"users": args.users, "duration_s": round(elapsed, 1), "scenarios": stats.report(elapsed)}
+
+def print_report(report: dict):
+    print(f"\n{report['users']} users, {report['duration_s']}s")
+    print(f"{'scenario':<12} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, r in report["scenarios"].items():
+        print(f"{name:<12} {r['requests']:>9} {r['errors']:>7} {r['rps']:>8} "
+              f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['max_ms']:>8}")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--ramp", type=float, default=10, help="seconds to start all users")
+    parser.add_argument("--employees", type=int, default=10000, help="synthetic employees in the database")
+    parser.add_argument("--login-users", type=int, default=50)
+    parser.add_argument("--password", default="loadtest")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--think-ms", type=float, default=100)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
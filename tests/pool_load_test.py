@@ -0,0 +1,123 @@
+"""
+Load test for the SQLAlchemy connection pool: SQLAlchemy defaults vs the tuned
+DB_POOL_* settings, at several concurrency levels.
+
+Usage:
+    python tests/pool_load_test.py [--url URL] [--concurrency 50,200] [--requests 2000] [--hold-ms 20]
+
+Each simulated request checks out a session (as get_db does), runs the
+employee listing query, keeps the connection for --hold-ms (the rest of the
+request) and releases it. Without --url a temporary SQLite file with 500
+employees is used.
+"""
+import sys
+import os
+import time
+import tempfile
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, build_engine_args
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+
+def seed(url: str, count: int = 500):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    if db.query(Employee).count() == 0:
+        db.add_all(
+            Employee(emp_id=f"E{i:05d}", name=f"Employee {i}", email=f"e{i}@example.com",
+                     tech=[{"tech": "Python", "experience_years": i % 10, "level": "Advanced"}])
+            for i in range(count)
+        )
+        db.commit()
+    db.close()
+    engine.dispose()
+
+def default_engine_args(url: str) -> dict:
+    # What database.py did before the pool became configurable
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False, "timeout": 30}}
+    return {}
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+def run(url: str, engine_args: dict, concurrency: int, requests: int, hold_ms: float) -> dict:
+    engine = create_engine(url, **engine_args)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    latencies, errors = [], {"timeout": 0, "other": 0}
+    lock = threading.Lock()
+
+    def one_request(_):
+        start = time.perf_counter()
+        try:
+            db = Session()
+            try:
+                db.query(Employee).order_by(Employee.id).limit(50).all()
+                time.sleep(hold_ms / 1000)
+            finally:
+                db.close()
+        except PoolTimeoutError:
+            with lock:
+                errors["timeout"] += 1
+            return
+        except Exception:
+            with lock:
+                errors["other"] += 1
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(requests)))
+    wall = time.perf_counter() - started
+    engine.dispose()
+
+    latencies.sort()
+    return {
+        "ok": len(latencies),
+        "timeouts": errors["timeout"],
+        "errors": errors["other"],
+        "rps": round(len(latencies) / wall, 1),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+    }
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url")
+    parser.add_argument("--concurrency", default="50,200")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--hold-ms", type=float, default=20)
+    args = parser.parse_args(argv)
+
+    url = args.url
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'pool_load.db')}"
+        seed(url)
+
+    configs = {"default": default_engine_args(url), "tuned": build_engine_args(url)}
+    print(f"{'pool':<8} {'conc':>5} {'ok':>6} {'timeout':>8} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        for name, engine_args in configs.items():
+            r = run(url, engine_args, concurrency, args.requests, args.hold_ms)
+            print(f"{name:<8} {concurrency:>5} {r['ok']:>6} {r['timeouts']:>8} {r['errors']:>5} "
+                  f"{r['rps']:>8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+"""
+Runs the micro-benchmarks in tests/bench_hot_paths.py, saving a baseline or
+comparing against one.
+
+Usage:
+    python tests/run_benchmarks.py                          # just run and print
+    python tests/run_benchmarks.py --save baseline          # store results as "baseline"
+    python tests/run_benchmarks.py --compare baseline [--threshold 15] [--stat median]
+    python tests/run_benchmarks.py -k jwt                   # extra args go to pytest
+
+Results are stored by pytest-benchmark under tests/.benchmarks/<machine>/
+(one JSON file per saved run); a baseline is only meaningful on the machine
+that recorded it. --compare exits non-zero when any benchmark's --stat is more
+than --threshold percent slower than in the baseline.
+"""
+import sys
+import os
+import glob
+import argparse
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+STORAGE = os.path.join(TESTS_DIR, ".benchmarks")
+SUITE = os.path.join(TESTS_DIR, "bench_hot_paths.py")
+
+
+def resolve_baseline(name: str) -> str:
+    """Latest saved run called `name` (pytest-benchmark itself only globs on the run-number prefix)."""
+    if name.isdigit():
+        return name
+    runs = sorted(glob.glob(os.path.join(STORAGE, "*", f"[0-9][0-9][0-9][0-9]_{name}.json")),
+                  key=os.path.basename)
+    if not runs:
+        raise SystemExit(f"No saved benchmark run named {name!r} in {STORAGE}")
+    return runs[-1]
+
+
+def pytest_args(args, extra: list) -> list:
+    argv = [SUITE, "--benchmark-only", f"--benchmark-storage=file://{STORAGE}", "-q"]
+    if args.save:
+        argv.append(f"--benchmark-save={args.save}")
+    if args.compare:
+        argv += [f"--benchmark-compare={resolve_baseline(args.compare)}",
+                 f"--benchmark-compare-fail={args.stat}:{args.threshold}%"]
+    return argv + extra
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", help="name to store this run under")
+    parser.add_argument("--compare", help="saved run to compare against (name or run number)")
+    parser.add_argument("--threshold", type=int, default=int(os.getenv("BENCHMARK_THRESHOLD", "10")),
+                        help="allowed slowdown in percent (default 10, or $BENCHMARK_THRESHOLD)")
+    parser.add_argument("--stat", default="median", choices=["min", "mean", "median"],
+                        help="statistic compared against the baseline")
+    args, extra = parser.parse_known_args(argv)
+    return pytest.main(pytest_args(args, extra))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
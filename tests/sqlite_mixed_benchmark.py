@@ -0,0 +1,140 @@
+"""
+Mixed search/update traffic against SQLite with the default profile (rollback
+journal, one shared pool) and the production profile (WAL, pragmas, single
+writer connection + reader pool).
+
+Usage:
+    python tests/sqlite_mixed_benchmark.py [--db PATH] [--readers 16] [--writers 4] [--seconds 10] [--employees 5000]
+
+Without --db a temporary database is seeded. Pass --db backend/ems.db to run
+against a copy of the local database (the file itself is never modified).
+"""
+import sys
+import os
+import time
+import shutil
+import random
+import tempfile
+import argparse
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, create_engines
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.services.ranking import keyword_filter
+
+SEARCH_TERMS = ["python", "java", "react", "employee 1", "aws", "E0004"]
+TECHS = ["Python", "Java", "React", "AWS", "Go", "Kubernetes", "SQL"]
+
+def seed(path: str, count: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        Employee(emp_id=f"E{i:05d}", name=f"Employee {i}", email=f"e{i}@example.com",
+                 tech=[{"tech": random.choice(TECHS), "experience_years": i % 10, "level": "Advanced"}],
+                 career_summary=f"Engineer number {i} working with {random.choice(TECHS)}")
+        for i in range(count)
+    )
+    db.commit()
+    db.close()
+    engine.dispose()
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))] if values else 0.0
+
+def run(path: str, profile: str, readers: int, writers: int, seconds: float) -> dict:
+    writer_engine, reader_engine = create_engines(f"sqlite:///{path}", sqlite_profile=profile)
+    WriteSession = sessionmaker(autocommit=False, autoflush=False, bind=writer_engine)
+    ReadSession = sessionmaker(autocommit=False, autoflush=False, bind=reader_engine)
+    with ReadSession() as db:
+        max_id = db.query(Employee).count()
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {"read": [], "write": [], "errors": 0}
+
+    def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            db = ReadSession()
+            try:
+                db.query(Employee).filter(keyword_filter(random.choice(SEARCH_TERMS))).limit(50).all()
+            except Exception:
+                with lock:
+                    stats["errors"] += 1
+                continue
+            finally:
+                db.close()
+            with lock:
+                stats["read"].append((time.perf_counter() - start) * 1000)
+
+    def writer():
+        while not stop.is_set():
+            start = time.perf_counter()
+            db = WriteSession()
+            try:
+                db.execute(update(Employee).where(Employee.id == random.randint(1, max_id))
+                           .values(bandwidth=random.randint(0, 100)))
+                db.commit()
+            except Exception:
+                db.rollback()
+                with lock:
+                    stats["errors"] += 1
+                continue
+            finally:
+                db.close()
+            with lock:
+                stats["write"].append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    writer_engine.dispose()
+    reader_engine.dispose()
+
+    return {
+        "reads_per_s": round(len(stats["read"]) / seconds, 1),
+        "writes_per_s": round(len(stats["write"]) / seconds, 1),
+        "read_p95_ms": round(percentile(stats["read"], 95), 1),
+        "write_p95_ms": round(percentile(stats["write"], 95), 1),
+        "errors": stats["errors"],
+    }
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db")
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--employees", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp()
+    source = os.path.join(workdir, "source.db")
+    if args.db:
+        shutil.copyfile(args.db, source)
+    else:
+        seed(source, args.employees)
+
+    print(f"{'profile':<11} {'reads/s':>9} {'writes/s':>9} {'read p95':>9} {'write p95':>10} {'errors':>7}")
+    for profile in ("default", "production"):
+        # Fresh copy per run: the production profile converts the file to WAL
+        path = os.path.join(workdir, f"{profile}.db")
+        shutil.copyfile(source, path)
+        r = run(path, profile, args.readers, args.writers, args.seconds)
+        print(f"{profile:<11} {r['reads_per_s']:>9} {r['writes_per_s']:>9} {r['read_p95_ms']:>9} "
+              f"{r['write_p95_ms']:>10} {r['errors']:>7}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
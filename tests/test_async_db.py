@@ -0,0 +1,57 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+import tempfile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import Base, to_async_url
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee, EmployeeStatus
+from app.models.work_history import WorkHistory
+from app.models.user import User, UserRole
+from app.api import dashboard, employees
+from app.api.auth_utils import get_current_user, create_access_token
+
+def test_async_url_mapping():
+    assert to_async_url("mysql+pymysql://u:p@db:3306/ems") == "mysql+aiomysql://u:p@db:3306/ems"
+    assert to_async_url("sqlite:///./ems.db") == "sqlite+aiosqlite:///./ems.db"
+    assert to_async_url("postgresql+asyncpg://db/ems") == "postgresql+asyncpg://db/ems"
+    print("✅ Async URL mapping verified.")
+
+def test_async_endpoints():
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'async.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    emp = Employee(emp_id="E1", name="Alice", email="a@x.com", status=EmployeeStatus.ON_BENCH)
+    emp.work_history.append(WorkHistory(company="Acme", role="Dev"))
+    db.add_all([emp, Employee(emp_id="E2", name="Bob", email="b@x.com", status=EmployeeStatus.ON_CLIENT),
+                User(email="u@x.com", hashed_password="x", role=UserRole.USER)])
+    db.commit()
+    db.close()
+
+    async def run():
+        async_engine = create_async_engine(to_async_url(url))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        async with Session() as session:
+            result = await dashboard.get_metrics(session)
+            assert result == {"total_employees": 2, "on_bench": 1, "billable": 1, "bench_percentage": 50.0}
+
+            loaded = await employees.read_employee("E1", session)
+            assert loaded.work_history[0].company == "Acme"
+
+            user = await get_current_user(create_access_token({"sub": "u@x.com"}), session)
+            assert user.email == "u@x.com"
+        await async_engine.dispose()
+
+    asyncio.run(run())
+    print("✅ Async metrics, employee and user lookups verified.")
+
+if __name__ == "__main__":
+    test_async_url_mapping()
+    test_async_endpoints()
@@ -0,0 +1,55 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.models.employee import Employee
+from app.services import candidates, embedding_index, ranking, tokenizer
+from app.services.llm_service import LLMService
+from app.api import employees
+from conftest import ADMIN, seeded_db
+
+JD = "Senior Python developer with Docker and AWS, 4+ years, for a payments platform"
+PARSED_JD = {"required_skills": ["Python", "Docker", "AWS"], "minimum_experience_years": 4}
+FILTERS = {"name": None, "tech": None, "status": None, "bandwidth": None, "experience": None}
+
+def test_candidates_score_like_orm_rows():
+    _, db = seeded_db(60)
+    pool = candidates.load(db, db.query(Employee))
+    rows = {emp.id: emp for emp in db.query(Employee)}
+    assert sorted(c.id for c in pool) == sorted(rows)
+    assert not hasattr(pool[0], "__dict__")
+
+    scorer = LLMService(db)
+    candidates.attach_history(db, pool)
+    for c in pool:
+        emp = rows[c.id]
+        assert c.work_history_count == len(emp.work_history)
+        assert scorer.compute_match_score(c, PARSED_JD) == scorer.compute_match_score(emp, PARSED_JD)
+        assert ranking.basic_rank(c, "python") == ranking.basic_rank(emp, "python")
+        assert tokenizer.profile_text(c) == tokenizer.profile_text(emp)
+    print("✅ Candidates score like ORM rows.")
+
+def test_jd_search_ranks_candidates_and_loads_results():
+    _, db = seeded_db(80)
+    # Without JD embedding similarity, so the expected scores need no model
+    enabled = embedding_index.SEMANTIC_SEARCH_ENABLED
+    embedding_index.SEMANTIC_SEARCH_ENABLED = False
+    try:
+        results = employees._search_sync(db, ADMIN, None, JD, None, "rrf", {}, 0, 50, FILTERS)
+    finally:
+        embedding_index.SEMANTIC_SEARCH_ENABLED = enabled
+
+    scorer = LLMService(db)
+    parsed_jd = scorer.parse_jd(JD)
+    expected = sorted(((scorer.compute_match_score(emp, parsed_jd)["match_score"], emp.id)
+                       for emp in db.query(Employee)), key=lambda pair: -pair[0])
+    assert [(r.match_score, r.id) for r in results] == expected
+    # The response still carries the relationships
+    assert all(r.work_history is not None for r in results)
+    print("✅ JD search over candidates verified.")
+
+if __name__ == "__main__":
+    test_candidates_score_like_orm_rows()
+    test_jd_search_ranks_candidates_and_loads_results()
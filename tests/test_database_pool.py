@@ -0,0 +1,50 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+from sqlalchemy import create_engine, text
+from app.database import build_engine_args, make_async_engine, make_engine, pool_status
+from app import database
+from app.services import metrics
+
+def test_pool_args_from_settings():
+    args = build_engine_args("mysql+pymysql://u:p@db/ems", pool_size=7, max_overflow=3,
+                             pool_timeout=2, pool_recycle=600, pool_pre_ping=True)
+    assert args == {"pool_pre_ping": True, "pool_size": 7, "max_overflow": 3,
+                    "pool_timeout": 2, "pool_recycle": 600}
+    memory = build_engine_args("sqlite://")
+    assert "pool_size" not in memory and memory["connect_args"]["check_same_thread"] is False
+    print("✅ Pool arguments verified.")
+
+def test_pool_status_and_gauge():
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'pool.db')}"
+    engine = make_engine(url, pool_size=3, max_overflow=2, pool_recycle=60)
+    metrics.instrument_engine(engine, name="pool_test")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["class"] == "QueuePool"
+        assert status["size"] == 3 and status["checked_out"] == 1 and status["overflow"] == 0
+        assert status["max_overflow"] == 2 and status["recycle"] == 60 and status["pre_ping"] is True
+        assert 'ems_db_pool_connections{engine="pool_test",state="checked_out"} 1' in metrics.render_prometheus()
+    assert pool_status(engine)["checked_in"] == 1
+    assert pool_status(create_engine("sqlite://")) == {"class": "SingletonThreadPool"}
+    # Engines made elsewhere report live counters only
+    assert "max_overflow" not in pool_status(create_engine(url))
+    print("✅ Pool status verified.")
+
+def test_async_pool_sized_separately():
+    url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'pool.db')}"
+    status = pool_status(make_async_engine(url, pool_size=4, max_overflow=1).sync_engine)
+    assert status["size"] == 4 and status["max_overflow"] == 1
+    default = pool_status(make_async_engine(url).sync_engine)
+    assert default["size"] == database.DB_ASYNC_POOL_SIZE and default["max_overflow"] == database.DB_ASYNC_MAX_OVERFLOW
+    print("✅ Async pool sizing verified.")
+
+if __name__ == "__main__":
+    test_pool_args_from_settings()
+    test_pool_status_and_gauge()
+    test_async_pool_sized_separately()
@@ -0,0 +1,177 @@
+import sys
+import os
+import tempfile
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from app.api import users
+from app.models.employee import Employee
+from app.models.user import User
+from app.services import embedding_index, outbox
+from app.services.embedding_index import EmbeddingIndex, HashingEmbedder, profile_text
+from app.services.llm_service import LLMService
+from conftest import seeded_db
+
+PROFILES = {
+    1: "Machine learning engineer building XGBoost and ARIMA forecasting models in Python",
+    2: "Java Spring Boot backend developer for enterprise banking apps",
+    3: "React TypeScript frontend developer, design systems",
+}
+
+def _build(directory):
+    embedder = HashingEmbedder()
+    index = EmbeddingIndex(directory, embedder.name, embedder.dim)
+    for emp_id, text in PROFILES.items():
+        index.upsert(emp_id, embedder.embed([text])[0])
+    index.flush()
+    return embedder, index
+
+def test_search_ranks_related_profile_first():
+    with tempfile.TemporaryDirectory() as d:
+        embedder, index = _build(d)
+        results = index.search(embedder.embed(["python machine learning models"])[0], k=3)
+        assert results[0][0] == 1
+        assert results[0][1] > results[-1][1]
+        index.close()
+    print("✅ Semantic search ranking verified.")
+
+def test_index_persists_and_updates_incrementally():
+    with tempfile.TemporaryDirectory() as d:
+        embedder, index = _build(d)
+        index.upsert(2, embedder.embed(["machine learning python models"])[0])
+        index.remove(3)
+        index.close()
+
+        reopened = EmbeddingIndex(d, embedder.name, embedder.dim)
+        assert len(reopened) == 2
+        assert reopened.rows == 3  # row 3 is free for reuse, not compacted
+        sims = reopened.similarities(embedder.embed(["machine learning python models"])[0], [1, 2, 3])
+        assert set(sims) == {1, 2}
+        assert abs(sims[2] - 1.0) < 1e-5
+        reopened.upsert(4, embedder.embed(["golang"])[0])
+        assert reopened.rows == 3
+        reopened.close()
+    print("✅ Memory-mapped index persistence verified.")
+
+def test_index_reset_on_embedder_change():
+    with tempfile.TemporaryDirectory() as d:
+        _, index = _build(d)
+        index.close()
+        other = EmbeddingIndex(d, "ollama-other-model", 8)
+        assert len(other) == 0
+        other.close()
+    print("✅ Index reset on embedder change verified.")
+
+def test_two_processes_share_rows():
+    # Two worker processes open the same files; each keeps its own in-memory structures
+    with tempfile.TemporaryDirectory() as d:
+        embedder = HashingEmbedder()
+        worker_a = EmbeddingIndex(d, embedder.name, embedder.dim)
+        worker_b = EmbeddingIndex(d, embedder.name, embedder.dim)
+        worker_a.upsert(1, embedder.embed([PROFILES[1]])[0])
+        worker_b.upsert(2, embedder.embed([PROFILES[2]])[0])
+        assert len(worker_a) == 2 and worker_a.row_of == worker_b.row_of
+        assert worker_a.search(embedder.embed([PROFILES[2]])[0], k=1)[0][0] == 2
+        worker_b.remove(1)
+        assert worker_a.similarities(embedder.embed([PROFILES[1]])[0], [1, 2]).keys() == {2}
+        worker_a.upsert(3, embedder.embed([PROFILES[3]])[0])  # reuses the row worker B freed
+        worker_a.close()
+        worker_b.close()
+
+        reopened = EmbeddingIndex(d, embedder.name, embedder.dim)
+        assert reopened.row_of == {2: 1, 3: 0} and reopened.rows == 2
+        reopened.close()
+    print("✅ Shared index across processes verified.")
+
+def test_deleting_user_drops_employee_embedding():
+    _, db = seeded_db(10)
+    emp, other = db.query(Employee).limit(2).all()
+    users_ = [User(email=e.email, hashed_password="x") for e in (emp, other)]
+    db.add_all(users_)
+    db.commit()
+    directory, opened = embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index
+    with tempfile.TemporaryDirectory() as d:
+        embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index = os.path.join(d, "index"), None
+        try:
+            # Without an open index the delete is left to the outbox; nothing is built
+            users.delete_user(users_[0].id, db, SimpleNamespace(id=0))
+            assert not os.path.exists(embedding_index.EMBEDDING_INDEX_DIR)
+
+            index = embedding_index.get_index(db)
+            assert emp.id not in index.row_of and len(index) == 9
+            users.delete_user(users_[1].id, db, SimpleNamespace(id=0))
+            assert other.id not in index.row_of and len(index) == 8
+        finally:
+            if embedding_index._index is not None:
+                embedding_index._index.close()
+            embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index = directory, opened
+    print("✅ Deleting a user drops the employee embedding.")
+
+def test_outbox_deletes_reach_other_processes():
+    _, db = seeded_db(10)
+    ids = [e.id for e in db.query(Employee).order_by(Employee.id).limit(3)]
+    with tempfile.TemporaryDirectory() as d:
+        embedder = HashingEmbedder(64)
+        index = EmbeddingIndex(d, embedder.name, embedder.dim)
+        embedding_index.rebuild_index(db, index, embedder)
+        # Deleted by a worker without the index open: only the outbox row is written
+        for employee_id in ids[:2]:
+            db.delete(db.get(Employee, employee_id))
+            outbox.record(db, employee_id, outbox.DELETE)
+        outbox.record(db, ids[2], outbox.UPDATE)
+        db.commit()
+
+        embedding_index.apply_deletes(db, index)
+        assert ids[0] not in index.row_of and ids[1] not in index.row_of and ids[2] in index.row_of
+        index.close()
+        # The applied position is saved, so a reopened index does not replay the deletes
+        reopened = EmbeddingIndex(d, embedder.name, embedder.dim)
+        assert reopened.meta["outbox_position"] == outbox.latest_position(db)
+        assert len(reopened) == 8
+        reopened.close()
+    print("✅ Outbox deletes reach indexes opened elsewhere.")
+
+def test_lsh_probe_path_matches_exact_scan():
+    with tempfile.TemporaryDirectory() as d:
+        embedder, index = _build(d)
+        query = embedder.embed(["frontend react typescript"])[0]
+        exact = index.search(query, k=1)
+        original = embedding_index.EXACT_SCAN_ROWS
+        embedding_index.EXACT_SCAN_ROWS = 0
+        try:
+            assert index.search(query, k=1) == exact
+        finally:
+            embedding_index.EXACT_SCAN_ROWS = original
+        index.close()
+    print("✅ LSH probing verified.")
+
+def test_jd_similarity_component():
+    service = LLMService(MagicMock())
+    emp = MagicMock(tech=[{"tech": "Python"}], experience_years=5.0, bandwidth=100,
+                    work_history=[], clients=[], career_summary="", search_phrase="")
+    parsed = {"required_skills": ["Python"], "minimum_experience_years": 2, "keywords": []}
+    base = service.compute_match_score(emp, parsed)["match_score"]
+    assert base == 90.0
+    assert service.compute_match_score(emp, parsed, jd_similarity=1.0)["match_score"] == 91.5
+    assert service.compute_match_score(emp, parsed, jd_similarity=0.0)["match_score"] == 76.5
+    print("✅ JD similarity blending verified.")
+
+def test_profile_text():
+    emp = MagicMock(search_phrase="ML Engineer", career_summary=None, tech=[{"tech": "PyTorch"}],
+                    work_history=[MagicMock(role="Data Scientist", project="Churn", description=None)])
+    text = profile_text(emp)
+    assert "ML Engineer" in text and "PyTorch" in text and "Data Scientist Churn" in text
+
+if __name__ == "__main__":
+    test_search_ranks_related_profile_first()
+    test_index_persists_and_updates_incrementally()
+    test_index_reset_on_embedder_change()
+    test_two_processes_share_rows()
+    test_deleting_user_drops_employee_embedding()
+    test_outbox_deletes_reach_other_processes()
+    test_lsh_probe_path_matches_exact_scan()
+    test_jd_similarity_component()
+    test_profile_text()
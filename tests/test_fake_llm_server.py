@@ -0,0 +1,68 @@
+import sys
+import os
+import json
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import httpx
+from openai import OpenAI
+from app.services.llm_service import LLMService
+from app.services.embedding_index import OllamaEmbedder, HashingEmbedder
+from fake_llm_server import FakeLLMConfig, ServerThread
+
+JD = "Backend engineer with Python, Docker and AWS, 5+ years of experience"
+
+def _service(base_url):
+    service = LLMService(None)
+    service._settings = SimpleNamespace(provider="Ollama", api_base=base_url + "/v1", model_name="qwen3")
+    return service
+
+def test_llm_service_against_fake_server():
+    rules = [{"match": "payments", "response": {"required_skills": ["Go"], "minimum_experience_years": 3, "keywords": []}}]
+    with ServerThread(FakeLLMConfig(rules=rules, models=["qwen3", "nomic-embed-text"])) as server:
+        service = _service(server.base_url)
+        parsed = service.parse_jd_with_llm(JD)
+        assert {"Python", "Docker", "AWS"} <= set(parsed["required_skills"])
+        assert parsed["minimum_experience_years"] == 5
+        # Scripted rules come first
+        assert service.parse_jd_with_llm("Go developer for payments")["required_skills"] == ["Go"]
+        assert service.fetch_available_models("ollama") == ["qwen3", "nomic-embed-text"]
+
+        # Embeddings are the local hashing vectors
+        embedder = OllamaEmbedder(server.base_url + "/v1")
+        assert embedder.embed(["python developer"]) == HashingEmbedder(256).embed(["python developer"])
+
+        # Streaming returns the same reply in chunks
+        client = OpenAI(base_url=server.base_url + "/v1", api_key="ollama")
+        chunks = list(client.chat.completions.create(
+            model="qwen3", messages=[{"role": "user", "content": "Say something"}], stream=True))
+        streamed = "".join(c.choices[0].delta.content or "" for c in chunks if c.choices)
+        reply = client.chat.completions.create(model="qwen3", messages=[{"role": "user", "content": "Say something"}])
+        assert len(chunks) > 3 and streamed == reply.choices[0].message.content
+        assert reply.usage.completion_tokens == len(streamed.split())
+    print("✅ LLMService works against the fake server.")
+
+def test_injected_errors_and_concurrency_limit():
+    with ServerThread(FakeLLMConfig(error_rate=1.0, error_statuses=[503])) as server:
+        # The client's retries fail too, so parsing falls back to an empty result
+        assert _service(server.base_url).parse_jd_with_llm(JD)["required_skills"] == []
+        assert httpx.get(server.base_url + "/fake/stats").json()["errors"] >= 1
+
+    config = FakeLLMConfig(latency="fixed:300", max_concurrency=1, max_queue=1)
+    with ServerThread(config) as server:
+        body = {"model": "qwen3", "messages": [{"role": "user", "content": json.dumps({"name": "A"})}]}
+        with ThreadPoolExecutor(3) as pool:
+            statuses = sorted(pool.map(lambda _: httpx.post(server.base_url + "/v1/chat/completions",
+                                                            json=body, timeout=10).status_code, range(3)))
+        stats = httpx.get(server.base_url + "/fake/stats").json()
+        # One served, one queued, one refused
+        assert statuses == [200, 200, 503]
+        assert stats["rejected"] == 1 and stats["peak_in_flight"] == 1
+    print("✅ Error injection and concurrency limits verified.")
+
+if __name__ == "__main__":
+    test_llm_service_against_fake_server()
+    test_injected_errors_and_concurrency_limit()
@@ -0,0 +1,166 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+import itertools
+import tempfile
+from types import SimpleNamespace
+from sqlalchemy import create_engine, select, update, delete
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import Base, to_async_url
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.user import UserRole
+from app.services import filter_index
+from app.api import employees
+from seed_synthetic import ProfileGenerator, load
+
+ADMIN = SimpleNamespace(role=UserRole.ADMIN, email="admin@x.com")
+
+def _seeded(count=600, null_bandwidth=True):
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'filters.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    load(db, ProfileGenerator(seed=5), count=count, batch_size=200)
+    # Values that fall inside buckets, plus NULLs the SQL filters exclude
+    db.execute(update(Employee).where(Employee.id % 7 == 0).values(bandwidth=33, experience_years=3.3))
+    db.execute(update(Employee).where(Employee.id % 11 == 0).values(experience_years=None))
+    if null_bandwidth:
+        db.execute(update(Employee).where(Employee.id % 13 == 0).values(bandwidth=None))
+        db.execute(update(Employee).where(Employee.id % 17 == 0).values(bandwidth=-10))
+    db.commit()
+    return url, db
+
+def test_bitmap_helpers():
+    bitmap = filter_index.bitmap_from_ids([3, 0, 64, 9])
+    assert filter_index.bitmap_ids(bitmap) == [0, 3, 9, 64]
+    assert filter_index.bitmap_ids(bitmap, skip=1, limit=2) == [3, 9]
+    assert filter_index.bitmap_ids(0) == []
+    print("✅ Bitmap helpers verified.")
+
+def test_index_matches_sql_filters():
+    url, db = _seeded()
+    index = filter_index.FilterIndex()
+    index.ensure_fresh(db)
+    assert len(index) == 600
+
+    for status, bandwidth, experience in itertools.product(
+            [None, "ON_BENCH", "ON_CLIENT"], [None, "0", "25", "33", "60", "100"], [None, "0.5", "3", "3.3", "7"]):
+        sql = employees._apply_search_filters(db.query(Employee.id), ADMIN, status=status,
+                                              bandwidth=bandwidth, experience=experience)
+        expected = sorted(row.id for row in sql.all())
+        got = filter_index.bitmap_ids(index.match(**employees._index_filters(status, bandwidth, experience)))
+        assert got == expected, (status, bandwidth, experience)
+
+    assert index.match(location=" pune ") == index.match(location="Pune") != 0
+    print("✅ Bitmap filters agree with SQL.")
+
+def test_writes_and_catch_up():
+    url, db = _seeded(100)
+    index = filter_index.FilterIndex()
+    index.ensure_fresh(db)
+
+    emp = db.get(Employee, 1)
+    emp.bandwidth = 0
+    db.commit()
+    index.upsert(emp)
+    assert not index.match(bandwidth=5) & (1 << 1)
+
+    # Writes from elsewhere: picked up by the next sync (updates) or a rebuild (deletes)
+    db.execute(update(Employee).where(Employee.id == 2).values(bandwidth=100, last_updated=emp.last_updated))
+    db.execute(delete(Employee).where(Employee.id == 3))
+    db.commit()
+    index.synced_at = 0.0
+    index.ensure_fresh(db)
+    assert index.match(bandwidth=100) & (1 << 2)
+    assert not index.all & (1 << 3) and len(index) == 99
+    print("✅ Index write paths and catch-up verified.")
+
+def test_search_endpoint_pages_from_index():
+    url, db = _seeded(120, null_bandwidth=False)
+    expected = [row.id for row in db.query(Employee.id).filter(Employee.status == "ON_BENCH")
+                .order_by(Employee.id).offset(5).limit(10)]
+    original, original_sessions = filter_index.index, employees.ReadSessionLocal
+    enabled = filter_index.FILTER_INDEX_ENABLED
+    filter_index.index = filter_index.FilterIndex()
+    # The index syncs through its own read session in the threadpool
+    employees.ReadSessionLocal = sessionmaker(bind=db.get_bind())
+
+    async def run(skip, limit, current_user=ADMIN):
+        async_engine = create_async_engine(to_async_url(url))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        async with Session() as session:
+            results = await employees.search_employees(
+                query=None, name=None, tech=None, status="ON_BENCH", bandwidth=None, experience=None,
+                jd=None, mode=None, fusion="rrf", w_keyword=None, w_skill=None, w_semantic=None,
+                skip=skip, limit=limit, facets=True, fuzzy=False, db=session, current_user=current_user)
+        await async_engine.dispose()
+        return results
+
+    try:
+        results = asyncio.run(run(5, 10))
+        # Without skip/limit every match is returned, as before the index
+        unpaged = asyncio.run(run(0, None))
+        filter_index.FILTER_INDEX_ENABLED = False
+        unpaged_sql = asyncio.run(run(0, None))
+    finally:
+        filter_index.FILTER_INDEX_ENABLED = enabled
+        filter_index.index, employees.ReadSessionLocal = original, original_sessions
+    on_bench = db.query(Employee).filter(Employee.status == "ON_BENCH").count()
+    assert [r.id for r in results.results] == expected
+    assert results.total == on_bench
+    assert [f.value for f in results.facets["status"]] == ["ON_BENCH"]
+    assert len(unpaged.results) == unpaged.total == on_bench
+    assert sorted(r.id for r in unpaged_sql.results) == [r.id for r in unpaged.results]
+    print("✅ Indexed search endpoint verified.")
+
+def test_facets_match_row_counts():
+    url, db = _seeded(300)
+    index = filter_index.FilterIndex()
+    index.ensure_fresh(db)
+    rows = db.execute(select(*filter_index.COLUMNS)).all()
+
+    for status in (None, "ON_BENCH", "ON_CLIENT"):
+        matches = index.match(status=status, bandwidth=25)
+        expected = filter_index.count_facets(row for row in rows if matches & (1 << row.id))
+        assert index.facets(matches) == expected, status
+
+    facets = index.facets(index.all)
+    assert len(facets["tech"]) <= filter_index.FACET_TOP_TECH
+    assert [f["value"] for f in facets["bandwidth"]] == ["0-24", "25-49", "50-74", "75-99", "100", "unknown"]
+    # NULL and negative bandwidths are counted as unknown, in no range
+    assert facets["bandwidth"][-1]["count"] == sum(1 for row in rows if row.bandwidth is None or row.bandwidth < 0) > 0
+    assert sum(f["count"] for f in facets["bandwidth"]) == 300
+    assert sum(f["count"] for f in facets["status"]) == 300
+    print("✅ Facet counts verified.")
+
+def test_bandwidth_facets_match_filtered_counts():
+    url, db = _seeded(300)
+    index = filter_index.FilterIndex()
+    index.ensure_fresh(db)
+    rows = db.execute(select(*filter_index.COLUMNS)).all()
+
+    def count(bandwidth):
+        return employees._apply_search_filters(db.query(Employee.id), ADMIN, bandwidth=bandwidth).count()
+
+    # Each range holds what "bandwidth >= low" returns minus what the next range's filter returns
+    bounds = filter_index.FACET_BANDWIDTH_BUCKETS
+    expected = [count(str(low)) - (count(str(bounds[i + 1])) if i + 1 < len(bounds) else 0)
+                for i, low in enumerate(bounds)]
+    expected.append(300 - count("0"))
+    for facets in (index.facets(index.all), filter_index.count_facets(rows)):
+        assert [f["count"] for f in facets["bandwidth"]] == expected
+    print("✅ Bandwidth facets agree with bandwidth filters.")
+
+if __name__ == "__main__":
+    test_bitmap_helpers()
+    test_index_matches_sql_filters()
+    test_writes_and_catch_up()
+    test_search_endpoint_pages_from_index()
+    test_facets_match_row_counts()
+    test_bandwidth_facets_match_filtered_counts()
@@ -0,0 +1,73 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from unittest.mock import MagicMock, patch
+from app.services.jd_parser import (
+    AhoCorasick, SkillDictionary, extract_min_experience, parse_jd_locally, merge_parsed_jd
+)
+from app.services.llm_service import LLMService
+
+SKILLS = ["Python", "python", "Java", "JavaScript", "Java EE", "C++", "Node.js", "React", "SQL", "Spring Boot"]
+
+def test_aho_corasick_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    found = sorted(automaton.iter_matches("ushers"))
+    assert found == [(3, "he"), (3, "she"), (5, "hers")]
+    print("✅ Aho-Corasick matches overlapping patterns.")
+
+def test_skill_dictionary_word_boundaries():
+    dictionary = SkillDictionary(SKILLS)
+    skills = dictionary.find("Strong JavaScript and Java EE skills, C++ a plus. Node.js, react, MySQL.")
+    # "Java" alone is covered by "Java EE"; "SQL" inside "MySQL" is not a word match
+    assert skills == ["JavaScript", "Java EE", "C++", "Node.js", "React"]
+    # Matching is case-insensitive and returns the dictionary spelling
+    assert dictionary.find("PYTHON developer") == ["Python"]
+    print("✅ Skill dictionary respects word boundaries.")
+
+def test_experience_patterns():
+    assert extract_min_experience("5+ years of Python") == 5
+    assert extract_min_experience("Minimum 4 years in backend") == 4
+    assert extract_min_experience("at least 2.5 yrs experience") == 2.5
+    assert extract_min_experience("6-8 years, Spring Boot") == 6
+    assert extract_min_experience("3 years of experience with SQL") == 3
+    assert extract_min_experience("Fresh graduates welcome") is None
+    print("✅ Experience regexes verified.")
+
+def test_parse_shape_matches_llm():
+    parsed = parse_jd_locally("Backend engineer, 5+ years, Python and SQL.", SkillDictionary(SKILLS))
+    assert set(parsed) == {"required_skills", "minimum_experience_years", "keywords"}
+    assert parsed["required_skills"] == ["Python", "SQL"]
+    assert parsed["minimum_experience_years"] == 5
+    assert "backend" in parsed["keywords"] and "python" not in parsed["keywords"]
+    print("✅ Local parse output shape verified.")
+
+def test_merge_prefers_local():
+    local = {"required_skills": ["Python"], "minimum_experience_years": None, "keywords": ["backend"]}
+    llm = {"required_skills": ["python", "Kafka"], "minimum_experience_years": 3, "keywords": ["Backend", "streaming"]}
+    merged = merge_parsed_jd(local, llm)
+    assert merged == {"required_skills": ["Python", "Kafka"], "minimum_experience_years": 3, "keywords": ["backend", "streaming"]}
+    print("✅ Local/LLM merge verified.")
+
+def test_parse_jd_modes():
+    service = LLMService(MagicMock())
+    llm_result = {"required_skills": ["Go"], "minimum_experience_years": 2, "keywords": []}
+    with patch("app.services.jd_parser.get_skill_dictionary", return_value=SkillDictionary(SKILLS)), \
+         patch.object(LLMService, "parse_jd_with_llm", return_value=llm_result) as llm:
+        assert service.parse_jd("Python, 5+ years", mode="local")["required_skills"] == ["Python"]
+        assert service.parse_jd("Python, 5+ years", mode="hybrid")["required_skills"] == ["Python"]
+        assert llm.call_count == 0
+        assert service.parse_jd("Golang services", mode="hybrid")["required_skills"] == ["Go"]
+        assert service.parse_jd("Python", mode="llm") == llm_result
+        assert llm.call_count == 2
+    print("✅ Parser mode switch verified.")
+
+if __name__ == "__main__":
+    test_aho_corasick_overlapping_patterns()
+    test_skill_dictionary_word_boundaries()
+    test_experience_patterns()
+    test_parse_shape_matches_llm()
+    test_merge_prefers_local()
+    test_parse_jd_modes()
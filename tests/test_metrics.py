@@ -0,0 +1,77 @@
+import sys
+import os
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, text
+from app.services import metrics
+from app.services.llm_service import LLMService
+
+def test_counter_merges_thread_shards():
+    counter = metrics.Counter("t_total", "test", ("kind",))
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    counter.inc("b", amount=2.5)
+    assert counter.values() == {("a",): 8000.0, ("b",): 2.5}
+    assert counter.render()[2:] == ['t_total{kind="a"} 8000', 't_total{kind="b"} 2.5']
+    print("✅ Sharded counter verified.")
+
+def test_histogram_prometheus_format():
+    hist = metrics.Histogram("t_seconds", "test", ("route",), buckets=(0.1, 1))
+    hist.observe(0.05, "/x")
+    hist.observe(0.5, "/x")
+    hist.observe(5, "/x")
+    lines = hist.render()
+    assert lines[:2] == ["# HELP t_seconds test", "# TYPE t_seconds histogram"]
+    assert 't_seconds_bucket{route="/x",le="0.1"} 1' in lines
+    assert 't_seconds_bucket{route="/x",le="1"} 2' in lines
+    assert 't_seconds_bucket{route="/x",le="+Inf"} 3' in lines
+    assert 't_seconds_sum{route="/x"} 5.55' in lines
+    assert 't_seconds_count{route="/x"} 3' in lines
+    print("✅ Histogram exposition verified.")
+
+def test_engine_instrumentation():
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine, name="test")
+    before = metrics.db_statements.values().get(("SELECT",), 0)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        try:
+            conn.execute(text("SELECT * FROM missing_table"))
+        except Exception:
+            pass
+    assert metrics.db_statements.values()[("SELECT",)] == before + 1
+    assert metrics.db_pool_wait.values()[("test",)][-2:] != [0, 0.0]
+    print("✅ Engine statement and pool metrics verified.")
+
+def test_llm_call_metrics():
+    service = LLMService(MagicMock())
+    service._settings = SimpleNamespace(provider="Ollama")
+    client = MagicMock()
+    client.chat.completions.create.return_value = SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=11, completion_tokens=4))
+    service._chat_completion(client, "parse_jd", model="qwen3")
+    client.chat.completions.create.side_effect = RuntimeError("down")
+    try:
+        service._chat_completion(client, "parse_jd", model="qwen3")
+    except RuntimeError:
+        pass
+    tokens = metrics.llm_tokens.values()
+    assert tokens[("ollama", "qwen3", "prompt")] >= 11
+    assert metrics.llm_errors.values()[("ollama", "qwen3", "parse_jd")] >= 1
+    assert "ems_llm_request_duration_seconds_count{provider=\"ollama\",model=\"qwen3\",operation=\"parse_jd\"}" in metrics.render_prometheus()
+    print("✅ LLM metrics verified.")
+
+if __name__ == "__main__":
+    test_counter_merges_thread_shards()
+    test_histogram_prometheus_format()
+    test_engine_instrumentation()
+    test_llm_call_metrics()
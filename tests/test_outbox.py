@@ -0,0 +1,97 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from datetime import datetime, timedelta
+from app.models.employee import Employee
+from app.models.employee_change import EmployeeChange
+from app.services import outbox, filter_index
+from app.api import employees
+from conftest import seeded_db
+
+def test_changes_commit_with_the_write():
+    _, db = seeded_db(5)
+    emp = db.get(Employee, 1)
+    emp.bandwidth = 0
+    outbox.record(db, emp.id, outbox.UPDATE)
+    db.rollback()
+    assert outbox.latest_position(db) == 0
+
+    employees.delete_employee(emp.emp_id, db)
+    changes = outbox.read_changes(db, 0)
+    assert [(c.employee_id, c.op) for c in changes] == [(1, outbox.DELETE)]
+    print("✅ Outbox rows commit and roll back with the employee write.")
+
+def test_consumer_offsets_are_durable():
+    _, db = seeded_db(5)
+    outbox.record_many(db, [1, 2, 3, 2], outbox.UPDATE)
+    outbox.record(db, 3, outbox.DELETE)
+    db.commit()
+
+    consumer = outbox.ChangeConsumer("test-builder", batch_size=2)
+    seen = []
+    assert consumer.process(db, lambda changes: seen.extend(c.id for c in changes)) == 5
+    assert seen == [1, 2, 3, 4, 5] and consumer.position(db) == 5
+    # A new instance (another process, a restart) resumes from the stored offset
+    outbox.record(db, 4, outbox.INSERT)
+    db.commit()
+    assert [c.id for c in outbox.ChangeConsumer("test-builder").poll(db)] == [6]
+    assert outbox.latest_by_employee(outbox.read_changes(db, 0)) == {1: "update", 2: "update", 3: "delete", 4: "insert"}
+
+    # A failing handler does not move the offset: the batch is delivered again
+    def fail(changes):
+        raise RuntimeError("builder crashed")
+    try:
+        consumer.process(db, fail)
+    except RuntimeError:
+        pass
+    assert consumer.position(db) == 5
+    print("✅ Consumer offsets verified.")
+
+def test_reader_waits_for_young_gaps():
+    _, db = seeded_db(1)
+    now = datetime.utcnow()
+    for id in (1, 2, 4):
+        db.add(EmployeeChange(id=id, employee_id=1, op=outbox.UPDATE, created_at=now))
+    db.commit()
+    # Id 3 may belong to a transaction that has not committed yet
+    assert [c.id for c in outbox.read_changes(db, 0)] == [1, 2]
+    assert outbox.read_changes(db, 2) == []
+    # Once the gap is older than OUTBOX_GAP_WAIT it was a rollback
+    db.get(EmployeeChange, 4).created_at = now - timedelta(seconds=outbox.OUTBOX_GAP_WAIT + 1)
+    db.commit()
+    assert [c.id for c in outbox.read_changes(db, 2)] == [4]
+
+    db.get(EmployeeChange, 1).created_at = now - timedelta(hours=outbox.OUTBOX_RETENTION_HOURS + 1)
+    db.commit()
+    assert outbox.prune(db) == 1 and [c.id for c in outbox.read_changes(db, 0)] == [2, 4]
+    print("✅ Gap handling and pruning verified.")
+
+def test_index_applies_other_workers_deletes_without_rebuild():
+    _, db = seeded_db(40)
+    index = filter_index.FilterIndex()
+    index.ensure_fresh(db)
+    built_at = index.built_at
+
+    # Another worker deletes one employee and re-phrases another (last_updated unchanged)
+    db.delete(db.get(Employee, 3))
+    outbox.record(db, 3, outbox.DELETE)
+    db.get(Employee, 4).status = "ON_CLIENT"
+    outbox.record(db, 4, outbox.UPDATE)
+    db.commit()
+
+    index.synced_at = 0.0
+    index.ensure_fresh(db)
+    assert index.built_at == built_at and len(index) == 39
+    assert 3 not in filter_index.bitmap_ids(index.all)
+    assert 4 in filter_index.bitmap_ids(index.match(status="ON_CLIENT"))
+    assert index.change_position == 2
+    print("✅ Index catch-up from the outbox verified.")
+
+if __name__ == "__main__":
+    test_changes_commit_with_the_write()
+    test_consumer_offsets_are_durable()
+    test_reader_waits_for_young_gaps()
+    test_index_applies_other_workers_deletes_without_rebuild()
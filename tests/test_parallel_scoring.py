@@ -0,0 +1,48 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.services import parallel_scoring, skill_aliases
+from app.services.candidates import Candidate
+from seed_synthetic import ProfileGenerator
+
+PARSED_JD = {"required_skills": ["Python", "PG", "Docker"], "minimum_experience_years": 4}
+KEYWORD_JD = {"required_skills": [], "keywords": ["python", "payments"], "minimum_experience_years": 2}
+
+def _pool(count=400):
+    generator = ProfileGenerator(seed=21)
+    pool = []
+    for i in range(count):
+        profile = generator.profile(i)
+        emp = profile["employee"]
+        pool.append(Candidate(i + 1, emp["name"], emp["emp_id"], emp["tech"], emp["experience_years"], emp["bandwidth"],
+                              emp["clients"], emp.get("career_summary"), emp["search_phrase"], None, None,
+                              len(profile["work_history"])))
+    return pool
+
+def test_process_pool_matches_serial_ranking():
+    state = dict(skill_aliases._state)
+    threshold = parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES
+    # A custom alias ("PG") the scoring processes only know through the request
+    skill_aliases.install({**skill_aliases.DEFAULT_ALIASES, "pg": "PostgreSQL"})
+    parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES = 1
+    try:
+        for parsed_jd in (PARSED_JD, KEYWORD_JD):
+            similarities = {i: (i % 10) / 10 for i in range(1, 401, 3)}
+            serial = [(c.id, c.match_score) for c in parallel_scoring.rank(_pool(), parsed_jd, similarities, workers=1)]
+            parallel = [(c.id, c.match_score) for c in parallel_scoring.rank(_pool(), parsed_jd, similarities, workers=2)]
+            assert parallel == serial and parallel_scoring._executor is not None
+            # Best first, ties in input order
+            assert serial == sorted(serial, key=lambda pair: (-pair[1], pair[0]))
+            top = parallel_scoring.rank(_pool(), parsed_jd, similarities, top_k=25, workers=2)
+            assert [(c.id, c.match_score) for c in top] == serial[:25]
+    finally:
+        parallel_scoring.PARALLEL_SCORING_MIN_CANDIDATES = threshold
+        skill_aliases._state.update(state)
+        parallel_scoring.shutdown()
+    print("✅ Parallel scoring matches serial scoring.")
+
+if __name__ == "__main__":
+    test_process_pool_matches_serial_ranking()
@@ -0,0 +1,135 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+import tempfile
+import pytest
+from types import SimpleNamespace
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import Base, to_async_url
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.work_history import WorkHistory
+from app.models.user import UserRole
+from app.api import dashboard, employees
+from app.services import outbox
+from app.services.search_phrase_worker import SearchPhraseWorker
+
+# Set to a scratch MySQL database (tables are created if missing) to check MySQL plans too
+MYSQL_URL = os.getenv("EXPLAIN_TEST_MYSQL_URL")
+
+ADMIN = SimpleNamespace(role=UserRole.ADMIN, email="admin@x.com")
+
+# (statement, table) plans allowed to walk a whole table or index, and why
+ALLOWED_SCANS = {
+    ("list employees", "employees"): "unordered offset/limit page; LIMIT stops the walk",
+    ("recent profiles", "employees"): "reads ix_employees_created_at backwards and stops at LIMIT",
+    ("dashboard counts", "employees"): "aggregates over every employee",
+    ("search phrase worker, first pass", "employees"):
+        "once per process start; later passes only look up outbox ids",
+}
+
+def calls():
+    """The real code behind /employees/search filters, list and dashboard endpoints and the worker."""
+    worker = SearchPhraseWorker()
+
+    def search(**filters):
+        return lambda db: db.execute(employees._apply_search_filters(select(Employee), ADMIN, **filters)).all()
+
+    return {
+        "search status+bandwidth+experience": (search(status="ON_BENCH", bandwidth="50", experience="3"), False),
+        "search status+bandwidth": (search(status="ON_BENCH", bandwidth="50"), False),
+        "search status": (search(status="ON_CLIENT"), False),
+        "read employee": (lambda db: employees.read_employee("E00001", db), True),
+        "list employees": (lambda db: employees.read_employees(0, 100, db), False),
+        "recent profiles": (lambda db: employees.get_recent_updates(5, db), False),
+        "dashboard counts": (dashboard.get_metrics, True),
+        "search phrase worker, first pass": (lambda db: worker._find_stale(db), False),
+        "search phrase worker, outbox pass": (lambda db: worker._find_stale(db, [1, 2, 3]), False),
+        "outbox read": (lambda db: outbox.read_changes(db, 0), False),
+    }
+
+def seed(engine):
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    if not db.query(Employee).filter(Employee.emp_id == "E00001").first():
+        db.add(Employee(emp_id="E00001", name="Plan Check", email="plan.check@example.com",
+                        work_history=[WorkHistory(company="Acme", role="Dev")]))
+        db.commit()
+    db.close()
+
+def captured_statements(url: str) -> dict:
+    """{name: [(sql, params)]} of the SELECTs each call really sends."""
+    sync_engine = create_engine(url)
+    async_engine = create_async_engine(to_async_url(url))
+    seed(sync_engine)
+    statements = {}
+
+    def run(name, call, is_async):
+        seen = statements.setdefault(name, [])
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                seen.append((statement, parameters))
+
+        target = async_engine.sync_engine if is_async else sync_engine
+        event.listen(target, "before_cursor_execute", capture)
+        try:
+            if is_async:
+                async def go():
+                    async with async_sessionmaker(async_engine)() as db:
+                        await call(db)
+                asyncio.run(go())
+            else:
+                db = sessionmaker(bind=sync_engine)()
+                try:
+                    call(db)
+                finally:
+                    db.close()
+        finally:
+            event.remove(target, "before_cursor_execute", capture)
+
+    for name, (call, is_async) in calls().items():
+        run(name, call, is_async)
+    asyncio.run(async_engine.dispose())
+    return sync_engine, statements
+
+def explain(conn, sql, params) -> list:
+    if conn.dialect.name == "sqlite":
+        return [row.detail for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params)]
+    return [dict(row._mapping) for row in conn.exec_driver_sql("EXPLAIN " + sql, params)]
+
+def scans(dialect: str, plan: list) -> list:
+    """(table, step) for every step that walks a whole table or index instead of searching it."""
+    if dialect == "sqlite":
+        # "SEARCH t USING [COVERING] INDEX ... (col=?)" is bounded; any "SCAN t [USING ... INDEX]" is not
+        return [(step.split()[1], step) for step in plan if step.startswith("SCAN")]
+    return [(step["table"], step) for step in plan if step["type"] in ("ALL", "index")]
+
+def check_plans(url: str):
+    engine, statements = captured_statements(url)
+    with engine.connect() as conn:
+        for name, sent in statements.items():
+            assert sent, f"{name} sent no SELECT"
+            for sql, params in sent:
+                for table, step in scans(engine.dialect.name, explain(conn, sql, params)):
+                    assert (name, table) in ALLOWED_SCANS, f"{name} walks all of {table}: {step}\n{sql}"
+
+def test_sqlite_query_plans_use_indexes():
+    check_plans(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'plans.db')}")
+    print("✅ SQLite query plans use indexes.")
+
+@pytest.mark.skipif(not MYSQL_URL, reason="EXPLAIN_TEST_MYSQL_URL not set")
+def test_mysql_query_plans_use_indexes():
+    check_plans(MYSQL_URL)
+    print("✅ MySQL query plans use indexes.")
+
+if __name__ == "__main__":
+    test_sqlite_query_plans_use_indexes()
+    if MYSQL_URL:
+        test_mysql_query_plans_use_indexes()
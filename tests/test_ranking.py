@@ -0,0 +1,92 @@
+import sys
+import os
+import tempfile
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models import base  # Import all models
+from app.models.employee import Employee
+from app.models.work_history import WorkHistory
+from app.services import ranking, embedding_index
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        Employee(id=1, emp_id="E1", name="Alice", email="a@x.com", bandwidth=100, experience_years=6,
+                 tech=[{"tech": "Python"}, {"tech": "FastAPI"}], search_phrase="Python backend developer",
+                 work_history=[WorkHistory(company="A", role="Dev"), WorkHistory(company="B", role="Dev")]),
+        Employee(id=2, emp_id="E2", name="Bob", email="b@x.com", bandwidth=100, experience_years=2,
+                 tech=[{"tech": "Java"}], search_phrase="Java developer", career_summary="python curious"),
+        Employee(id=3, emp_id="E3", name="Python Pete", email="c@x.com", bandwidth=0, experience_years=9,
+                 tech=[{"tech": "Go"}], search_phrase="Go developer"),
+    ])
+    db.commit()
+    return db
+
+def test_fuse_rrf_and_weighted():
+    sources = {"keyword": {1: 0.8, 2: 0.2}, "skill": {2: 0.9, 1: 0.5, 3: 0.1}}
+    rrf = ranking.fuse(sources, {"keyword": 1.0, "skill": 1.0}, "rrf")
+    assert [emp_id for emp_id, _ in rrf] == [1, 2, 3]
+    assert rrf[0][1] < 1.0
+    weighted = ranking.fuse(sources, {"keyword": 1.0, "skill": 3.0}, "weighted")
+    assert [emp_id for emp_id, _ in weighted] == [2, 1, 3]
+    assert abs(weighted[0][1] - (0.2 + 3 * 0.9) / 4) < 1e-9
+    # Zero weight drops a source entirely
+    only_skill = ranking.fuse(sources, {"keyword": 0.0, "skill": 1.0}, "weighted")
+    assert only_skill[0] == (2, 0.9)
+    # A zero score is no match, not the last rank
+    assert [emp_id for emp_id, _ in ranking.fuse({"skill": {1: 0.5, 2: 0.0}}, {"skill": 1.0}, "rrf")] == [1]
+    print("✅ Score fusion verified.")
+
+def test_hybrid_search_pages_and_times_stages():
+    db = _session()
+    original_dir, original_index = embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index
+    with tempfile.TemporaryDirectory() as d:
+        embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index = d, None
+        try:
+            results, timings = ranking.hybrid_search(
+                db, db.query(Employee), query="python", jd="Python and FastAPI, 5+ years",
+                weights={"semantic": 0.0}, method="weighted", limit=2,
+            )
+        finally:
+            if embedding_index._index is not None:
+                embedding_index._index.close()
+            embedding_index.EMBEDDING_INDEX_DIR, embedding_index._index = original_dir, original_index
+
+    assert [e.emp_id for e in results] == ["E1", "E3"]
+    assert results[0].match_score > results[1].match_score
+    assert {f"rank.{stage}" for stage in ("filter", "keyword", "parse_jd", "skill", "fuse", "materialize")} \
+        <= set(timings)
+    assert "rank.semantic" not in timings
+    print("✅ Hybrid ranking verified.")
+
+def test_skill_candidates_use_projected_history_count():
+    db = _session()
+    parsed = {"required_skills": ["Python"], "minimum_experience_years": 5, "keywords": []}
+    scores = ranking.skill_candidates(db, db.query(Employee), parsed)
+    # Skill 0.4 + exp 0.2 + bandwidth 0.2 + 2 projects 0.04 + no clients 0.1
+    assert scores[1] == 0.94
+    # Bob (Java) and Pete (Go) share no required skill and are not skill candidates
+    assert set(scores) == {1}
+    print("✅ Projected skill scoring verified.")
+
+def test_regex_fallback_rank_keeps_half_matches():
+    db = _session()
+    employees = db.query(Employee).order_by(Employee.id).all()
+    # jd words: python, fastapi, backend, java -> Alice 3/4, Bob 2/4 (java + python in summary), Pete 1/4
+    ranked = ranking.regex_fallback_rank(employees, "Python FastAPI backend or Java")
+    assert [(e.emp_id, e.match_score) for e in ranked] == [("E1", 75.0), ("E2", 50.0)]
+    assert ranking.regex_fallback_rank(employees, "C# .NET") == []
+    print("✅ Regex fallback ranking verified.")
+
+if __name__ == "__main__":
+    test_fuse_rrf_and_weighted()
+    test_hybrid_search_pages_and_times_stages()
+    test_skill_candidates_use_projected_history_count()
+    test_regex_fallback_rank_keeps_half_matches()
@@ -0,0 +1,111 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+import inspect
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from app import database
+from app.database import Base, ReplicaSet, RoutingSession
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.api import auth, auth_utils
+
+def replicate(primary_path, replica_path):
+    # Stand-in for MySQL replication: copy the primary file over the replica
+    src, dst = sqlite3.connect(primary_path), sqlite3.connect(replica_path)
+    src.backup(dst)
+    src.close()
+    dst.close()
+
+def setup_pair():
+    workdir = tempfile.mkdtemp()
+    primary_path = os.path.join(workdir, "primary.db")
+    replica_path = os.path.join(workdir, "replica.db")
+    primary = create_engine(f"sqlite:///{primary_path}")
+    Base.metadata.create_all(primary)
+    db = sessionmaker(bind=primary)()
+    db.add(Employee(emp_id="E1", name="Alice", email="a@x.com", bandwidth=100))
+    db.commit()
+    db.close()
+    replicate(primary_path, replica_path)
+    replica = create_engine(f"sqlite:///{replica_path}")
+    return primary, replica
+
+def bandwidth(db):
+    return db.query(Employee.bandwidth).filter(Employee.emp_id == "E1").scalar()
+
+def test_reads_use_replica_and_writes_use_primary():
+    primary, replica = setup_pair()
+    replicas = ReplicaSet([(replica, None)])
+    Session = sessionmaker(class_=RoutingSession, write_bind=primary, replicas=replicas, replica_binds=[replica])
+
+    db = Session()
+    db.execute(update(Employee).where(Employee.emp_id == "E1").values(bandwidth=40))
+    db.commit()
+    # Replica has not caught up yet
+    assert bandwidth(db) == 100
+    db.close()
+
+    db = Session()
+    db.info["use_primary"] = True
+    assert bandwidth(db) == 40
+    db.close()
+    print("✅ Read/write routing verified.")
+
+def test_round_robin_and_health():
+    primary, replica = setup_pair()
+    broken = create_engine(f"sqlite:///{tempfile.mkdtemp()}/missing/dir/x.db")
+    replicas = ReplicaSet([(replica, None), (broken, None)])
+    assert [replicas.pick() for _ in range(4)] == [0, 1, 0, 1]
+
+    replicas.check()
+    assert replicas.status()[1]["healthy"] is False
+    assert [replicas.pick() for _ in range(3)] == [0, 0, 0]
+
+    replicas.mark_down(0)
+    assert replicas.pick() is None
+    Session = sessionmaker(class_=RoutingSession, write_bind=primary, replicas=replicas,
+                           replica_binds=[replica, broken])
+    db = Session()
+    assert db.get_bind() is primary
+    db.close()
+    print("✅ Round-robin and health checks verified.")
+
+def test_read_your_own_writes():
+    original = database.replicas
+    database.replicas = ReplicaSet([(create_engine("sqlite://"), None)])
+    try:
+        db = SimpleNamespace(info={"client_key": "Bearer abc"})
+        assert not database._reads_from_primary("Bearer abc")
+        database.stick_to_primary(db)
+        assert database._reads_from_primary("Bearer abc")
+        assert not database._reads_from_primary("Bearer other")
+    finally:
+        database.replicas = original
+    print("✅ Read-your-own-writes stickiness verified.")
+
+def test_auth_reads_use_primary():
+    # A just-created user or new password must not depend on replica lag
+    login_db = inspect.signature(auth.login_for_access_token).parameters["db"].default
+    assert login_db.dependency is database.get_db
+    user_db = inspect.signature(auth_utils.get_current_user).parameters["db"].default
+    assert user_db.dependency is database.get_primary_async_db
+
+    async def session_info():
+        async for db in database.get_primary_async_db():
+            return dict(db.info)
+    assert asyncio.run(session_info())["use_primary"] is True
+    print("✅ Auth reads go to the primary.")
+
+if __name__ == "__main__":
+    test_reads_use_replica_and_writes_use_primary()
+    test_round_robin_and_health()
+    test_read_your_own_writes()
+    test_auth_reads_use_primary()
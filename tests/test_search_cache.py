@@ -0,0 +1,85 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import to_async_url
+from app.services import search_cache, outbox
+from app.api import employees
+from conftest import ADMIN, USER, seeded_db
+
+def test_cache_key_normalization():
+    key = search_cache.cache_key
+    assert key(ADMIN, query="  Python   Developer ") == key(ADMIN, query="python developer")
+    assert key(ADMIN, tech="JAVA", bandwidth="50") == key(ADMIN, tech="java", bandwidth="50", name="  ")
+    # Unparsable numbers are ignored by the filters, and so by the key
+    assert key(ADMIN, bandwidth="lots") == key(ADMIN)
+    # Embedding modes keep the query's case; other parameters and the caller's scope count
+    assert key(ADMIN, query="Python", mode="semantic") != key(ADMIN, query="python", mode="semantic")
+    assert key(ADMIN, query="python") != key(USER, query="python")
+    assert key(ADMIN, status="ON_BENCH", skip=50) != key(ADMIN, status="ON_BENCH")
+    assert key(ADMIN, fuzzy=True) == key(ADMIN, fuzzy=False)
+    print("✅ Cache keys verified.")
+
+def test_lru_bound_and_versioning():
+    entry_bytes = search_cache.CachedSearch(None, range(100), [None] * 100).nbytes
+    cache = search_cache.SearchResultCache(max_bytes=entry_bytes * 2)
+    for n in range(3):
+        cache.put(("q", n), search_cache.CachedSearch(None, range(100), [None] * 100), cache.version)
+        if n == 1:
+            assert cache.get(("q", 0)) is not None  # now most recently used
+    assert len(cache) == 2 and cache.nbytes == entry_bytes * 2
+    assert cache.get(("q", 1)) is None and cache.get(("q", 0)) is not None
+
+    entry = cache.get(("q", 2))
+    assert entry.results()[:2] == [(0, None), (1, None)]
+    # A write makes every entry a miss, and a result computed before it is not stored
+    version = cache.version
+    cache.bump()
+    assert cache.get(("q", 0)) is None and cache.get(("q", 2)) is None
+    cache.put(("q", 3), search_cache.CachedSearch(None, [7], [42.0]), version)
+    assert cache.get(("q", 3)) is None
+    print("✅ LRU bound and versioning verified.")
+
+def test_repeated_search_hits_cache():
+    url, db = seeded_db(60)
+    original_cache, original_search = search_cache.cache, employees._search
+    search_cache.cache = search_cache.SearchResultCache()
+    calls = []
+
+    async def counting_search(*args):
+        calls.append(args)
+        return await original_search(*args)
+    employees._search = counting_search
+
+    async def run(query):
+        async_engine = create_async_engine(to_async_url(url))
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+            results = await employees.search_employees(
+                query=query, name=None, tech=None, status=None, bandwidth="20", experience=None,
+                jd=None, mode=None, fusion="rrf", w_keyword=None, w_skill=None, w_semantic=None,
+                skip=0, limit=50, facets=True, fuzzy=False, db=session, current_user=ADMIN)
+        await async_engine.dispose()
+        return results
+
+    try:
+        first = asyncio.run(run("python"))
+        second = asyncio.run(run(" Python "))
+        assert len(calls) == 1 and first.results and second == first
+        # Another worker's write reaches the cache through the outbox position
+        outbox.record(db, first.results[0].id, outbox.UPDATE)
+        db.commit()
+        search_cache.cache._checked_at = 0.0
+        asyncio.run(run("python"))
+        assert len(calls) == 2
+    finally:
+        search_cache.cache, employees._search = original_cache, original_search
+    print("✅ Repeated searches served from the cache.")
+
+if __name__ == "__main__":
+    test_cache_key_normalization()
+    test_lru_bound_and_versioning()
+    test_repeated_search_hits_cache()
@@ -0,0 +1,124 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import tempfile
+from datetime import datetime
+from sqlalchemy.orm import sessionmaker
+from app.models.employee import Employee
+from app import database
+from app.services import search_snapshot, ranking, tokenizer, skill_aliases, outbox
+from conftest import seeded_db
+
+JD = "Senior Python developer with Docker, Kubernetes and AWS experience for a payments platform"
+PARSED_JD = {"required_skills": ["Python", "Docker", "Kubernetes", "AWS"], "minimum_experience_years": 4}
+
+def _pinned(snapshot):
+    """Makes current() serve snapshot (None: no snapshot) without looking at the disk."""
+    search_snapshot._state.update(snapshot=snapshot, name=None, checked_at=time.monotonic() + 3600)
+
+def test_build_and_read_back():
+    _, db = seeded_db(80)
+    directory = tempfile.mkdtemp()
+    snapshot = search_snapshot.SearchSnapshot(search_snapshot.build_snapshot(db, directory))
+    employees = db.query(Employee).order_by(Employee.id).all()
+    assert len(snapshot) == len(employees) and list(snapshot.ids) == [emp.id for emp in employees]
+    assert snapshot.signature == search_snapshot.db_signature(db)
+
+    skill_keys = skill_aliases.current().keys
+    for emp in employees:
+        r = snapshot.fresh_row(emp)
+        assert r is not None
+        tokens = {snapshot.tokens[t] for t in snapshot.token_index_of(r)}
+        assert tokens == tokenizer.tokenize(tokenizer.profile_text(emp))
+        profile = snapshot.profile(r)
+        assert {t["tech"] for t in profile.tech} == {skill_keys[t["tech"]] for t in emp.tech or []}
+        assert profile.experience_years == emp.experience_years
+        assert profile.work_history_count == len(emp.work_history)
+    assert snapshot.row(10_000) is None
+
+    # A saved profile is no longer served from the snapshot
+    emp = employees[0]
+    emp.bandwidth, emp.last_updated = 0, datetime(2030, 1, 1)
+    db.commit()
+    assert snapshot.fresh_row(emp) is None
+    # The signature follows the outbox, not a scan of employees
+    assert snapshot.signature == search_snapshot.db_signature(db)
+    outbox.record(db, emp.id, outbox.UPDATE)
+    db.commit()
+    signature = search_snapshot.db_signature(db)
+    assert snapshot.signature != signature
+
+    # A new alias table changes the skill keys, so it needs a new snapshot too
+    state = dict(skill_aliases._state)
+    try:
+        skill_aliases.install({**skill_aliases.DEFAULT_ALIASES, "pyspark dataframes": "PySpark"})
+        assert search_snapshot.db_signature(db) != signature
+    finally:
+        skill_aliases._state.update(state)
+    assert search_snapshot.db_signature(db) == signature
+    print("✅ Snapshot build and read-back verified.")
+
+def test_publish_swaps_readers_and_one_builder_leads():
+    url, db = seeded_db(30)
+    directory = tempfile.mkdtemp()
+    factory = sessionmaker(bind=db.get_bind())
+    state = dict(search_snapshot._state)
+    leader = search_snapshot.SnapshotBuilder(factory, directory)
+    follower = search_snapshot.SnapshotBuilder(factory, directory)
+    # Scans run on a read session, never the writer
+    assert search_snapshot.SnapshotBuilder().session_factory is database.ReadSessionLocal
+    try:
+        search_snapshot._state.update(snapshot=None, name=None, checked_at=0.0)
+        assert leader.run_once()
+        first = search_snapshot.current(directory)
+        assert first is not None and len(first) == 30
+        # Nothing changed: no new version
+        assert not leader.run_once()
+        if search_snapshot.fcntl is not None:
+            assert not follower.is_leader() and not follower.run_once()
+
+        hire = Employee(name="New Hire", email="new.hire@example.com", emp_id="EMP-NEW")
+        db.add(hire)
+        db.flush()
+        outbox.record(db, hire.id, outbox.INSERT)
+        db.commit()
+        assert leader.run_once()
+        second = search_snapshot.current(directory)
+        assert second is not first and len(second) == 31
+        # The replaced version stays readable for requests still holding it
+        assert len(first.ids) == 30
+    finally:
+        leader.stop()
+        follower.stop()
+        search_snapshot._state.update(state)
+    print("✅ Snapshot publish and leader election verified.")
+
+def test_rankings_match_without_snapshot():
+    _, db = seeded_db(120)
+    state = dict(search_snapshot._state)
+    try:
+        _pinned(search_snapshot.SearchSnapshot(search_snapshot.build_snapshot(db, tempfile.mkdtemp())))
+        # One profile saved after the snapshot is scored from the DB instead
+        emp = db.get(Employee, 5)
+        emp.tech, emp.last_updated = [{"tech": "Python"}, {"tech": "Docker"}], datetime(2030, 1, 1)
+        db.commit()
+        employees = db.query(Employee).all()
+        with_snapshot = ([(e.id, e.match_score) for e in ranking.regex_fallback_rank(employees, JD)],
+                         ranking.skill_candidates(db, db.query(Employee), PARSED_JD))
+        _pinned(None)
+        without = ([(e.id, e.match_score) for e in ranking.regex_fallback_rank(employees, JD)],
+                   ranking.skill_candidates(db, db.query(Employee), PARSED_JD))
+    finally:
+        search_snapshot._state.update(state)
+    assert with_snapshot == without
+    assert without[1][5] > 0
+    print("✅ Snapshot rankings match DB rankings.")
+
+if __name__ == "__main__":
+    test_build_and_read_back()
+    test_publish_swaps_readers_and_one_builder_leads()
+    test_rankings_match_without_snapshot()
@@ -0,0 +1,53 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from collections import Counter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.user import User
+from app.schemas.employee import EmployeeCreate
+from seed_synthetic import ProfileGenerator, load, create_users, reset
+
+def test_profiles_are_deterministic_and_valid():
+    a, b = ProfileGenerator(seed=7), ProfileGenerator(seed=7)
+    assert a.profile(3)["employee"]["tech"] == b.profile(3)["employee"]["tech"]
+    assert a.profile(3)["employee"]["phone"] != ProfileGenerator(seed=8).profile(3)["employee"]["phone"]
+
+    p = a.profile(11)
+    EmployeeCreate(**p["employee"], work_history=p["work_history"], education=p["education"])
+    print("✅ Synthetic profiles deterministic and schema-valid.")
+
+def test_skew_concentrates_popular_skills():
+    skewed, uniform = Counter(), Counter()
+    for i in range(300):
+        skewed.update(t["tech"] for t in ProfileGenerator(skew=2.0).profile(i)["employee"]["tech"])
+        uniform.update(t["tech"] for t in ProfileGenerator(skew=0.0).profile(i)["employee"]["tech"])
+    assert skewed.most_common(1)[0][1] > uniform.most_common(1)[0][1]
+    print("✅ Skew verified.")
+
+def test_batched_load():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    load(db, ProfileGenerator(), count=25, batch_size=10)
+    assert create_users(db, 3, "pw") == 4
+    assert create_users(db, 3, "pw") == 0
+    emp = db.query(Employee).filter(Employee.emp_id == "SYN000024").one()
+    assert emp.work_history and emp.education and emp.search_phrase_updated_at is not None
+
+    reset(db)
+    assert db.query(Employee).count() == 0 and db.query(User).count() == 0
+    db.close()
+    print("✅ Batched load, users and reset verified.")
+
+if __name__ == "__main__":
+    test_profiles_are_deterministic_and_valid()
+    test_skew_concentrates_popular_skills()
+    test_batched_load()
@@ -0,0 +1,112 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.skill_alias import SkillAlias
+from app.schemas.skill_alias import SkillAliasCreate
+from app.services import employee_indexes, jd_parser, skill_aliases
+from app.services.jd_parser import SkillDictionary, parse_jd_locally
+from app.services.llm_service import LLMService
+from app.api import skills
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([SkillAlias(alias="postgres", canonical="PostgreSQL"), SkillAlias(alias="k8s", canonical="Kubernetes")])
+    db.add(Employee(emp_id="E1", name="Alice", email="a@x.com",
+                    tech=[{"tech": "Postgres", "experience_years": 2, "level": "Intermediate"},
+                          {"tech": "postgresql", "experience_years": 4, "level": "Advanced"},
+                          {"tech": "Python", "experience_years": 5, "level": "Advanced"}]))
+    db.commit()
+    return db
+
+@pytest.fixture(autouse=True)
+def restore_table():
+    state = dict(skill_aliases._state)
+    yield
+    skill_aliases._state.update(state)
+
+def test_table_canonicalizes_and_merges_tech():
+    table = skill_aliases.SkillAliasTable({"k8s": "Kubernetes", "React JS": "React"})
+    assert table.canonical(" K8S ") == "Kubernetes"
+    assert table.canonical("react   js") == "React"
+    assert table.canonical("kubernetes") == "Kubernetes"
+    assert table.canonical("Rust") == "Rust"
+    assert table.key("K8s") == table.key("KUBERNETES") == "kubernetes"
+    tech = table.canonicalize_tech([
+        {"tech": "k8s", "experience_years": 1, "level": "Beginner"},
+        {"tech": "Kubernetes", "experience_years": 3, "level": "Intermediate"},
+    ])
+    assert tech == [{"tech": "Kubernetes", "experience_years": 3, "level": "Intermediate"}]
+    assert table.canonicalize_tech(None) is None
+    print("✅ Alias table verified.")
+
+def test_jd_aliases_match_canonical_skills():
+    table = skill_aliases.SkillAliasTable({"postgres": "PostgreSQL", "k8s": "Kubernetes"})
+    dictionary = SkillDictionary(["PostgreSQL", "Kubernetes", "Python"], table)
+    parsed = parse_jd_locally("Python dev with Postgres (or PostgreSQL) and k8s, 3+ years", dictionary)
+    assert parsed["required_skills"] == ["Python", "PostgreSQL", "Kubernetes"]
+
+    skill_aliases._state["table"] = table
+    emp = Employee(tech=[{"tech": "postgresql"}, {"tech": "Kubernetes"}], bandwidth=0, experience_years=3)
+    score = LLMService(None).compute_match_score(emp, {"required_skills": ["Postgres", "k8s"], "minimum_experience_years": 3})
+    assert sorted(score["matched_skills"]) == ["kubernetes", "postgresql"]
+    print("✅ Alias-aware JD matching verified.")
+
+def test_alias_api_reloads_and_applies():
+    db = _session()
+    saved = skills.save_alias(SkillAliasCreate(alias="ReactJS", canonical="React"), db, admin=None)
+    assert saved.alias == "reactjs"
+    assert skill_aliases.canonical("ReactJS") == "React"
+
+    with pytest.raises(HTTPException):
+        skills.save_alias(SkillAliasCreate(alias="react.js", canonical="reactjs"), db, admin=None)
+    with pytest.raises(HTTPException):
+        skills.save_alias(SkillAliasCreate(alias="Kubernetes", canonical="K8"), db, admin=None)
+
+    upserts, upsert = [], employee_indexes.upsert
+    employee_indexes.upsert = lambda row: upserts.append(row.id)
+    jd_parser._dictionary_cache["dictionary"] = object()
+    try:
+        assert skills.apply_aliases(db, admin=None) == {"updated": 1}
+    finally:
+        employee_indexes.upsert = upsert
+    emp = db.query(Employee).first()
+    assert [(t["tech"], t["experience_years"]) for t in emp.tech] == [("PostgreSQL", 4), ("Python", 5)]
+    # The rewritten profile reaches the in-memory indexes and the JD dictionary at once
+    assert upserts == [emp.id] and jd_parser._dictionary_cache["dictionary"] is None
+
+    skills.delete_alias(saved.id, db, admin=None)
+    assert skill_aliases.canonical("ReactJS") == "ReactJS"
+    print("✅ Alias API verified.")
+
+def test_empty_table_keeps_default_aliases():
+    # A database made by create_all/init_db.py without the seeding migration
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    assert skill_aliases.refresh(db, force=True).canonical("k8s") == "Kubernetes"
+
+    # Saving the first alias stores the defaults with it
+    skills.save_alias(SkillAliasCreate(alias="pg", canonical="PostgreSQL"), db, admin=None)
+    assert skill_aliases.canonical("pg") == "PostgreSQL" and skill_aliases.canonical("k8s") == "Kubernetes"
+    assert db.query(SkillAlias).count() == len(skill_aliases.DEFAULT_ALIASES) + 1
+    print("✅ Default aliases kept for an empty table.")
+
+if __name__ == "__main__":
+    state = dict(skill_aliases._state)
+    test_table_canonicalizes_and_merges_tech()
+    test_jd_aliases_match_canonical_skills()
+    skill_aliases._state.update(state)
+    test_alias_api_reloads_and_applies()
+    test_empty_table_keeps_default_aliases()
@@ -0,0 +1,45 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app.database import create_engines, pool_status
+
+def test_default_profile_shares_engine():
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'default.db')}"
+    writer, reader = create_engines(url, sqlite_profile="default")
+    assert writer is reader
+    with writer.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    print("✅ Default profile unchanged.")
+
+def test_production_profile():
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'prod.db')}"
+    writer, reader = create_engines(url, sqlite_profile="production")
+    assert writer is not reader
+    assert pool_status(writer)["size"] == 1 and pool_status(writer)["max_overflow"] == 0
+
+    with writer.begin() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        try:
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+            assert False, "reader connections must be read-only"
+        except OperationalError:
+            pass
+    print("✅ Production profile pragmas and writer/reader split verified.")
+
+if __name__ == "__main__":
+    test_default_profile_shares_engine()
+    test_production_profile()
@@ -0,0 +1,110 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import to_async_url
+from app.services import suggest_index, skill_aliases
+from app.api import employees
+from conftest import ADMIN, USER, seeded_db
+
+def _row(id, name, tech=(), location=None, clients=()):
+    return SimpleNamespace(id=id, name=name, emp_id=f"EMP{id:03d}", location=location, last_updated=None,
+                           tech=[{"tech": t} for t in tech], clients=[{"client_name": c} for c in clients])
+
+def test_prefix_completions_and_counts():
+    state = dict(skill_aliases._state)
+    skill_aliases._state["table"] = skill_aliases.SkillAliasTable(skill_aliases.DEFAULT_ALIASES)
+    index = suggest_index.SuggestIndex()
+    try:
+        index.build([
+            _row(1, "John Smith", ["Python", "k8s"], "Pune", ["Acme Corp"]),
+            _row(2, "Joanna Smythe", ["Python", "Java"], "Pune"),
+            _row(3, "Ravi Kumar", ["JavaScript"], "Mumbai", ["Acme Corp"]),
+        ])
+    finally:
+        skill_aliases._state.update(state)
+    assert index.suggest("jo", kinds=("name",)) == [
+        {"text": "Joanna Smythe", "kind": "name", "count": 1}, {"text": "John Smith", "kind": "name", "count": 1}]
+    # Word starts and case-insensitive matching
+    assert [s["text"] for s in index.suggest("SM", kinds=("name",))] == ["Joanna Smythe", "John Smith"]
+    assert [s["text"] for s in index.suggest("corp")] == ["Acme Corp"]
+    # Most frequent first; aliases are suggested under their canonical name
+    assert index.suggest("ja", kinds=("tech",)) == [
+        {"text": "Java", "kind": "tech", "count": 1}, {"text": "JavaScript", "kind": "tech", "count": 1}]
+    assert index.suggest("p")[0] == {"text": "Pune", "kind": "location", "count": 2}
+    assert index.suggest("kub") == [{"text": "Kubernetes", "kind": "tech", "count": 1}]
+    assert index.suggest("emp00", limit=2) == [
+        {"text": "EMP001", "kind": "emp_id", "count": 1}, {"text": "EMP002", "kind": "emp_id", "count": 1}]
+    assert index.suggest("zzz") == [] and index.suggest("  ") == []
+    print("✅ Prefix completions verified.")
+
+def test_incremental_writes():
+    index = suggest_index.SuggestIndex()
+    index.build([_row(1, "John Smith", ["Python"], "Pune"), _row(2, "Ravi Kumar", ["Python"], "Pune")])
+    assert index.suggest("py") == [{"text": "Python", "kind": "tech", "count": 2}]
+
+    index.upsert(_row(2, "Ravi Kumar", ["Rust"], "Delhi"))
+    assert index.suggest("py") == [{"text": "Python", "kind": "tech", "count": 1}]
+    assert [s["text"] for s in index.suggest("d")] == ["Delhi"]
+
+    index.upsert(_row(3, "Pyotr Ivanov", ["Python"]))
+    assert index.suggest("py") == [{"text": "Python", "kind": "tech", "count": 2},
+                                   {"text": "Pyotr Ivanov", "kind": "name", "count": 1}]
+    index.remove(1)
+    index.remove(3)
+    assert index.suggest("py") == [] and index.suggest("john") == []
+    assert len(index) == 1
+    print("✅ Incremental updates verified.")
+
+def test_matches_brute_force_over_seeded_profiles():
+    url, db = seeded_db()
+    index = suggest_index.SuggestIndex()
+    index.ensure_fresh(db)
+    rows = db.execute(select(*suggest_index.COLUMNS)).all()
+
+    for prefix in ("a", "sa", "py", "ba", "emp", "s"):
+        counts = {}
+        for row in rows:
+            for kind, text in suggest_index._terms(row):
+                if any(key.startswith(prefix) for key in suggest_index._trie_keys(kind, text)):
+                    counts[(kind, text)] = counts.get((kind, text), 0) + 1
+        expected = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0][1]))[:10]
+        got = index.suggest(prefix, limit=10)
+        assert [(s["count"], s["text"]) for s in got] == [(n, text) for (kind, text), n in expected], prefix
+    print("✅ Trie agrees with a brute-force scan.")
+
+def test_suggest_endpoint_hides_people_from_non_admins():
+    url, db = seeded_db(50)
+    original, original_sessions = suggest_index.index, employees.ReadSessionLocal
+    suggest_index.index = suggest_index.SuggestIndex()
+    # The index syncs through its own read session in the threadpool
+    employees.ReadSessionLocal = sessionmaker(bind=db.get_bind())
+
+    async def run(user):
+        async_engine = create_async_engine(to_async_url(url))
+        async with async_sessionmaker(async_engine)() as session:
+            results = await employees.suggest(prefix="a", limit=20, db=session, current_user=user)
+        await async_engine.dispose()
+        return results
+
+    try:
+        admin_kinds = {s["kind"] for s in asyncio.run(run(ADMIN))}
+        user_kinds = {s["kind"] for s in asyncio.run(run(USER))}
+    finally:
+        suggest_index.index, employees.ReadSessionLocal = original, original_sessions
+    assert "name" in admin_kinds
+    assert user_kinds and not user_kinds & set(suggest_index.PRIVATE_KINDS)
+    print("✅ Suggest endpoint verified.")
+
+if __name__ == "__main__":
+    test_prefix_completions_and_counts()
+    test_incremental_writes()
+    test_matches_brute_force_over_seeded_profiles()
+    test_suggest_endpoint_hides_people_from_non_admins()
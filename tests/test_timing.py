@@ -0,0 +1,60 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.services import timing
+
+def test_disabled_spans_are_noops():
+    timing.set_enabled(False)
+    timing.reset_histograms()
+    token = timing.start_request()
+    with timing.span("search.sql_filter"):
+        pass
+    assert timing.finish_request(token) == []
+    assert timing.histograms() == {}
+    # A caller-owned timings dict is filled even while timing is disabled
+    timings = {}
+    with timing.span("rank.fuse", timings):
+        pass
+    assert list(timings) == ["rank.fuse"] and timing.histograms() == {}
+    print("✅ Disabled timing records nothing.")
+
+def test_spans_feed_request_and_histograms():
+    timing.set_enabled(True)
+    timing.reset_histograms()
+    try:
+        token = timing.start_request()
+        with timing.span("search.scoring"):
+            pass
+        timing.record("llm.parse_jd", 3.0)
+        timing.record("llm.parse_jd", 2.0)
+        spans = timing.finish_request(token)
+    finally:
+        timing.set_enabled(False)
+
+    totals = timing.aggregate(spans)
+    assert list(totals) == ["search.scoring", "llm.parse_jd"]
+    assert totals["llm.parse_jd"] == 5.0
+    assert timing.server_timing_header({"llm.parse_jd": 5.0, "total": 12.345}) == "llm.parse_jd;dur=5.00, total;dur=12.35"
+
+    hist = timing.histograms()["llm.parse_jd"]
+    assert hist["count"] == 2 and hist["avg_ms"] == 2.5 and hist["max_ms"] == 3.0
+    assert hist["buckets"]["1"] == 0 and hist["buckets"]["2.5"] == 1 and hist["buckets"]["+Inf"] == 2
+    print("✅ Span aggregation and histograms verified.")
+
+def test_spans_outside_request_only_update_histograms():
+    timing.set_enabled(True)
+    timing.reset_histograms()
+    try:
+        with timing.span("worker.batch"):
+            pass
+    finally:
+        timing.set_enabled(False)
+    assert timing.histograms()["worker.batch"]["count"] == 1
+
+if __name__ == "__main__":
+    test_disabled_spans_are_noops()
+    test_spans_feed_request_and_histograms()
+    test_spans_outside_request_only_update_histograms()
@@ -0,0 +1,60 @@
+import sys
+import os
+from datetime import datetime
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.models import base  # Ensures all models are registered
+from app.models.employee import Employee
+from app.models.work_history import WorkHistory
+from app.services import tokenizer, ranking
+
+def _employee(**overrides):
+    fields = dict(id=1, emp_id="E1", name="Alice", email="a@x.com", tech=[{"tech": "Python"}],
+                  search_phrase="Backend developer", career_summary=None,
+                  clients=[{"description": "Payments platform"}], last_updated=datetime(2026, 1, 1))
+    fields.update(overrides)
+    emp = Employee(**fields)
+    emp.work_history = [WorkHistory(role="Engineer", project="Kafka pipeline", description=None)]
+    return emp
+
+def test_tokenize_drops_short_words_and_stopwords():
+    assert tokenizer.tokenize("We need a Python developer with AWS, Go and 5+ years") == \
+        {"python", "developer", "aws"}
+    assert tokenizer.tokenize("") == frozenset()
+    print("✅ Tokenizer verified.")
+
+def test_profile_tokens_follow_last_updated_and_phrase_stamp():
+    cache = tokenizer.ProfileTokenCache(max_size=2)
+    emp = _employee()
+    tokens = cache.get(emp)
+    assert {"python", "backend", "engineer", "kafka", "pipeline", "payments"} <= tokens
+    assert "none" not in tokens
+
+    # Same version: the cached set is returned even if the object changed underneath
+    emp.search_phrase = "Rust developer"
+    assert cache.get(emp) is tokens
+    # The search phrase worker only moves search_phrase_updated_at
+    emp.search_phrase_updated_at = datetime(2026, 1, 2)
+    assert "rust" in cache.get(emp)
+    emp.last_updated = datetime(2026, 1, 3)
+    emp.tech = [{"tech": "Scala"}]
+    assert "scala" in cache.get(emp)
+
+    cache.get(_employee(id=2))
+    cache.get(_employee(id=3))
+    assert len(cache) == 2
+    print("✅ Profile token cache verified.")
+
+def test_fallback_rank_ignores_stopwords_in_jd():
+    emp = _employee(id=None)
+    # python, kafka, payments, golang -> 3/4 once "looking", "with", "and" are dropped
+    ranked = ranking.regex_fallback_rank([emp], "Looking for Python with Kafka and Payments, Golang")
+    assert [e.match_score for e in ranked] == [75.0]
+    print("✅ Fallback stopwords verified.")
+
+if __name__ == "__main__":
+    test_tokenize_drops_short_words_and_stopwords()
+    test_profile_tokens_follow_last_updated_and_phrase_stamp()
+    test_fallback_rank_ignores_stopwords_in_jd()
@@ -0,0 +1,140 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.database import to_async_url
+from app.models.employee import Employee
+from app.services import trigram_index, filter_index
+from app.api import employees
+from conftest import ADMIN, USER, seeded_db
+
+def _row(id, name, tech=(), search_phrase=None):
+    return SimpleNamespace(id=id, name=name, tech=[{"tech": t} for t in tech], search_phrase=search_phrase,
+                           last_updated=None)
+
+def test_trigram_helpers():
+    # Same trigrams and similarity as pg_trgm: show_trgm('cat'), similarity('word', 'words')
+    assert trigram_index.trigrams("cat") == {"  c", " ca", "cat", "at "}
+    assert trigram_index.similarity("word", "words") == 4 / 7
+    assert trigram_index.within_distance("kubernets", "kubernetes", 1)
+    assert trigram_index.within_distance("lawnde", "lawande", 1)
+    assert not trigram_index.within_distance("java", "javascript", 2)
+    # Adjacent swaps are one edit
+    assert trigram_index.within_distance("pyhton", "python", 1) and not trigram_index.within_distance("pyhtno", "python", 1)
+    assert trigram_index.is_transposition("dokcer", "docker") and not trigram_index.is_transposition("rust", "rest")
+    assert trigram_index.max_edits("kubernets") == 2 and trigram_index.max_edits("go") == 1
+    print("✅ Trigram helpers verified.")
+
+def test_fuzzy_ranking():
+    index = trigram_index.TrigramIndex()
+    index.build([
+        _row(1, "Snehal Lawande", ["Python", "Kubernetes"]),
+        _row(2, "Snehal Patil", ["Java"], "Backend developer, Spring Boot"),
+        _row(3, "Rahul Lawande", ["Kubernetes", "Docker"]),
+    ])
+    assert [word for _, word in index.match_word("kubernets")] == ["kubernetes"]
+    # Swapped letters match although they share under 0.3 of their trigrams
+    assert [emp_id for emp_id, _ in index.search("pyhton")] == [1]
+    assert [emp_id for emp_id, _ in index.search("dokcer")] == [3]
+    # Every word must match; exact words outrank near misses
+    assert [emp_id for emp_id, _ in index.search("Snehal Lawnde")] == [1]
+    ranked = index.search("kubernets lawande")
+    assert [emp_id for emp_id, _ in ranked] == [1, 3] and ranked[0][1] < 1
+    assert [emp_id for emp_id, _ in index.search("snehal")] == [1, 2]
+    # The word being typed also matches as a prefix
+    assert [emp_id for emp_id, _ in index.search("spring boo")] == [2]
+    assert index.search("haskell") == [] and index.search("  ") == []
+    # allowed restricts to a filter_index bitset
+    assert [emp_id for emp_id, _ in index.search("lawande", allowed=1 << 3)] == [3]
+
+    # Long queries keep every similarity tier, not just the best few per word
+    tiers = trigram_index.TrigramIndex()
+    tiers.build([_row(n, "Asha Rao", ["Docker"], f"alpha bravo charlie {word}")
+                 for n, word in enumerate(["develop", "developer", "developers", "development", "developing"], 1)])
+    assert len({sim for sim, _ in tiers.match_word("develop", prefix=True)}) == 4
+    ranked = tiers.search("alpha bravo charlie develop")
+    assert sorted(emp_id for emp_id, _ in ranked) == [1, 2, 3, 4, 5] and ranked[0] == (1, 1.0)
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+    assert tiers.search("alpha bravo charlie develop", limit=2) == ranked[:2]
+
+    index.upsert(_row(2, "Snehal Patil", ["Kubernetes"]))
+    index.remove(3)
+    assert [emp_id for emp_id, _ in index.search("kubernetes")] == [1, 2]
+    assert index.search("docker") == [] and index.search("spring") == []
+    print("✅ Fuzzy ranking verified.")
+
+def _fuzzy_endpoint(url, db, query, current_user=ADMIN, facets=False, **filters):
+    """search_employees(fuzzy=True) against fresh indexes synced from db."""
+    originals = trigram_index.index, filter_index.index, employees.ReadSessionLocal
+    trigram_index.index, filter_index.index = trigram_index.TrigramIndex(), filter_index.FilterIndex()
+    # The indexes sync through their own read session in the threadpool
+    employees.ReadSessionLocal = sessionmaker(bind=db.get_bind())
+    params = {"name": None, "tech": None, "status": None, "bandwidth": None, "experience": None}
+    params.update(filters)
+
+    async def run():
+        async_engine = create_async_engine(to_async_url(url))
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+            results = await employees.search_employees(
+                query=query, jd=None, mode=None, fusion="rrf", w_keyword=None, w_skill=None, w_semantic=None,
+                skip=0, limit=50, facets=facets, fuzzy=True, db=session, current_user=current_user, **params)
+        await async_engine.dispose()
+        return results
+
+    try:
+        return asyncio.run(run())
+    finally:
+        trigram_index.index, filter_index.index, employees.ReadSessionLocal = originals
+
+def test_fuzzy_search_endpoint():
+    url, db = seeded_db(120)
+    target = db.get(Employee, 7)
+    first, last = target.name.split()[0], target.name.split()[-1]
+    typo = f"{first} {last[:-2]}{last[-1]}"  # drops one letter of the surname
+    results = _fuzzy_endpoint(url, db, typo)
+    assert target.id in [r.id for r in results]
+    assert all(r.name.split()[0] == first for r in results)
+    assert results[0].match_score > 50
+    print("✅ Fuzzy search endpoint verified.")
+
+def test_fuzzy_filters_apply_before_the_result_cap():
+    url, db = seeded_db(0)
+    count = trigram_index.FUZZY_MAX_RESULTS + 50
+    for n in range(count):
+        db.add(Employee(emp_id=f"F{n:05d}", name="Jordan Smith", email=f"jordan{n}@example.com",
+                        tech=[{"tech": "Java", "experience_years": 3, "level": "Advanced"}]))
+    # Only a fuzzy match, so it ranks below every exact "Jordan Smith"
+    db.add(Employee(emp_id="F99999", name="Jordan Smyth", email="user@x.com",
+                    tech=[{"tech": "Cobol", "experience_years": 3, "level": "Advanced"}]))
+    db.commit()
+    outlier = db.query(Employee).filter(Employee.emp_id == "F99999").one()
+
+    assert [r.id for r in _fuzzy_endpoint(url, db, "jordan smith", tech="cobol")] == [outlier.id]
+    assert [r.id for r in _fuzzy_endpoint(url, db, "jordan smith", name="smyth")] == [outlier.id]
+    # Non-admins only ever see their own profile
+    assert [r.id for r in _fuzzy_endpoint(url, db, "jordan smith", current_user=USER)] == [outlier.id]
+
+    # total and facets cover every match, not just the first FUZZY_MAX_RESULTS
+    for use_index in (True, False):
+        original = filter_index.FILTER_INDEX_ENABLED
+        filter_index.FILTER_INDEX_ENABLED = use_index
+        try:
+            response = _fuzzy_endpoint(url, db, "jordan smith", facets=True)
+        finally:
+            filter_index.FILTER_INDEX_ENABLED = original
+        assert len(response.results) == trigram_index.FUZZY_MAX_RESULTS
+        assert response.total == count + 1
+        assert sum(bucket.count for bucket in response.facets["status"]) == count + 1
+    print("✅ Fuzzy search filters apply before the result cap.")
+
+if __name__ == "__main__":
+    test_trigram_helpers()
+    test_fuzzy_ranking()
+    test_fuzzy_search_endpoint()
+    test_fuzzy_filters_apply_before_the_result_cap()